@@ -0,0 +1,255 @@
+"""Бенчмарк генераторів: rows/sec, wall time та peak RSS по сходинках розміру.
+
+Кожен (етап, розмір) виконується в окремому процесі, тож peak RSS (ru_maxrss) належить
+лише цьому етапу. Результати пишуться в JSON і порівнюються з baseline:
+регресія — падіння rows/sec або зростання peak RSS більше ніж на --threshold.
+
+    python benchmarks/bench_generators.py                      # 10k, 100k, 1M
+    python benchmarks/bench_generators.py --sizes 10000 --stages tabular_numpy csv_write
+    python benchmarks/bench_generators.py --update-baseline    # записати новий baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+SIZES = [10_000, 100_000, 1_000_000]
+SLOW_MAX_ROWS = 100_000
+WARMUP_ROWS = 1_000
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+RESULTS = Path(__file__).resolve().parent / "results" / "latest.json"
+CONFIG = {"generation": {"start_date": "2023-01-01", "end_date": "2024-12-31", "seed": 42}}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Етапи: setup(n) готує вхідні дані (поза заміром часу), run(n, data) — те, що міряємо
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _config(n: int, engine: str) -> dict:
+    return {"generation": {**CONFIG["generation"], "samples": n, "engine": engine}}
+
+
+def _customers(n: int):
+    from telco_synth import generate_tabular_data
+    return generate_tabular_data(_config(n, "numpy"))
+
+
+def _tabular(engine: str):
+    def run(n, _):
+        from telco_synth import generate_tabular_data
+        generate_tabular_data(_config(n, engine))
+    return run
+
+
+def _drift_dataset(engine: str):
+    def run(n, tmp):
+        from telco_synth import generate_telco_dataset_with_drift
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_telco_dataset_with_drift(n, output_file=str(Path(tmp) / "telco.csv"), engine=engine)
+    return run
+
+
+def _conversation_loop(n, df):
+    import random
+    from telco_synth import generate_conversation
+    rnd = random.Random(42)
+    for customer in df.sample(n, replace=True, random_state=42).to_dict("records"):
+        generate_conversation(customer, rnd)
+
+
+def _conversations_batched(n, df):
+    import numpy as np
+    from telco_synth import generate_conversations
+    generate_conversations(df, n, np.random.default_rng(42))
+
+
+def _write(fmt: str, compression: str = None):
+    def run(n, data):
+        from telco_synth import CUSTOMER_COLUMNS, ChunkWriter
+        df, tmp = data
+        with ChunkWriter(Path(tmp) / "telco_customers", CUSTOMER_COLUMNS, fmt, compression=compression) as writer:
+            writer.write(df)
+    return run
+
+
+def _usage_features(k: int):
+    def run(n, data):
+        from telco_synth import UsageFeatures, UsageWriter
+        df, tmp = data
+        features = UsageFeatures(k, CONFIG["generation"]["seed"])
+        with UsageWriter(tmp, features.columns) as writer:
+            writer.write(features.generate(df, 0))
+    return run
+
+
+def _tmpdir(n):
+    return tempfile.mkdtemp(prefix="bench-")
+
+
+def _customers_and_tmpdir(n):
+    return _customers(n), _tmpdir(n)
+
+
+# name: (setup, run, slow) — slow-етапи (рядковий Python-цикл) за замовчуванням
+# обмежені SLOW_MAX_ROWS рядками, щоб повний прогін тривав хвилини, а не години
+STAGES = {
+    "tabular_python":         (None, _tabular("python"), True),
+    "tabular_numpy":          (None, _tabular("numpy"), False),
+    "drift_dataset_python":   (_tmpdir, _drift_dataset("python"), True),
+    "drift_dataset_numpy":    (_tmpdir, _drift_dataset("numpy"), False),
+    "conversation_loop":      (_customers, _conversation_loop, True),
+    "conversations_batched":  (_customers, _conversations_batched, False),
+    "csv_write":              (_customers_and_tmpdir, _write("csv"), False),
+    "parquet_write":          (_customers_and_tmpdir, _write("parquet"), False),
+    "csv_gzip_write":         (_customers_and_tmpdir, _write("csv", "gzip"), False),
+    "csv_zstd_write":         (_customers_and_tmpdir, _write("csv", "zstd"), False),
+    "usage_features_256":     (_customers_and_tmpdir, _usage_features(256), False),
+}
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss: КБ на Linux, байти на macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 2**20 if sys.platform == "darwin" else rss / 2**10
+
+
+def _cleanup(data):
+    for item in (data if isinstance(data, tuple) else (data,)):
+        if isinstance(item, str):
+            shutil.rmtree(item, ignore_errors=True)
+
+
+def run_case(stage: str, n: int, repeat: int = 1) -> dict:
+    """Виконує один етап у поточному процесі; wall time — найкращий з repeat запусків."""
+    setup, run, _ = STAGES[stage]
+    # Прогрів на малому розмірі: ліниві імпорти та перші виклики pandas/pyarrow не входять у замір
+    warm = setup(WARMUP_ROWS) if setup else None
+    run(WARMUP_ROWS, warm)
+    _cleanup(warm)
+
+    data = setup(n) if setup else None
+    rss_before = _peak_rss_mb()
+    walls = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        run(n, data)
+        walls.append(time.perf_counter() - t0)
+    _cleanup(data)
+    wall = min(walls)
+    return {
+        "stage":            stage,
+        "rows":             n,
+        "wall_s":           round(wall, 4),
+        "rows_per_s":       round(n / wall, 1),
+        "peak_rss_mb":      round(_peak_rss_mb(), 1),
+        "setup_rss_mb":     round(rss_before, 1),
+    }
+
+
+def run_isolated(stage: str, n: int, repeat: int = 1) -> dict:
+    # Свіжий spawn-процес на кожен випадок: peak RSS не успадковується від попередніх етапів
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(run_case, stage, n, repeat).result()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Порівняння з baseline
+# ──────────────────────────────────────────────────────────────────────────────
+
+def compare(results: list, baseline: list, threshold: float) -> list:
+    """Регресії відносно baseline: (stage, rows, метрика, baseline, поточне значення)."""
+    base = {(r["stage"], r["rows"]): r for r in baseline}
+    regressions = []
+    for r in results:
+        b = base.get((r["stage"], r["rows"]))
+        if b is None:
+            continue
+        if r["rows_per_s"] < b["rows_per_s"] * (1 - threshold):
+            regressions.append((r["stage"], r["rows"], "rows_per_s", b["rows_per_s"], r["rows_per_s"]))
+        if r["peak_rss_mb"] > b["peak_rss_mb"] * (1 + threshold):
+            regressions.append((r["stage"], r["rows"], "peak_rss_mb", b["peak_rss_mb"], r["peak_rss_mb"]))
+    return regressions
+
+
+def environment() -> dict:
+    import numpy as np
+    import pandas as pd
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python":    platform.python_version(),
+        "numpy":     np.__version__,
+        "pandas":    pd.__version__,
+        "platform":  platform.platform(),
+        "cpus":      os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк генераторів (rows/sec, wall time, peak RSS)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES,
+                        help=f"Сходинки розміру в рядках (default: {' '.join(map(str, SIZES))})")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES),
+                        help="Етапи для заміру (default: усі)")
+    parser.add_argument("--slow-max-rows", type=int, default=SLOW_MAX_ROWS,
+                        help=f"Макс. розмір для повільних рядкових етапів (default: {SLOW_MAX_ROWS}; 0 — без ліміту)")
+    parser.add_argument("--repeat", type=int, default=1, help="Повтори кожного випадку, береться найкращий час")
+    parser.add_argument("--output", type=str, default=str(RESULTS), help="JSON з результатами")
+    parser.add_argument("--baseline", type=str, default=str(BASELINE), help="JSON baseline для порівняння")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="Допустиме погіршення rows/sec або peak RSS (частка, default: 0.20)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Записати результати як новий baseline замість порівняння")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'stage':<24}{'rows':>10}{'wall, s':>10}{'rows/s':>14}{'peak RSS, MB':>14}")
+    for stage in args.stages:
+        for n in args.sizes:
+            if STAGES[stage][2] and args.slow_max_rows and n > args.slow_max_rows:
+                continue
+            r = run_isolated(stage, n, args.repeat)
+            results.append(r)
+            print(f"{stage:<24}{n:>10,}{r['wall_s']:>10.2f}{r['rows_per_s']:>14,.0f}{r['peak_rss_mb']:>14.1f}")
+
+    report = {"environment": environment(), "results": results}
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nРезультати → {output}")
+
+    baseline = Path(args.baseline)
+    if args.update_baseline:
+        baseline.write_text(json.dumps(report, indent=2))
+        print(f"Baseline оновлено → {baseline}")
+        return
+    if not baseline.exists():
+        print(f"Baseline {baseline} відсутній — порівняння пропущено (див. --update-baseline)")
+        return
+
+    regressions = compare(results, json.loads(baseline.read_text())["results"], args.threshold)
+    if not regressions:
+        print(f"Регресій відносно baseline немає (поріг {args.threshold:.0%})")
+        return
+    print(f"\nРегресії відносно baseline (поріг {args.threshold:.0%}):")
+    for stage, n, metric, old, new in regressions:
+        print(f"  {stage} @ {n:,}: {metric} {old:,} → {new:,}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
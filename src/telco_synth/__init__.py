@@ -0,0 +1,69 @@
+"""telco_synth — синтетичний Telco Churn датасет з дрейфом, розмовами support і knowledge base.
+
+Імпорт пакета нічого не генерує, не засіває глобальні random / np.random і не тягне
+pandas / numpy / PyYAML: публічні імена підвантажують свій модуль при першому зверненні
+(PEP 562). Уся випадковість — у явних rng / seed аргументах функцій.
+
+    from telco_synth import generate_tabular_data, generate_conversations
+    df = generate_tabular_data({"generation": {"samples": 10_000, "seed": 7}}, engine="numpy")
+"""
+from importlib import import_module
+
+# Публічне ім'я → підмодуль
+_EXPORTS = {
+    "load_config":                        "tabular",
+    "generate_tabular_data":              "tabular",
+    "generate_tabular_numpy":             "tabular",
+    "iter_tabular_chunks":                "tabular",
+    "day_counts":                         "tabular",
+    "shard_seed":                         "tabular",
+    "ENGINES":                            "tabular",
+    "DEFAULT_SHARD_SIZE":                 "tabular",
+    "REFERENCE_DATE":                     "tabular",
+    "iter_panel":                         "panel",
+    "panel_settings":                     "panel",
+    "generate_conversation":              "conversations",
+    "generate_conversations":             "conversations",
+    "COMPLAINT_TEMPLATES":                "conversations",
+    "RESOLUTION_TEMPLATES":               "conversations",
+    "write_chunks":                       "pipeline",
+    "churn_counts_by_year":               "pipeline",
+    "churn_rate_table":                   "pipeline",
+    "generate_knowledge_base":            "pipeline",
+    "generate_telco_dataset_with_drift":  "base",
+    "CUSTOMER_COLUMNS":                   "schema",
+    "CONVERSATION_COLUMNS":               "schema",
+    "to_compact":                         "schema",
+    "ChunkWriter":                        "writers",
+    "customer_ids":                       "ids",
+    "DriftSchedule":                      "drift",
+    "DriftProfile":                       "drift_stats",
+    "KBLinker":                           "knowledge_base",
+    "KBIndex":                            "knowledge_base",
+    "build_documents":                    "knowledge_base",
+    "CustomerIndex":                      "customer_index",
+    "build_customer_index":               "customer_index",
+    "UsageFeatures":                      "usage",
+    "UsageWriter":                        "usage",
+    "load_usage":                         "usage",
+    "iter_sweep":                         "sweep",
+    "sweep_scenarios":                    "sweep",
+    "CommonDraws":                        "sweep",
+    "ArtifactCache":                      "cache",
+    "RunMetrics":                         "metrics",
+    "main":                               "cli",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value          # наступні звернення — без __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
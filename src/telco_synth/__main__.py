@@ -0,0 +1,4 @@
+# python -m telco_synth [serve] ... — те саме, що src/generate_dataset_ext.py
+from .cli import main
+
+main()
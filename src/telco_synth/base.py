@@ -0,0 +1,31 @@
+def generate_telco_dataset_with_drift(
+    n_samples: int = 50000,
+    start_date: str = "2023-01-01",
+    end_date: str = "2024-12-31",
+    output_file: str = "synthetic_telco_churn_with_drift.csv",
+    engine: str = "python",
+    seed: int = 42,
+    chunk_size: int = None,
+    workers: int = 1,
+    fmt: str = "csv",
+    partition_by_month: bool = False
+):
+    # Потоковий режим: чанки (шарди з власним seed, chunk_size або DEFAULT_SHARD_SIZE рядків) дописуються
+    # у файл по порядку, пам'ять обмежена розміром чанку; результат не залежить від кількості workers
+    from .pipeline import churn_counts_by_year, churn_rate_table
+    from .schema import CUSTOMER_COLUMNS
+    from .tabular import DEFAULT_SHARD_SIZE, iter_tabular_chunks
+    from .writers import ChunkWriter
+    config = {"generation": {"samples": n_samples, "start_date": start_date,
+                             "end_date": end_date, "seed": seed}}
+    churn_counts = None
+    with ChunkWriter(output_file, CUSTOMER_COLUMNS, fmt, partition_by_month) as writer:
+        for chunk in iter_tabular_chunks(config, chunk_size or DEFAULT_SHARD_SIZE, engine=engine, workers=workers):
+            writer.write(chunk)
+            counts = churn_counts_by_year(chunk)
+            churn_counts = counts if churn_counts is None else churn_counts.add(counts, fill_value=0)
+
+    print(f"Готово! Згенеровано {n_samples:,} записів з дрейфом за 2023–2024")
+    print(f"Файл: {writer.path}")
+    print("\nРозподіл Churn по роках:")
+    print(churn_rate_table(churn_counts))
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Кеш артефактів: ключ = хеш ефективної конфігурації + seed + версії генератора
+# ──────────────────────────────────────────────────────────────────────────────
+#
+# Запис кешу — директорія <cache_dir>/<key>/ з артефактами запуску та manifest.json.
+# Великі артефакти (клієнти, розмови) з кешу в output_dir та назад хардлінкуються
+# (копіюються, якщо хардлінк неможливий, напр. інший диск); дрібні (knowledge base,
+# стан генерації) завжди копіюються, бо перезаписуються на місці.
+
+DEFAULT_CACHE_DIR = "data/.cache"
+DEFAULT_MAX_SIZE_MB = 2048
+MANIFEST = "manifest.json"
+
+# Модулі, від коду яких залежать згенеровані дані: їхній хеш — "версія генератора"
+GENERATOR_SOURCES = ("tabular.py", "panel.py", "conversations.py", "pipeline.py", "schema.py", "writers.py",
+                     "ids.py", "drift.py", "drift_stats.py", "knowledge_base.py", "customer_index.py",
+                     "usage.py")
+
+
+def generator_version() -> str:
+    digest = hashlib.sha256()
+    for name in GENERATOR_SOURCES:
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def cache_key(settings: dict) -> str:
+    """Ключ кешу: sha256 від ефективних налаштувань (вже злитих CLI > config.yaml > дефолт)."""
+    payload = json.dumps({"settings": settings, "version": generator_version()}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _size(path: Path) -> int:
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return path.stat().st_size
+
+
+def _remove(path: Path):
+    if path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        path.unlink()
+
+
+def _link(src: str, dst: str):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _place(src: Path, dst: Path, link: bool):
+    _remove(dst)
+    if src.is_dir():
+        shutil.copytree(src, dst, copy_function=_link if link else shutil.copy2)
+    elif link:
+        _link(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+
+class ArtifactCache:
+    """Кеш наборів артефактів генерації з LRU-витісненням за сумарним розміром."""
+
+    def __init__(self, cache_dir: str | Path = DEFAULT_CACHE_DIR, max_size_mb: float = DEFAULT_MAX_SIZE_MB):
+        self.dir = Path(cache_dir)
+        self.max_bytes = int(max_size_mb * 2**20)
+
+    def _entry(self, key: str) -> Path:
+        return self.dir / key
+
+    def restore(self, key: str, output_dir: str | Path) -> dict | None:
+        """Відновлює артефакти запису key в output_dir; None, якщо запису немає."""
+        entry = self._entry(key)
+        manifest_path = entry / MANIFEST
+        if not manifest_path.exists():
+            return None
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for name, link in manifest["artifacts"].items():
+            _place(entry / name, output_dir / name, link)
+        os.utime(manifest_path)         # час останнього використання для LRU
+        return manifest
+
+    def store(self, key: str, output_dir: str | Path, artifacts: dict, settings: dict) -> dict:
+        """Кладе артефакти з output_dir у кеш під key; artifacts: {ім'я: хардлінкувати?}."""
+        output_dir = Path(output_dir)
+        entry, tmp = self._entry(key), self.dir / f".{key}.tmp"
+        _remove(tmp)
+        tmp.mkdir(parents=True)
+        for name, link in artifacts.items():
+            _place(output_dir / name, tmp / name, link)
+        manifest = {
+            "key":       key,
+            "version":   generator_version(),
+            "settings":  settings,
+            "artifacts": artifacts,
+            "bytes":     sum(_size(tmp / name) for name in artifacts),
+            "created":   time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        (tmp / MANIFEST).write_text(json.dumps(manifest, ensure_ascii=False, indent=2, default=str),
+                                    encoding="utf-8")
+        # Запис з'являється атомарно: перерваний store не лишає напівзаповнений кеш
+        _remove(entry)
+        tmp.rename(entry)
+        self.evict(keep=key)
+        return manifest
+
+    def entries(self) -> list:
+        """[(останнє використання, байти, директорія)] для повних записів, від найстаріших."""
+        found = []
+        for manifest_path in self.dir.glob(f"*/{MANIFEST}"):
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            found.append((manifest_path.stat().st_mtime, manifest["bytes"], manifest_path.parent))
+        return sorted(found)
+
+    def evict(self, keep: str = None) -> list:
+        """Видаляє найдавніше використані записи, доки сумарний розмір > max_bytes."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = []
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry)
+            total -= size
+            removed.append(entry.name)
+        return removed
@@ -0,0 +1,126 @@
+import argparse
+import sys
+
+from .cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_SIZE_MB
+from .metrics import PROFILERS
+from .pipeline import DEFAULT_WRITER_QUEUE, DRIFT_PROFILE, DRIFT_PROFILE_FORMATS, STAGES, STATE_FILE, run
+from .sweep import SWEEP_DIR, SWEEP_MANIFEST
+from .tabular import ENGINES, REFERENCE_DATE
+from .usage import USAGE_FILE, USAGE_FORMATS
+from .writers import COMPRESSIONS, FORMATS
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Тонкий CLI: лише розбір аргументів; уся генерація — у pipeline / tabular / conversations.
+# Точки входу: python -m telco_synth, src/generate_dataset_ext.py, src/generate_dataset.py
+# ──────────────────────────────────────────────────────────────────────────────
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Генерація розширеного Telco датасету: churn + support conversations + knowledge base")
+    parser.add_argument("--config", type=str, default="config/config.yaml",
+                        help="Шлях до config.yaml (опціонально)")
+    parser.add_argument("--samples", type=int, help="Кількість клієнтів (перевизначення)")
+    parser.add_argument("--conv-samples", type=int, help="Кількість розмов support (перевизначення)")
+    parser.add_argument("--output-dir", type=str, default="data",
+                        help="Директорія для збереження файлів")
+    parser.add_argument("--engine", choices=ENGINES,
+                        help="Рушій генерації табличних даних: python (цикл) або numpy (векторний)")
+    parser.add_argument("--chunk-size", type=int,
+                        help="Потокова генерація чанками по N рядків з дозаписом у файли (обмежена пам'ять)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Кількість процесів для генерації шардів (результат не залежить від N)")
+    parser.add_argument("--format", choices=FORMATS, default="csv",
+                        help="Формат клієнтів та розмов: csv, parquet або arrow (словникові категорії, компактні типи)")
+    parser.add_argument("--partition-by-month", action="store_true",
+                        help="Партиціювати parquet/arrow за місяцем RecordDate (RecordMonth=YYYY-MM/)")
+    parser.add_argument("--compression", choices=("none",) + COMPRESSIONS,
+                        help="Стиснення артефактів: CSV → .csv.gz/.csv.zst (блоки в кількох потоках), "
+                             "parquet — кодек колонок, arrow — zstd (default: generation.compression або без)")
+    parser.add_argument("--writer-queue", type=int, metavar="N",
+                        help=f"Чанків у черзі фонового запису; 0 — писати в основному потоці "
+                             f"(default: generation.writer_queue або {DEFAULT_WRITER_QUEUE})")
+    parser.add_argument("--reference-date", type=str,
+                        help=f"Фіксована дата YYYY-MM-DD для дат у текстах розмов (default: {REFERENCE_DATE})")
+    parser.add_argument("--compact", action="store_true",
+                        help="Компактна схема в пам'яті: Categorical, int8/int16, float32, datetime64 RecordDate")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="Показати пам'ять DataFrame клієнтів по колонках")
+    parser.add_argument("--append-from", type=str, metavar="DIR",
+                        help=f"Дописати нові дні до датасету в DIR (потрібен {STATE_FILE} попереднього запуску)")
+    parser.add_argument("--until", type=str, metavar="YYYY-MM-DD",
+                        help="Остання дата для --append-from (дрейф продовжується після end_date)")
+    parser.add_argument("--metrics-out", type=str, metavar="PATH",
+                        help="Записати метрики по етапах (wall/CPU time, рядки, байти, peak RSS) у JSON")
+    parser.add_argument("--profile", nargs="?", const="tabular", choices=STAGES,
+                        help="Профілювати етап (default: tabular) і показати підсумок по етапах")
+    parser.add_argument("--profiler", choices=PROFILERS, default="cprofile",
+                        help="Профайлер для --profile: cprofile (.prof) або pyinstrument (.html)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Генерувати заново, не читаючи й не поповнюючи кеш артефактів")
+    parser.add_argument("--cache-dir", type=str,
+                        help=f"Директорія кешу артефактів (default: cache.dir у config або {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--cache-max-mb", type=float,
+                        help=f"Ліміт розміру кешу в МБ, далі LRU-витіснення (default: {DEFAULT_MAX_SIZE_MB})")
+    parser.add_argument("--drift-profile", choices=DRIFT_PROFILE_FORMATS, default="json",
+                        help=f"Формат профілю дрейфу {DRIFT_PROFILE}.* (частоти, гістограми, PSI/JS по місяцях)")
+    parser.add_argument("--kb-docs", type=int, metavar="N",
+                        help="Синтезувати N документів knowledge base з шаблонів тем (default: knowledge_base.synthetic_documents)")
+    parser.add_argument("--customer-index", action="store_true",
+                        help="Індекс customerID → рядок поруч з клієнтами (telco_customers.*.idx/, customer_index.CustomerIndex)")
+    parser.add_argument("--panel", action="store_true",
+                        help="Лонгітюдна панель: ті самі клієнти щомісяця (telco_panel, без розмов і KB)")
+    parser.add_argument("--months", type=int,
+                        help="Кількість місяців панелі (default: panel.months у config або весь період)")
+    parser.add_argument("--usage-features", type=int, metavar="K",
+                        help=f"K числових ознак користування на клієнта → {USAGE_FILE}.npy/.arrow "
+                             "(default: usage.features у config, 0 — вимкнено)")
+    parser.add_argument("--usage-format", choices=USAGE_FORMATS,
+                        help="Формат ознак користування: npy (np.load mmap) або arrow (default: usage.format)")
+    parser.add_argument("--sweep", action="store_true",
+                        help=f"Сценарії дрейфу на спільних випадкових числах → {SWEEP_DIR}/<сценарій>/ + {SWEEP_MANIFEST} "
+                             "(сценарії — секція sweep у config)")
+    parser.add_argument("--sweep-param", action="append", metavar="NAME=V1,V2",
+                        help="Значення параметра drift для сітки sweep (повторюваний; замінює sweep у config)")
+    return parser
+
+
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["serve"]:
+        # python generate_dataset_ext.py serve --rate 20000/s — потік NDJSON/SSE замість файлів
+        from .serve import main as serve_main
+        return serve_main(argv[1:])
+    return run(build_parser().parse_args(argv))
+
+
+def base_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Generate synthetic Telco Churn dataset with drift")
+    parser.add_argument("--samples", type=int, default=100000, help="Number of samples (default: 100000)")
+    parser.add_argument("--output", type=str, default="data/telco_churn_full.csv", help="Output CSV path")
+    parser.add_argument("--engine", choices=ENGINES, default="python",
+                        help="Generation engine: python (row loop) or numpy (vectorized)")
+    parser.add_argument("--chunk-size", type=int,
+                        help="Stream generation in chunks of N rows appended to the output (bounded memory)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of processes generating shards (output does not depend on N)")
+    parser.add_argument("--format", choices=["csv", "parquet", "arrow"], default="csv",
+                        help="Output format (parquet/arrow use dictionary-encoded categories and compact dtypes)")
+    parser.add_argument("--partition-by-month", action="store_true",
+                        help="Partition parquet/arrow output by RecordDate year-month (RecordMonth=YYYY-MM/)")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for all engines (default: 42)")
+    return parser
+
+
+def base_main(argv: list = None):
+    """CLI базового генератора (src/generate_dataset.py): лише таблиця клієнтів з дрейфом."""
+    from .base import generate_telco_dataset_with_drift
+    args = base_parser().parse_args(argv)
+    generate_telco_dataset_with_drift(
+        n_samples=args.samples,
+        output_file=args.output,
+        engine=args.engine,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        fmt=args.format,
+        partition_by_month=args.partition_by_month
+    )
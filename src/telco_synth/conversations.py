@@ -0,0 +1,312 @@
+import random
+import string
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from .knowledge_base import KBLinker
+from .schema import CONVERSATION_COLUMNS
+from .tabular import REFERENCE_DATE, _labels
+
+# ──────────────────────────────────────────────────────────────────────────────
+# COMPLAINT_TEMPLATES та RESOLUTION_TEMPLATES (повністю відновлені)
+# ──────────────────────────────────────────────────────────────────────────────
+
+COMPLAINT_TEMPLATES = {
+    "billing_high": [
+        "My bill is too high this month. I was charged ${amount} but my usual is around ${normal}. Can you explain?",
+        "I'm shocked by my ${amount} bill! This is way more than my typical ${normal}. What happened?",
+        "Why am I being charged ${amount}? My contract says ${normal}/month. Please fix this immediately.",
+        "I noticed an unexpected increase in my bill to ${amount}. Last month it was ${normal}. What's the reason?",
+    ],
+    "service_slow": [
+        "My internet has been incredibly slow for the past {days} days. I'm paying for {speed} but getting terrible speeds.",
+        "The {service} service keeps buffering. This is unacceptable for what I'm paying.",
+        "I can't work from home because the internet is so slow. When will this be fixed?",
+        "Download/upload speeds are way below what I'm paying for. Can you check my line?",
+    ],
+    "service_outage": [
+        "My {service} has been down since {time}. I need this fixed ASAP as I work from home.",
+        "Complete service outage for {hours} hours now. No internet, no phone. What's going on?",
+        "Still no {service} after {days} days! I'm paying for a service I'm not receiving.",
+        "Internet is completely out in my area — is there an outage?",
+    ],
+    "contract_confusion": [
+        "I thought I signed up for a {contract} contract, but my bill says {actual_contract}. Please clarify.",
+        "I want to cancel but you're saying I have a contract until {date}. I was told it was month-to-month!",
+        "Your sales rep promised me {feature} with my {contract} plan but I don't see it on my account.",
+        "The contract terms on my account don't match what I agreed to. Can you review?",
+    ],
+    "want_to_cancel": [
+        "I want to cancel my service. It's too expensive and I found a better deal elsewhere.",
+        "Please cancel my account. I'm moving to a competitor who offers {feature} for less money.",
+        "I've been a customer for {tenure} months but the service quality has declined. I'm leaving.",
+        "I'm not satisfied anymore — please process my cancellation request.",
+    ]
+}
+
+RESOLUTION_TEMPLATES = {
+    "billing_high": [
+        "I apologize for the billing confusion. I see there was a one-time charge for {reason}. I've applied a ${credit} credit to your account.",
+        "You're right, that charge was incorrect. I've adjusted your bill back to ${normal} and credited the difference.",
+        "Let me explain: the extra ${diff} was for {reason}. I can waive this charge as a one-time courtesy.",
+        "I've reviewed your account and removed the unauthorized fee of ${diff}. Your next bill will reflect the correction.",
+    ],
+    "service_slow": [
+        "I'm sorry about the speed issues. I've scheduled a technician visit for {date}. In the meantime, try resetting your router.",
+        "I see there's network congestion in your area. We're upgrading infrastructure. I've applied a ${credit} credit for the inconvenience.",
+        "I've run diagnostics and found an issue with your modem. We'll ship a new one overnight at no charge.",
+        "Your line has been reprovisioned. Speeds should improve within the next 2 hours. I've credited ${credit}.",
+    ],
+    "service_outage": [
+        "There's a known outage in your area due to {reason}. Estimated restoration time is {time}. I've credited your account for the downtime.",
+        "I apologize for the disruption. The issue has been identified and our team is working on it. ETA: {time}.",
+        "The outage was caused by {reason}. Service is now restored. I've applied a ${credit} credit to your next bill.",
+        "Outage resolved — fiber splice repaired. Thank you for your patience. Credit of ${credit} applied.",
+    ],
+    "contract_confusion": [
+        "I see the confusion. Your contract is actually {contract_type}. I've updated your account notes and confirmed your terms.",
+        "You're correct - there was an error in how your contract was entered. I've corrected it to {contract_type} as agreed.",
+        "I apologize for the miscommunication. Let me clarify your current contract terms: {details}.",
+        "I've adjusted your plan to match the original agreement. No early termination fee will apply.",
+    ],
+    "want_to_cancel": [
+        "I'm sorry to hear you want to leave. Before you go, let me offer you {offer} to stay. Would that work for you?",
+        "I understand your frustration. I can offer you a special retention discount: {discount}% off for the next {months} months.",
+        "I'd hate to see you go after {tenure} months. How about we upgrade you to our {plan} plan at your current price?",
+        "As a valued customer, I'd like to offer you one free month + {discount}% off for 12 months if you stay.",
+    ]
+}
+
+
+def generate_conversation(customer: dict, rnd: random.Random = None, reference_date: str = REFERENCE_DATE) -> dict:
+    # rnd — явний random.Random; без нього — новий незасіяний генератор (глобальний random не чіпається)
+    rnd = rnd if rnd is not None else random.Random()
+    now = datetime.strptime(reference_date, "%Y-%m-%d")
+    issue_type = rnd.choice(list(COMPLAINT_TEMPLATES.keys()))
+    complaint_template = rnd.choice(COMPLAINT_TEMPLATES[issue_type])
+
+    if issue_type == "billing_high":
+        normal = round(customer['MonthlyCharges'] * rnd.uniform(0.7, 0.85), 2)
+        complaint = complaint_template.format(
+            amount=customer['MonthlyCharges'],
+            normal=normal
+        )
+    elif issue_type == "service_slow":
+        speed_label = "fiber optic speeds" if customer['InternetService'] == "Fiber optic" else "DSL speeds"
+        complaint = complaint_template.format(
+            days=rnd.randint(2, 14),
+            speed=speed_label,
+            service=customer['InternetService'].lower()
+        )
+    elif issue_type == "service_outage":
+        complaint = complaint_template.format(
+            service=customer['InternetService'],
+            time=rnd.choice(["this morning", "yesterday morning", "last night", "2 days ago"]),
+            hours=rnd.randint(4, 72),
+            days=rnd.randint(1, 7)
+        )
+    elif issue_type == "contract_confusion":
+        complaint = complaint_template.format(
+            contract=customer['Contract'].lower(),
+            actual_contract=rnd.choice(["Month-to-month", "One year", "Two year"]),
+            date=(now + timedelta(days=rnd.randint(30, 730))).strftime("%B %d, %Y"),
+            feature=rnd.choice(["free installation", "premium tech support", "streaming bundle"])
+        )
+    elif issue_type == "want_to_cancel":
+        complaint = complaint_template.format(
+            tenure=customer['tenure'],
+            feature=rnd.choice(["faster internet", "better support", "lower monthly price"])
+        )
+    else:
+        complaint = complaint_template
+
+    # Resolution
+    resolution_template = rnd.choice(RESOLUTION_TEMPLATES[issue_type])
+    if issue_type == "billing_high":
+        diff = round(customer['MonthlyCharges'] * rnd.uniform(0.15, 0.35), 2)
+        resolution = resolution_template.format(
+            reason=rnd.choice(["late fee", "equipment rental", "one-time upgrade charge"]),
+            credit=diff,
+            normal=round(customer['MonthlyCharges'] - diff, 2),
+            diff=diff
+        )
+    elif issue_type == "service_slow":
+        resolution = resolution_template.format(
+            date=(now + timedelta(days=rnd.randint(1, 7))).strftime("%B %d"),
+            credit=rnd.choice([10, 15, 20, 25, 30])
+        )
+    elif issue_type == "service_outage":
+        resolution = resolution_template.format(
+            reason=rnd.choice(["fiber line damage", "power outage in the area", "equipment failure", "scheduled upgrade"]),
+            time=rnd.choice(["within 4 hours", "by end of day", "within 24 hours", "by tomorrow morning"]),
+            credit=rnd.choice([15, 20, 25, 30, 50])
+        )
+    elif issue_type == "contract_confusion":
+        resolution = resolution_template.format(
+            contract_type=customer['Contract'],
+            details=f"{customer['Contract']} with auto-renewal, cancel anytime after term with 30 days notice"
+        )
+    elif issue_type == "want_to_cancel":
+        resolution = resolution_template.format(
+            offer=rnd.choice(["15% discount for 12 months", "free upgrade to Fiber", "one month free"]),
+            discount=rnd.choice([10, 15, 20, 25]),
+            months=rnd.choice([6, 12]),
+            tenure=customer['tenure'],
+            plan="Premium Fiber 1 Gbps"
+        )
+    else:
+        resolution = resolution_template
+
+    return {
+        "customerID": customer["customerID"],
+        "issue_type": issue_type,
+        "complaint": complaint,
+        "resolution": resolution,
+        "RecordDate": customer["RecordDate"]
+    }
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Батчева генерація розмов
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _choice(rng: np.random.Generator, options: list, n: int) -> np.ndarray:
+    # варіанти одразу як рядки — у шаблонах вони лише підставляються в текст
+    return _labels(*map(str, options))[rng.integers(0, len(options), n)]
+
+
+def _date_offsets(rng: np.random.Generator, reference_date: str, low: int, high: int, n: int,
+                  fmt: str) -> np.ndarray:
+    # reference_date + randint(low, high) днів; strftime лише для (high - low + 1) унікальних дат
+    ref = datetime.strptime(reference_date, "%Y-%m-%d")
+    labels = _labels(*[(ref + timedelta(days=d)).strftime(fmt) for d in range(low, high + 1)])
+    return labels[rng.integers(0, high - low + 1, n)]
+
+
+def _lower(values: np.ndarray) -> np.ndarray:
+    # str.lower лише для унікальних значень
+    codes, uniques = pd.factorize(values)
+    return np.array([v.lower() for v in uniques], dtype=object)[codes]
+
+
+def _as_text(values) -> np.ndarray:
+    values = np.asarray(values)
+    if values.dtype == object:
+        return values
+    return values.astype(str).astype(object)
+
+
+_FORMATTER = string.Formatter()
+
+
+def _render_bulk(template: str, fields: dict, n: int) -> np.ndarray:
+    """str.format для n рядків: шаблон розбирається один раз, далі конкатенація object-масивів."""
+    out = np.full(n, "", dtype=object)
+    for literal, field, _, _ in _FORMATTER.parse(template):
+        if literal:
+            out = out + literal
+        if field is not None:
+            out = out + _as_text(fields[field])
+    return out
+
+
+def _render(templates: list, template_idx: np.ndarray, fields: dict) -> np.ndarray:
+    out = np.empty(len(template_idx), dtype=object)
+    for t, template in enumerate(templates):
+        mask = template_idx == t
+        if mask.any():
+            out[mask] = _render_bulk(template, {k: v[mask] for k, v in fields.items()}, int(mask.sum()))
+    return out
+
+
+def _conversation_fields(issue_type: str, c: dict, rng: np.random.Generator,
+                         reference_date: str) -> tuple[dict, dict]:
+    """Параметри шаблонів скарги та відповіді (як у generate_conversation) масивами для рядків одного issue_type."""
+    n = len(c["customerID"])
+    if issue_type == "billing_high":
+        diff = np.round(c["MonthlyCharges"] * rng.uniform(0.15, 0.35, n), 2)
+        complaint = {"amount": c["MonthlyCharges"],
+                     "normal": np.round(c["MonthlyCharges"] * rng.uniform(0.7, 0.85, n), 2)}
+        resolution = {"reason": _choice(rng, ["late fee", "equipment rental", "one-time upgrade charge"], n),
+                      "credit": diff, "normal": np.round(c["MonthlyCharges"] - diff, 2), "diff": diff}
+    elif issue_type == "service_slow":
+        complaint = {"days": rng.integers(2, 15, n),
+                     "speed": np.where(c["InternetService"] == "Fiber optic", "fiber optic speeds", "DSL speeds"),
+                     "service": _lower(c["InternetService"])}
+        resolution = {"date": _date_offsets(rng, reference_date, 1, 7, n, "%B %d"),
+                      "credit": _choice(rng, [10, 15, 20, 25, 30], n)}
+    elif issue_type == "service_outage":
+        complaint = {"service": c["InternetService"],
+                     "time": _choice(rng, ["this morning", "yesterday morning", "last night", "2 days ago"], n),
+                     "hours": rng.integers(4, 73, n),
+                     "days": rng.integers(1, 8, n)}
+        resolution = {"reason": _choice(rng, ["fiber line damage", "power outage in the area",
+                                              "equipment failure", "scheduled upgrade"], n),
+                      "time": _choice(rng, ["within 4 hours", "by end of day", "within 24 hours",
+                                            "by tomorrow morning"], n),
+                      "credit": _choice(rng, [15, 20, 25, 30, 50], n)}
+    elif issue_type == "contract_confusion":
+        complaint = {"contract": _lower(c["Contract"]),
+                     "actual_contract": _choice(rng, ["Month-to-month", "One year", "Two year"], n),
+                     "date": _date_offsets(rng, reference_date, 30, 730, n, "%B %d, %Y"),
+                     "feature": _choice(rng, ["free installation", "premium tech support", "streaming bundle"], n)}
+        resolution = {"contract_type": c["Contract"],
+                      "details": _as_text(c["Contract"]) + " with auto-renewal, cancel anytime after term with 30 days notice"}
+    else:  # want_to_cancel
+        complaint = {"tenure": c["tenure"],
+                     "feature": _choice(rng, ["faster internet", "better support", "lower monthly price"], n)}
+        resolution = {"offer": _choice(rng, ["15% discount for 12 months", "free upgrade to Fiber", "one month free"], n),
+                      "discount": _choice(rng, [10, 15, 20, 25], n),
+                      "months": _choice(rng, [6, 12], n),
+                      "tenure": c["tenure"],
+                      "plan": np.full(n, "Premium Fiber 1 Gbps", dtype=object)}
+    return complaint, resolution
+
+
+def generate_conversations(df_customers: pd.DataFrame, n: int, rng: np.random.Generator = None,
+                           reference_date: str = REFERENCE_DATE, linker: KBLinker = None) -> pd.DataFrame:
+    """Батчевий аналог generate_conversation для n клієнтів, вибраних з df_customers з поверненням.
+
+    issue_type та індекси шаблонів призначаються масивами, а кожна група (issue_type, шаблон)
+    рендериться разом. Дати у текстах рахуються від фіксованої reference_date, а не від now(),
+    тож результат відтворюваний для заданого rng. linker додає kb_doc_ids — ID документів
+    knowledge base теми issue_type ("id;id;id"; порожньо без linker).
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    rows = rng.integers(0, len(df_customers), n)
+    c = {
+        "customerID": _as_text(df_customers["customerID"].to_numpy()[rows]),
+        "MonthlyCharges": np.round(df_customers["MonthlyCharges"].to_numpy(np.float64)[rows], 2),
+        "InternetService": _as_text(df_customers["InternetService"].to_numpy(object)[rows]),
+        "Contract": _as_text(df_customers["Contract"].to_numpy(object)[rows]),
+        "tenure": df_customers["tenure"].to_numpy(np.int64)[rows],
+    }
+    issue_types = list(COMPLAINT_TEMPLATES)
+    issue = rng.integers(0, len(issue_types), n)
+
+    complaint = np.empty(n, dtype=object)
+    resolution = np.empty(n, dtype=object)
+    for i, issue_type in enumerate(issue_types):
+        mask = issue == i
+        if not mask.any():
+            continue
+        m = int(mask.sum())
+        complaint_templates, resolution_templates = COMPLAINT_TEMPLATES[issue_type], RESOLUTION_TEMPLATES[issue_type]
+        complaint_idx = rng.integers(0, len(complaint_templates), m)
+        resolution_idx = rng.integers(0, len(resolution_templates), m)
+        group = {k: v[mask] for k, v in c.items()}
+        complaint_fields, resolution_fields = _conversation_fields(issue_type, group, rng, reference_date)
+        complaint[mask] = _render(complaint_templates, complaint_idx, complaint_fields)
+        resolution[mask] = _render(resolution_templates, resolution_idx, resolution_fields)
+
+    issue_type = np.asarray(issue_types, dtype=object)[issue]
+    return pd.DataFrame({
+        "customerID": c["customerID"],
+        "issue_type": issue_type,
+        "complaint": complaint,
+        "resolution": resolution,
+        "kb_doc_ids": linker.link(issue_type, rng) if linker is not None else np.full(n, "", dtype=object),
+        "RecordDate": df_customers["RecordDate"].to_numpy()[rows],
+    }, columns=CONVERSATION_COLUMNS)
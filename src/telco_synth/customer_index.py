@@ -0,0 +1,232 @@
+import io
+import json
+import mmap
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .ids import decode, is_valid
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Індекс customerID → позиція рядка в артефакті клієнтів (CSV / Parquet / Arrow, партиції)
+# ──────────────────────────────────────────────────────────────────────────────
+#
+# <артефакт>.idx/
+#   keys.npy     uint64[n]: ids.decode(customerID), відсортовані — np.searchsorted за O(log n)
+#   file.npy     uint16[n]: номер файлу артефакту (meta.json → files)
+#   pos.npy      int64[n]:  CSV — байтовий зсув рядка; Parquet/Arrow — номер рядка у файлі
+#   length.npy   uint32[n]: довжина рядка CSV у байтах (лише для CSV)
+#   meta.json    формат, файли, кількість рядків, розміри файлів на момент побудови
+#
+# Масиви відкриваються з mmap_mode="r": пошук батчу ID торкається лише O(k log n) сторінок
+# індексу, а читаються лише потрібні рядки (CSV — через mmap за зсувами, Parquet — лише
+# потрібні row groups, Arrow IPC — zero-copy батчі), без завантаження всієї таблиці.
+
+INDEX_SUFFIX = ".idx"
+ID_COLUMN = "customerID"
+ID_WIDTH = 10                          # dddd-AAAAA
+CSV_BLOCK_BYTES = 64 * 2**20
+
+
+def index_path(artifact: str | Path) -> Path:
+    artifact = Path(artifact)
+    return artifact.with_name(artifact.name + INDEX_SUFFIX)
+
+
+def _artifact_files(artifact: Path, fmt: str) -> list:
+    # Файли в детермінованому порядку; для партицій — усі part-файли в RecordMonth=*/
+    if artifact.is_dir():
+        suffix = ".parquet" if fmt == "parquet" else ".arrow"
+        return sorted(p for p in artifact.rglob(f"*{suffix}") if p.is_file())
+    return [artifact]
+
+
+def _format(artifact: Path) -> str:
+    if artifact.is_dir():
+        return "parquet" if any(artifact.rglob("*.parquet")) else "arrow"
+    if artifact.suffix not in (".csv", ".parquet", ".arrow"):
+        # .csv.gz / .csv.zst: байтові зсуви рядків мають сенс лише для нестиснутого CSV
+        raise ValueError(f"{artifact}: індекс підтримує лише нестиснутий CSV, Parquet або Arrow")
+    return {".csv": "csv", ".parquet": "parquet", ".arrow": "arrow"}[artifact.suffix]
+
+
+def _scan_csv(path: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(ключі, зсуви, довжини) рядків CSV без парсингу: customerID — перші 10 байтів рядка."""
+    with open(path, "rb") as f:
+        header = f.readline()
+        if not header.startswith(ID_COLUMN.encode() + b","):
+            raise ValueError(f"{path}: перша колонка має бути {ID_COLUMN}")
+        size = path.stat().st_size
+        if size == len(header):
+            empty = np.array([], dtype=np.int64)
+            return empty.astype(np.uint64), empty, empty.astype(np.uint32)
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            starts, keys = [], []
+            # Кінці рядків шукаються блоками, щоб не тримати маску розміром з файл
+            for block in range(len(header), size, CSV_BLOCK_BYTES):
+                newlines = np.flatnonzero(buf[block:block + CSV_BLOCK_BYTES] == ord("\n")) + block
+                line_starts = np.concatenate([[len(header)] if block == len(header) else [], newlines + 1])
+                line_starts = line_starts[line_starts < size].astype(np.int64)
+                ids = buf[line_starts[:, None] + np.arange(ID_WIDTH)]
+                starts.append(line_starts)
+                keys.append(decode(np.ascontiguousarray(ids).view(f"S{ID_WIDTH}").ravel()))
+            del buf
+        finally:
+            mm.close()
+    starts = np.concatenate(starts)
+    lengths = np.diff(np.append(starts, size)).astype(np.uint32)
+    return np.concatenate(keys), starts, lengths
+
+
+def _read_ids(path: Path, fmt: str) -> np.ndarray:
+    import pyarrow as pa
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        column = pq.read_table(path, columns=[ID_COLUMN])[ID_COLUMN]
+    else:
+        with pa.memory_map(str(path)) as source:
+            column = pa.ipc.open_file(source).read_all()[ID_COLUMN]
+    return decode(column.to_numpy(zero_copy_only=False).astype(f"S{ID_WIDTH}"))
+
+
+def build_customer_index(artifact: str | Path, path: str | Path = None) -> Path:
+    """Будує індекс для артефакту клієнтів (файл або директорія партицій); повертає шлях індексу."""
+    artifact = Path(artifact)
+    path = Path(path) if path else index_path(artifact)
+    fmt = _format(artifact)
+    files = _artifact_files(artifact, fmt)
+
+    keys, file_no, pos, lengths = [], [], [], []
+    for i, file in enumerate(files):
+        if fmt == "csv":
+            k, p, length = _scan_csv(file)
+            lengths.append(length)
+        else:
+            k = _read_ids(file, fmt)
+            p = np.arange(len(k), dtype=np.int64)
+        keys.append(k)
+        pos.append(p)
+        file_no.append(np.full(len(k), i, dtype=np.uint16))
+
+    keys = np.concatenate(keys) if keys else np.array([], dtype=np.uint64)
+    order = np.argsort(keys, kind="stable")
+    arrays = {"keys": keys[order], "file": np.concatenate(file_no)[order], "pos": np.concatenate(pos)[order]}
+    if fmt == "csv":
+        arrays["length"] = np.concatenate(lengths)[order]
+
+    # Директорія пишеться заново, а не поверх: файли можуть бути хардлінками в кеш артефактів
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+    for name, values in arrays.items():
+        np.save(path / f"{name}.npy", values)
+    meta = {
+        "format": fmt,
+        "rows":   int(len(keys)),
+        "files":  [str(file.relative_to(artifact.parent)) for file in files],
+        "sizes":  [file.stat().st_size for file in files],
+    }
+    (path / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return path
+
+
+class CustomerIndex:
+    """Пошук рядків клієнтів за customerID через індекс <артефакт>.idx/.
+
+    locate(ids) — O(k log n) бінарний пошук для батчу з k ID; lookup(ids) — самі рядки
+    (DataFrame у порядку ids; відсутні ID пропускаються).
+    """
+
+    def __init__(self, artifact: str | Path, path: str | Path = None):
+        self.artifact = Path(artifact)
+        self.path = Path(path) if path else index_path(self.artifact)
+        self.meta = json.loads((self.path / "meta.json").read_text(encoding="utf-8"))
+        self.fmt = self.meta["format"]
+        self.files = [self.artifact.parent / name for name in self.meta["files"]]
+        for name in ("keys", "file", "pos") + (("length",) if self.fmt == "csv" else ()):
+            setattr(self, name, np.load(self.path / f"{name}.npy", mmap_mode="r"))
+
+    def __len__(self) -> int:
+        return self.meta["rows"]
+
+    def is_stale(self) -> bool:
+        """Артефакт змінився після побудови індексу (напр. дозапис без перебудови)."""
+        return [file.stat().st_size if file.exists() else -1 for file in self.files] != self.meta["sizes"]
+
+    def locate(self, ids) -> tuple[np.ndarray, np.ndarray]:
+        """(знайдено?, позиції в індексі) для кожного ID; рядок не у форматі dddd-AAAAA — не знайдено."""
+        ids = np.asarray(ids, dtype=object).ravel()
+        # decode не перевіряє формат: без маски 'dddd-AAAAa' чи довший рядок (обрізаний до S10) дають чужий ключ
+        valid = is_valid(ids)
+        keys = np.zeros(len(ids), dtype=np.uint64)
+        keys[valid] = decode(ids[valid].astype(f"S{ID_WIDTH}"))
+        at = np.searchsorted(self.keys, keys)
+        found = valid & (at < len(self.keys))
+        found[found] = self.keys[at[found]] == keys[found]
+        return found, at
+
+    def __contains__(self, customer_id: str) -> bool:
+        return bool(self.locate([customer_id])[0][0])
+
+    def lookup(self, ids) -> pd.DataFrame:
+        ids = np.asarray(ids, dtype=object)
+        found, at = self.locate(ids)
+        at = at[found]
+        files, pos = np.asarray(self.file[at]), np.asarray(self.pos[at])
+        frames, order = [], []
+        for i in np.unique(files):
+            rows = np.flatnonzero(files == i)
+            frames.append(self._read(self.files[i], pos[rows], np.asarray(self.length[at[rows]])
+                                     if self.fmt == "csv" else None))
+            order.append(rows)
+        if not frames:
+            return self._read(self.files[0], np.array([], dtype=np.int64),
+                              np.array([], dtype=np.uint32) if self.fmt == "csv" else None)
+        # Порядок запиту: рядки читаються пофайлово, потім переставляються назад
+        result = pd.concat(frames, ignore_index=True)
+        return result.iloc[np.argsort(np.concatenate(order), kind="stable")].reset_index(drop=True)
+
+    def _read(self, file: Path, pos: np.ndarray, lengths: np.ndarray = None) -> pd.DataFrame:
+        if self.fmt == "csv":
+            return _read_csv_rows(file, pos, lengths)
+        return _read_arrow_rows(file, self.fmt, pos).to_pandas()
+
+
+def _read_csv_rows(file: Path, offsets: np.ndarray, lengths: np.ndarray) -> pd.DataFrame:
+    with open(file, "rb") as f:
+        header = f.readline()
+        if not len(offsets):
+            return pd.read_csv(io.BytesIO(header))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Послідовне читання за зростанням зсуву, потім порядок запиту
+            order = np.argsort(offsets, kind="stable")
+            lines = [mm[o:o + n] for o, n in zip(offsets[order].tolist(), lengths[order].tolist())]
+    lines = [line if line.endswith(b"\n") else line + b"\n" for line in lines]
+    frame = pd.read_csv(io.BytesIO(header + b"".join(lines)))
+    return frame.iloc[np.argsort(order, kind="stable")].reset_index(drop=True)
+
+
+def _read_arrow_rows(file: Path, fmt: str, rows: np.ndarray):
+    """Лише row groups (Parquet) або record batches (Arrow IPC), що містять rows."""
+    import pyarrow as pa
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        pf = pq.ParquetFile(file)
+        sizes = [pf.metadata.row_group(g).num_rows for g in range(pf.num_row_groups)]
+        read = lambda groups: pf.read_row_groups(groups)  # noqa: E731
+    else:
+        reader = pa.ipc.open_file(pa.memory_map(str(file)))
+        sizes = [reader.get_batch(b).num_rows for b in range(reader.num_record_batches)]
+        read = lambda groups: pa.Table.from_batches([reader.get_batch(g) for g in groups],  # noqa: E731
+                                                    schema=reader.schema)
+    bounds = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+    group = np.searchsorted(bounds, rows, side="right") - 1
+    groups = np.unique(group)
+    # Номер рядка в таблиці з вибраних груп: зсув групи в цій таблиці + номер у групі
+    local_start = np.concatenate([[0], np.cumsum(np.asarray(sizes)[groups])])[np.searchsorted(groups, group)]
+    table = read(groups.tolist())
+    return table.take(pa.array(local_start + rows - bounds[group]))
@@ -0,0 +1,193 @@
+import numpy as np
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Розклад дрейфу: секція `drift:` config.yaml → таблиці параметрів по днях
+# ──────────────────────────────────────────────────────────────────────────────
+#
+# Усі ймовірності й цінові коефіцієнти, що дрейфують, залежать лише від індексу дня.
+# DriftSchedule один раз обчислює їх для кожного дня періоду (~730 значень на
+# параметр), а генератори лише індексують таблицю днями рядків.
+#
+# Форму дрейфу задає крива — функція дня, що заміняє лінійний progress = day / total_days.
+# Криві оголошуються в drift.curves для груп параметрів (CURVE_GROUPS); група без
+# кривої бере curves.default, а без неї — linear (оригінальна поведінка):
+#
+#   drift:
+#     fiber_growth_rate: 0.25
+#     curves:
+#       internet: {type: piecewise, points: [[0, 0], ["2023-07-01", 0.1], [1, 1]]}
+#       churn:    {type: seasonal, amplitude: 0.15, period_days: 365, phase_days: 30}
+#       payment:  {type: step, at: "2024-03-01", size: 0.5, decay_days: 60}
+
+
+# Числові ключі секції `drift:` config.yaml і їхні оригінальні значення
+DRIFT_DEFAULTS = {
+    "fiber_growth_rate":      0.25,
+    "dsl_decline_rate":       0.20,
+    "no_internet_decline":    0.05,
+    "echeck_decline_rate":    0.25,
+    "m2m_decline_rate":       0.25,
+    "streaming_boost_factor": 0.3,
+    "senior_decline_rate":    0.12,
+    "churn_base_decline":     0.20,
+    "data_growth_rate":       0.50,
+    "voice_decline_rate":     0.25,
+    "join_growth_rate":       0.30,
+}
+
+
+def drift_params(drift: dict = None) -> dict:
+    """Drift-параметри з секції `drift:` config.yaml (fallback на DRIFT_DEFAULTS)."""
+    params = {key: (drift or {}).get(key, default) for key, default in DRIFT_DEFAULTS.items()}
+    params["no_inet_decline"] = params.pop("no_internet_decline")
+    return params
+
+
+# Групи параметрів, для яких можна задати окрему криву
+CURVE_GROUPS = ("internet", "payment", "contract", "streaming", "senior", "demographics",
+                "tenure", "usage", "pricing", "churn", "acquisition")
+
+CURVES = {}
+
+
+def register_curve(name: str):
+    """Декоратор для нового типу кривої: fn(spec, days, total_days, start) → масив значень по днях."""
+    def decorator(fn):
+        CURVES[name] = fn
+        return fn
+    return decorator
+
+
+def _day(x, total_days: int, start: np.datetime64) -> float:
+    # Точка на осі часу: дата "YYYY-MM-DD" або частка періоду (progress)
+    if isinstance(x, str):
+        return float((np.datetime64(x, "D") - start).astype(int))
+    return float(x) * total_days
+
+
+def evaluate_curve(spec, days: np.ndarray, total_days: int, start: np.datetime64) -> np.ndarray:
+    """Значення кривої spec ("linear", {type: ...} або None) для індексів днів days."""
+    if spec is None or isinstance(spec, str):
+        spec = {"type": spec or "linear"}
+    kind = spec.get("type", "linear")
+    if kind not in CURVES:
+        raise ValueError(f"Невідомий тип кривої дрейфу: {kind!r} (доступні: {', '.join(CURVES)})")
+    return np.asarray(CURVES[kind](spec, days, total_days, start), dtype=np.float64)
+
+
+@register_curve("linear")
+def _linear(spec, days, total_days, start):
+    # Оригінальний progress: 0 на start_date, 1 на end_date, далі продовжується
+    return days / total_days
+
+
+@register_curve("constant")
+def _constant(spec, days, total_days, start):
+    return np.full(len(days), float(spec.get("value", 0.0)))
+
+
+@register_curve("piecewise")
+def _piecewise(spec, days, total_days, start):
+    # points: [[x, value], ...], x — дата або progress; між точками лінійно, за межами — крайнє значення
+    points = sorted((_day(x, total_days, start), float(v)) for x, v in spec["points"])
+    xs, ys = zip(*points)
+    return np.interp(days, xs, ys)
+
+
+@register_curve("seasonal")
+def _seasonal(spec, days, total_days, start):
+    # trend (default linear) + amplitude · sin(2π (day − phase_days) / period_days)
+    trend = evaluate_curve(spec.get("trend"), days, total_days, start)
+    period, phase = spec.get("period_days", 365), spec.get("phase_days", 0)
+    return trend + spec.get("amplitude", 0.1) * np.sin(2 * np.pi * (days - phase) / period)
+
+
+@register_curve("step")
+def _step(spec, days, total_days, start):
+    # trend + size з дня at; duration_days — тимчасовий шок, decay_days — експоненційне згасання
+    trend = evaluate_curve(spec.get("trend"), days, total_days, start)
+    since = days - _day(spec["at"], total_days, start)
+    shock = np.where(since >= 0, float(spec.get("size", 0.1)), 0.0)
+    if "duration_days" in spec:
+        shock = np.where(since < spec["duration_days"], shock, 0.0)
+    if "decay_days" in spec:
+        shock = shock * np.exp(-np.maximum(since, 0) / spec["decay_days"])
+    return trend + shock
+
+
+class DriftSchedule:
+    """Скомпільований дрейф: таблиці параметрів генерації по днях від start_date.
+
+    table(n_days) повертає {параметр: масив довжини n_days}; дні після end_date
+    (дозапис) продовжують криві. Таблиці кешуються за довжиною.
+    """
+
+    def __init__(self, drift: dict = None, start_date: str = "2023-01-01", end_date: str = "2024-12-31"):
+        drift = drift or {}
+        self.params = drift_params(drift)
+        curves = drift.get("curves") or {}
+        unknown = set(curves) - set(CURVE_GROUPS) - {"default"}
+        if unknown:
+            raise ValueError(f"Невідомі групи кривих дрейфу: {sorted(unknown)} (доступні: {', '.join(CURVE_GROUPS)})")
+        self.curves = {group: curves.get(group, curves.get("default")) for group in CURVE_GROUPS}
+        self.start = np.datetime64(start_date, "D")
+        self.total_days = int((np.datetime64(end_date, "D") - self.start).astype(int))
+        self._tables = {}
+
+    def curve(self, group: str, n_days: int) -> np.ndarray:
+        return evaluate_curve(self.curves[group], np.arange(n_days, dtype=np.float64), self.total_days, self.start)
+
+    def table(self, n_days: int = None) -> dict:
+        n_days = max(n_days or 0, self.total_days + 1)
+        if n_days not in self._tables:
+            self._tables[n_days] = self._compile(n_days)
+        return self._tables[n_days]
+
+    def _compile(self, n_days: int) -> dict:
+        p = self.params
+        c = {group: self.curve(group, n_days) for group in CURVE_GROUPS}
+        # Ймовірності обрізаються до [0, 1], ваги категорій — до ≥ 0 (їх напряму отримують і
+        # _weighted_choice, і random.choices python-рушія), щоб довільні криві та продовження
+        # після end_date не давали некоректних розподілів
+        prob = lambda x: np.clip(x, 0.0, 1.0)  # noqa: E731
+        weight = lambda x: np.maximum(x, 0.0)  # noqa: E731
+        return {
+            # Інтернет
+            "dsl_prob":          weight(0.40 - p["dsl_decline_rate"] * c["internet"]),
+            "fiber_prob":        weight(0.40 + p["fiber_growth_rate"] * c["internet"]),
+            "no_inet_prob":      weight(0.20 - p["no_inet_decline"] * c["internet"]),
+            # Оплата
+            "echeck_prob":       np.maximum(0.15, 0.40 - p["echeck_decline_rate"] * c["payment"]),
+            "bank_weight":       weight(0.25 + 0.1 * c["payment"]),
+            "credit_weight":     weight(0.25 + 0.15 * c["payment"]),
+            # Контракт
+            "m2m_prob":          prob(np.maximum(0.30, 0.55 - p["m2m_decline_rate"] * c["contract"])),
+            # Додаткові послуги
+            "streaming_boost":   p["streaming_boost_factor"] * c["streaming"],
+            # Демографія
+            "senior_prob":       prob(np.maximum(0.08, 0.18 - p["senior_decline_rate"] * c["senior"])),
+            "partner_prob":      prob((52 + 10 * c["demographics"]) / 100),
+            "dependents_prob":   prob(0.3 - 0.1 * c["demographics"]),
+            # Стаж: beta(a, b) · 72
+            "tenure_a":          np.maximum(2 + c["tenure"], 0.5),
+            "tenure_b":          np.maximum(3 - 0.5 * c["tenure"], 0.5),
+            # Користування
+            "multi_prob":        prob(0.45 + 0.1 * c["usage"]),
+            "paperless_prob":    prob(0.59 + 0.15 * c["usage"]),
+            # Ознаки користування (usage.py): множники трафіку даних і хвилин дзвінків
+            "data_factor":       np.maximum(1 + p["data_growth_rate"] * c["usage"], 0.1),
+            "voice_factor":      np.maximum(1 - p["voice_decline_rate"] * c["usage"], 0.1),
+            # Ціна
+            "fiber_price":       82 + 10 * c["pricing"],
+            "extra_price":       8 + 3 * c["pricing"],
+            "two_year_discount": 0.88 - 0.03 * c["pricing"],
+            # Churn: зсув базової ймовірності
+            "churn_shift":       p["churn_base_decline"] * c["churn"],
+            # Панель (panel.py): множник нових клієнтів на місяць
+            "join_factor":       weight(1 + p["join_growth_rate"] * c["acquisition"]),
+        }
+
+    def lookup(self, days: np.ndarray) -> dict:
+        """Параметри для кожного рядка: таблиці, проіндексовані днями рядків."""
+        days = np.asarray(days, dtype=np.int64)
+        return {name: values[days] for name, values in self.table(int(days.max(initial=0)) + 1).items()}
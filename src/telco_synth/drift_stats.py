@@ -0,0 +1,206 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .schema import CATEGORY_LEVELS, CUSTOMER_COLUMNS
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Профіль дрейфу: потокові лічильники по місяцях RecordDate, що наповнюються чанками
+# ──────────────────────────────────────────────────────────────────────────────
+#
+# Для кожної ознаки й місяця накопичуються лише лічильники: частоти категорій та
+# гістограми числових ознак з фіксованими межами (плюс суми для mean/std). Лічильники
+# чанків просто додаються, тож профіль 50M-рядкового запуску коштує кілька КБ пам'яті й
+# не потребує перечитування результату. PSI та Jensen–Shannon рахуються відносно
+# першого місяця вже з накопичених розподілів.
+
+# Категоріальні ознаки: рівні в порядку кодів
+CATEGORICAL_FEATURES = {
+    **{col: levels for col, levels in CATEGORY_LEVELS.items() if col in CUSTOMER_COLUMNS},
+    "SeniorCitizen": [0, 1],
+}
+
+# Числові ознаки: межі бінів; значення поза межами потрапляють у крайні біни
+NUMERIC_BINS = {
+    "tenure":         np.arange(0, 79, 6, dtype=np.float64),
+    "MonthlyCharges": np.arange(0, 205, 5, dtype=np.float64),
+    "TotalCharges":   np.arange(0, 15001, 250, dtype=np.float64),
+}
+
+# Згладжування порожніх бінів для PSI/JS (інакше log(0))
+EPSILON = 1e-6
+
+
+def record_months(dates: pd.Series) -> np.ndarray:
+    """Місяць RecordDate як datetime64[M] — з datetime64 або рядка YYYY-MM-DD без pd.to_datetime."""
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates.to_numpy().astype("datetime64[M]")
+    return np.asarray(dates, dtype="S7").astype("datetime64[M]")
+
+
+def _codes(values: pd.Series, levels: list) -> np.ndarray:
+    if isinstance(values.dtype, pd.CategoricalDtype) and list(values.cat.categories) == list(levels):
+        return values.cat.codes.to_numpy()
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return np.asarray(values, dtype=np.int64)
+    return pd.Categorical(values, categories=levels).codes
+
+
+def _distribution(counts: np.ndarray) -> np.ndarray:
+    p = counts / max(counts.sum(), 1)
+    p = np.maximum(p, EPSILON)
+    return p / p.sum()
+
+
+def psi(reference: np.ndarray, current: np.ndarray) -> float:
+    """Population Stability Index: Σ (q − p) · ln(q / p) за лічильниками бінів."""
+    p, q = _distribution(reference), _distribution(current)
+    return float(np.sum((q - p) * np.log(q / p)))
+
+
+def js_divergence(reference: np.ndarray, current: np.ndarray) -> float:
+    """Jensen–Shannon divergence (log2, у межах [0, 1]) за лічильниками бінів."""
+    p, q = _distribution(reference), _distribution(current)
+    m = (p + q) / 2
+    return float(0.5 * np.sum(p * np.log2(p / m)) + 0.5 * np.sum(q * np.log2(q / m)))
+
+
+class DriftProfile:
+    """Лічильники розподілів ознак по місяцях; update(chunk) для кожного чанку клієнтів.
+
+    counts[ознака][місяць] — масив лічильників бінів (категорій); для числових ознак
+    moments[ознака][місяць] = [n, Σx, Σx²]. Місяці — рядки YYYY-MM, опорний — найраніший.
+    """
+
+    def __init__(self):
+        self.counts = {feature: {} for feature in (*CATEGORICAL_FEATURES, *NUMERIC_BINS)}
+        self.moments = {feature: {} for feature in NUMERIC_BINS}
+
+    @property
+    def months(self) -> list:
+        return sorted(self.counts["Churn"])
+
+    def update(self, df: pd.DataFrame):
+        months, month_idx = np.unique(record_months(df["RecordDate"]), return_inverse=True)
+        labels = [str(m) for m in months]
+        n_months = len(months)
+
+        def add(feature: str, bins: np.ndarray, n_bins: int):
+            valid = (bins >= 0) & (bins < n_bins)
+            counts = np.bincount(month_idx[valid] * n_bins + bins[valid], minlength=n_months * n_bins)
+            for label, row in zip(labels, counts.reshape(n_months, n_bins)):
+                store = self.counts[feature]
+                store[label] = store[label] + row if label in store else row
+
+        for feature, levels in CATEGORICAL_FEATURES.items():
+            add(feature, _codes(df[feature], levels).astype(np.int64), len(levels))
+        for feature, edges in NUMERIC_BINS.items():
+            x = df[feature].to_numpy(dtype=np.float64)
+            add(feature, np.searchsorted(edges[1:-1], x, side="right"), len(edges) - 1)
+            sums = np.stack([np.bincount(month_idx, minlength=n_months),
+                             np.bincount(month_idx, x, minlength=n_months),
+                             np.bincount(month_idx, x * x, minlength=n_months)], axis=1)
+            for label, row in zip(labels, sums):
+                store = self.moments[feature]
+                store[label] = store[label] + row if label in store else row
+
+    def merge(self, other: "DriftProfile") -> "DriftProfile":
+        """Додає лічильники other (напр. профіль дозапису) до цього профілю; повертає self."""
+        for stores, other_stores in ((self.counts, other.counts), (self.moments, other.moments)):
+            for feature, by_month in other_stores.items():
+                store = stores[feature]
+                for month, values in by_month.items():
+                    store[month] = store[month] + values if month in store else values
+        return self
+
+    def churn_counts_by_year(self) -> pd.Series:
+        """Кількість рядків по (Year, Churn) — як pipeline.churn_counts_by_year."""
+        counts = {}
+        for month, (no, yes) in self.counts["Churn"].items():
+            year = int(month[:4])
+            counts[(year, "No")] = counts.get((year, "No"), 0) + int(no)
+            counts[(year, "Yes")] = counts.get((year, "Yes"), 0) + int(yes)
+        index = pd.MultiIndex.from_tuples(sorted(counts), names=["Year", "Churn"])
+        return pd.Series([counts[k] for k in index], index=index)
+
+    def report(self) -> dict:
+        """Профіль для JSON: по місяцях рядки й churn rate, по ознаках частоти, PSI та JS."""
+        months = self.months
+        if not months:
+            return {"reference_month": None, "months": [], "features": {}}
+        reference = months[0]
+        features = {}
+        for feature, by_month in self.counts.items():
+            entry = {
+                "kind":   "categorical" if feature in CATEGORICAL_FEATURES else "numeric",
+                "bins":   CATEGORICAL_FEATURES.get(feature) or NUMERIC_BINS[feature].tolist(),
+                "counts": [by_month[m].tolist() for m in months],
+                "freq":   [np.round(by_month[m] / max(by_month[m].sum(), 1), 6).tolist() for m in months],
+                "psi":    [round(psi(by_month[reference], by_month[m]), 6) for m in months],
+                "js":     [round(js_divergence(by_month[reference], by_month[m]), 6) for m in months],
+            }
+            if feature in self.moments:
+                n, s, s2 = np.array([self.moments[feature][m] for m in months]).T
+                mean = s / np.maximum(n, 1)
+                entry["mean"] = np.round(mean, 4).tolist()
+                entry["std"] = np.round(np.sqrt(np.maximum(s2 / np.maximum(n, 1) - mean ** 2, 0)), 4).tolist()
+                entry["sum"], entry["sum_sq"] = s.tolist(), s2.tolist()
+            features[feature] = entry
+        churn = np.array([self.counts["Churn"][m] for m in months])
+        return {
+            "reference_month": reference,
+            "months":          months,
+            "rows":            churn.sum(axis=1).tolist(),
+            "churn_rate":      np.round(churn[:, 1] / np.maximum(churn.sum(axis=1), 1), 6).tolist(),
+            "features":        features,
+        }
+
+    def to_frame(self) -> pd.DataFrame:
+        """Довга таблиця для Parquet: month, feature, bin, count, freq, psi, js (+ mean, std, sum, sum_sq)."""
+        report = self.report()
+        records = []
+        for feature, entry in report["features"].items():
+            bins = [str(b) for b in entry["bins"]]
+            if entry["kind"] == "numeric":
+                bins = bins[:-1]           # лічильник бінів [edge_i, edge_i+1) — за лівою межею
+            for i, month in enumerate(report["months"]):
+                moments = [entry[k][i] if k in entry else np.nan for k in ("mean", "std", "sum", "sum_sq")]
+                for b, count, freq in zip(bins, entry["counts"][i], entry["freq"][i]):
+                    records.append((month, feature, b, count, freq, entry["psi"][i], entry["js"][i], *moments))
+        return pd.DataFrame.from_records(records, columns=["month", "feature", "bin", "count", "freq", "psi", "js",
+                                                           "mean", "std", "sum", "sum_sq"])
+
+    def write(self, path: str | Path) -> Path:
+        """JSON (.json) або Parquet (.parquet) за розширенням path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".parquet":
+            self.to_frame().to_parquet(path, index=False)
+        else:
+            path.write_text(json.dumps(self.report(), ensure_ascii=False), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "DriftProfile":
+        """Відновлює лічильники з раніше записаного профілю (для дозапису)."""
+        path = Path(path)
+        profile = cls()
+        if path.suffix == ".parquet":
+            frame = pd.read_parquet(path)
+            for (feature, month), group in frame.groupby(["feature", "month"], sort=False):
+                counts = group["count"].to_numpy(dtype=np.int64)
+                profile.counts[feature][month] = counts
+                if feature in profile.moments:
+                    profile.moments[feature][month] = np.array(
+                        [counts.sum(), group["sum"].iloc[0], group["sum_sq"].iloc[0]])
+            return profile
+        report = json.loads(path.read_text(encoding="utf-8"))
+        for feature, entry in report["features"].items():
+            for i, month in enumerate(report["months"]):
+                counts = np.asarray(entry["counts"][i], dtype=np.int64)
+                profile.counts[feature][month] = counts
+                if feature in profile.moments:
+                    profile.moments[feature][month] = np.array([counts.sum(), entry["sum"][i], entry["sum_sq"][i]])
+        return profile
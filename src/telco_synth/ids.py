@@ -0,0 +1,113 @@
+import re
+
+import numpy as np
+
+# ──────────────────────────────────────────────────────────────────────────────
+# customerID: ключова бієктивна перестановка номера рядка → dddd-AAAAA
+# ──────────────────────────────────────────────────────────────────────────────
+#
+# Номер рядка (глобальний, наскрізний для шардів і дозаписів) переставляється
+# незбалансованою Feistel-мережею на 37 бітах з cycle walking до простору ID_SPACE і
+# кодується як 4 цифри (1000–9999) + 5 літер. Перестановка бієктивна, тож різні рядки
+# завжди мають різні ID — без множин, перевірок на дублікати чи побудови рядків у циклі.
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LETTER_SPACE = len(ALPHABET) ** 5
+ID_SPACE = 9000 * LETTER_SPACE          # ~1.07e11 можливих ID
+ID_RE = re.compile(r"[1-9][0-9]{3}-[A-Z]{5}")
+
+STREAM_IDS = 3                          # продовжує STREAM_* з tabular
+ROUNDS = 4                              # парне: після всіх раундів половини знову 18 + 19 біт
+_HIGH_BITS, _LOW_BITS = 18, 19          # 2**37 ≈ 1.29 × ID_SPACE
+
+
+def id_keys(seed: int) -> np.ndarray:
+    """Раундові ключі перестановки; залежать лише від seed."""
+    return np.random.SeedSequence(seed, spawn_key=(STREAM_IDS,)).generate_state(ROUNDS, np.uint64)
+
+
+def _round(half: np.ndarray, key: np.uint64, bits: int) -> np.ndarray:
+    # splitmix64-подібне перемішування; множення uint64 у numpy переповнюється по модулю 2**64
+    z = half ^ key
+    z *= np.uint64(0x9E3779B97F4A7C15)
+    z ^= z >> np.uint64(29)
+    z *= np.uint64(0xBF58476D1CE4E5B9)
+    z ^= z >> np.uint64(32)
+    z &= np.uint64((1 << bits) - 1)
+    return z
+
+
+def _feistel(x: np.ndarray, keys: np.ndarray, inverse: bool = False) -> np.ndarray:
+    # Ліва половина 18 біт, права 19; кожен раунд міняє половини місцями разом з їхньою шириною
+    left, right = x >> np.uint64(_LOW_BITS), x & np.uint64((1 << _LOW_BITS) - 1)
+    wl, wr = _HIGH_BITS, _LOW_BITS
+    if not inverse:
+        for key in keys:
+            left, right = right, left ^ _round(right, key, wl)
+            wl, wr = wr, wl
+    else:
+        for key in keys[::-1]:
+            left, right = right ^ _round(left, key, wr), left
+            wl, wr = wr, wl
+    return (left << np.uint64(wr)) | right
+
+
+def _permute(x: np.ndarray, keys: np.ndarray, inverse: bool = False) -> np.ndarray:
+    # Cycle walking: значення поза ID_SPACE переставляються ще раз, доки не потраплять у простір
+    # (у середньому ~1.3 проходи), що дає бієкцію саме на [0, ID_SPACE)
+    y = _feistel(x, keys, inverse)
+    out = np.flatnonzero(y >= ID_SPACE)
+    while out.size:
+        y[out] = _feistel(y[out], keys, inverse)
+        out = out[y[out] >= ID_SPACE]
+    return y
+
+
+def _check_rows(rows: np.ndarray) -> np.ndarray:
+    rows = np.asarray(rows, dtype=np.int64)
+    if rows.size and (rows.min() < 0 or rows.max() >= ID_SPACE):
+        raise ValueError(f"Номер рядка поза простором customerID [0, {ID_SPACE:,})")
+    return rows.astype(np.uint64)
+
+
+def encode(values: np.ndarray) -> np.ndarray:
+    """Числа з [0, ID_SPACE) → object-масив рядків dddd-AAAAA."""
+    values = np.asarray(values, dtype=np.uint64)
+    digits = (values // np.uint64(LETTER_SPACE)).astype(np.uint16) + np.uint16(1000)
+    letters = (values % np.uint64(LETTER_SPACE)).astype(np.uint32)
+    buf = np.empty((len(values), 10), dtype=np.uint8)
+    for k in range(3, -1, -1):
+        digits, buf[:, k] = np.divmod(digits, np.uint16(10))
+    buf[:, :4] += ord("0")
+    buf[:, 4] = ord("-")
+    for k in range(9, 4, -1):
+        letters, buf[:, k] = np.divmod(letters, np.uint32(26))
+    buf[:, 5:] += ord("A")
+    return buf.view("S10").ravel().astype(str).astype(object)
+
+
+def is_valid(ids) -> np.ndarray:
+    """Маска ID у форматі encode (1000–9999, дефіс, 5 великих латинських літер); інше — False."""
+    return np.array([isinstance(x, str) and ID_RE.fullmatch(x) is not None for x in np.ravel(ids)], dtype=bool)
+
+
+def decode(ids) -> np.ndarray:
+    """Рядки dddd-AAAAA → числа з [0, ID_SPACE) (обернене до encode; формат не перевіряється — див. is_valid)."""
+    buf = np.asarray(ids, dtype="S10").view(np.uint8).reshape(-1, 10)
+    digits = np.zeros(len(buf), dtype=np.uint64)
+    for k in range(4):
+        digits = digits * np.uint64(10) + (buf[:, k] - ord("0"))
+    letters = np.zeros(len(buf), dtype=np.uint64)
+    for k in range(5, 10):
+        letters = letters * np.uint64(26) + (buf[:, k] - ord("A"))
+    return (digits - np.uint64(1000)) * np.uint64(LETTER_SPACE) + letters
+
+
+def customer_ids(rows, seed: int = 42) -> np.ndarray:
+    """customerID для глобальних номерів рядків rows; унікальні для різних rows за одного seed."""
+    return encode(_permute(_check_rows(rows), id_keys(seed)))
+
+
+def customer_rows(ids, seed: int = 42) -> np.ndarray:
+    """Обернене до customer_ids: глобальні номери рядків для customerID."""
+    return _permute(decode(ids), id_keys(seed), inverse=True).astype(np.int64)
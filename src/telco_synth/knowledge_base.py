@@ -0,0 +1,326 @@
+import json
+import re
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Knowledge base: документи з config + синтез з шаблонів тем, зв'язки з розмовами,
+# готовий лексичний індекс BM25 у форматі .npy (np.load(mmap_mode="r"))
+# ──────────────────────────────────────────────────────────────────────────────
+
+STREAM_KB = 5                           # продовжує STREAM_* з tabular
+
+KB_CSV, KB_JSON, KB_INDEX = "knowledge_base.csv", "knowledge_base.json", "knowledge_base_index"
+
+# Дефолти секції `knowledge_base:` config.yaml
+KB_DEFAULTS = {
+    "enabled":                True,
+    "synthetic_documents":    0,         # скільки документів синтезувати з TOPIC_TEMPLATES
+    "links_per_conversation": 3,         # скільки ID документів тієї ж теми додати до розмови
+    "index":                  True,      # будувати knowledge_base_index/
+    "documents":              [],        # документи з config: заміняють базові з тим самим id
+}
+
+DOCUMENT_FIELDS = ("id", "topic", "title", "content")
+
+# Тема документа = issue_type розмови, для якої він релевантний; "general" — для всіх
+TOPICS = ("billing_high", "service_slow", "service_outage", "contract_confusion", "want_to_cancel", "general")
+
+BASE_DOCUMENTS = [
+    {"id": 1, "topic": "service_outage", "title": "How to reset your modem", "content": "1. Unplug the power cord from the modem. 2. Wait 30 seconds. 3. Plug it back in. 4. Wait for all lights to stabilize."},
+    {"id": 2, "topic": "billing_high", "title": "Understanding your bill", "content": "Your monthly bill includes: base plan charge, equipment rental (if applicable), taxes, and any one-time fees. Check 'My Account' for detailed breakdown."},
+    {"id": 3, "topic": "service_slow", "title": "Upgrading to Fiber optic", "content": "Fiber offers speeds up to 1 Gbps. Availability depends on your address. Contact support or check online to see if eligible."},
+    {"id": 4, "topic": "billing_high", "title": "How to change payment method", "content": "Log in → My Account → Billing & Payments → Update Payment Method. We accept credit/debit cards, bank transfer, and electronic check."},
+    {"id": 5, "topic": "service_slow", "title": "Troubleshooting slow internet", "content": "1. Restart modem/router. 2. Connect via Ethernet to test. 3. Check for background downloads. 4. Contact us if issue persists."},
+    {"id": 6, "topic": "contract_confusion", "title": "Contract terms and cancellation", "content": "Month-to-month: cancel anytime. One/Two year: early termination fee may apply. 30-day notice required."},
+    {"id": 7, "topic": "general", "title": "Adding streaming services", "content": "You can add HBO, Netflix bundle, etc. in My Services. Some plans include free streaming options."},
+    {"id": 8, "topic": "general", "title": "Technical support hours", "content": "24/7 phone support. Chat available Mon–Fri 8 AM – 10 PM, weekends 9 AM – 8 PM."},
+]
+
+SLOTS = {
+    "plan":     ["DSL 100", "Fiber 300", "Fiber 500", "Premium Fiber 1 Gbps", "Basic TV + Internet", "Family Bundle"],
+    "device":   ["modem", "router", "Wi-Fi extender", "set-top box", "fiber ONT", "mesh node"],
+    "app":      ["My Account portal", "mobile app", "self-service kiosk", "customer web chat"],
+    "fee":      ["equipment rental fee", "late payment fee", "installation fee", "regulatory recovery fee",
+                 "streaming add-on charge", "paper bill fee"],
+    "contract": ["Month-to-month", "One year", "Two year"],
+    "region":   ["North", "South", "East", "West", "Central", "Coastal", "Metro", "Rural"],
+    "days":     ["3", "7", "14", "30"],
+    "speed":    ["50 Mbps", "100 Mbps", "300 Mbps", "500 Mbps", "1 Gbps"],
+}
+
+TOPIC_TEMPLATES = {
+    "billing_high": {
+        "title": ["Why is my {plan} bill higher this month?", "Understanding the {fee} on your bill",
+                  "How to dispute a {fee}", "Prorated charges after changing to {plan}"],
+        "content": ["Bills above your usual {plan} amount usually include a {fee}. Open the {app} → Billing to see "
+                    "every line item. Disputes are reviewed within {days} days (region {region}).",
+                    "A {fee} appears once per billing cycle. If you did not request the related service, contact "
+                    "us via the {app} within {days} days and we will credit the amount.",
+                    "After switching to {plan} the first bill covers two partial periods. The {app} shows the "
+                    "prorated breakdown; the next bill returns to the regular price."],
+    },
+    "service_slow": {
+        "title": ["Improving speed on {plan}", "Why your {device} limits speed", "Getting the full {speed}",
+                  "Slow Wi-Fi in the {region} area"],
+        "content": ["If {plan} feels slow, restart the {device} and test over Ethernet. Speeds below {speed} over "
+                    "Wi-Fi usually mean interference; move the {device} to a central spot.",
+                    "Older {device} models cap throughput below {speed}. Request a free replacement in the {app}; "
+                    "delivery takes up to {days} days in the {region} region.",
+                    "Run the speed test in the {app}. Results under {speed} on {plan} for {days} days in a row "
+                    "qualify for a line check by a technician."],
+    },
+    "service_outage": {
+        "title": ["Checking for outages in the {region} region", "No internet: {device} lights explained",
+                  "Outage credits for {plan}", "Restoring service after a power cut"],
+        "content": ["See the outage map in the {app} for the {region} region. Planned works are announced "
+                    "{days} days in advance; unplanned outages are usually fixed within hours.",
+                    "A red or blinking light on the {device} means no signal. Reboot it, check cables, and report "
+                    "the outage in the {app} if lights do not stabilize.",
+                    "Outages longer than 24 hours on {plan} are credited automatically on the next bill. "
+                    "Credits appear within {days} days."],
+    },
+    "contract_confusion": {
+        "title": ["{contract} contract explained", "Switching from {contract} to {plan}",
+                  "Early termination fees for {contract}", "Renewing your {contract} contract"],
+        "content": ["A {contract} contract fixes the {plan} price for its term. Changes to the plan before the "
+                    "term ends can add a {fee}; the {app} shows your contract end date.",
+                    "You can switch from {contract} to another term in the {app}. The new terms start with the "
+                    "next billing cycle, {days} days notice is recommended.",
+                    "Early termination of a {contract} contract is charged per remaining month. Moving within the "
+                    "{region} region keeps your contract without fees."],
+    },
+    "want_to_cancel": {
+        "title": ["How to cancel {plan}", "Returning your {device} after cancellation",
+                  "Retention offers for {contract} customers", "Pausing service instead of cancelling"],
+        "content": ["To cancel {plan}, submit a request in the {app} at least {days} days before the next billing "
+                    "date. A {fee} may apply for {contract} contracts.",
+                    "Return the {device} within {days} days after cancellation to avoid an equipment fee. Drop-off "
+                    "points are listed in the {app} for the {region} region.",
+                    "Before cancelling, check the {app} for retention offers: {contract} customers can get "
+                    "{plan} at a discount or a free speed upgrade to {speed}."],
+    },
+    "general": {
+        "title": ["Using the {app}", "Setting up a new {device}", "Adding services to {plan}",
+                  "Support options in the {region} region"],
+        "content": ["The {app} lets you pay bills, change {plan}, and track support tickets. Notifications can be "
+                    "enabled for billing and outages.",
+                    "Connect the {device} to the wall socket, wait for steady lights, then pair it in the {app}. "
+                    "Setup takes about {days} minutes.",
+                    "Streaming and security add-ons can be added to {plan} in the {app}. Changes take effect "
+                    "within {days} days."],
+    },
+}
+
+
+def kb_settings(config: dict = None) -> dict:
+    return {**KB_DEFAULTS, **((config or {}).get("knowledge_base") or {})}
+
+
+def base_documents(config_documents: list = None) -> list:
+    """BASE_DOCUMENTS, доповнені/перевизначені документами з config (за id); тема за замовчуванням — general."""
+    docs = {doc["id"]: dict(doc) for doc in BASE_DOCUMENTS}
+    for doc in config_documents or []:
+        merged = {"topic": "general", **docs.get(doc["id"], {}), **doc}
+        docs[doc["id"]] = {key: merged[key] for key in DOCUMENT_FIELDS}
+    unknown = {doc["topic"] for doc in docs.values()} - set(TOPICS)
+    if unknown:
+        raise ValueError(f"Невідомі теми документів knowledge base: {sorted(unknown)} (доступні: {', '.join(TOPICS)})")
+    return [docs[i] for i in sorted(docs)]
+
+
+def synthesize_documents(n: int, rng: np.random.Generator, first_id: int = 1) -> list:
+    """n документів з TOPIC_TEMPLATES: тема, шаблони та значення слотів вибираються масивами rng."""
+    topics = rng.integers(0, len(TOPICS), n)
+    title_idx, content_idx = rng.integers(0, 4, n), rng.integers(0, 3, n)
+    slots = {name: np.asarray(values, dtype=object)[rng.integers(0, len(values), n)]
+             for name, values in SLOTS.items()}
+    docs = []
+    for i in range(n):
+        topic = TOPICS[topics[i]]
+        fields = {name: values[i] for name, values in slots.items()}
+        templates = TOPIC_TEMPLATES[topic]
+        docs.append({"id": first_id + i, "topic": topic,
+                     "title": templates["title"][title_idx[i]].format(**fields),
+                     "content": templates["content"][content_idx[i]].format(**fields)})
+    return docs
+
+
+def build_documents(config: dict = None, seed: int = 42, n_synthetic: int = None) -> list:
+    """Документи knowledge base: з config (або базові) + n_synthetic синтезованих; відтворювано для seed."""
+    kb = kb_settings(config)
+    docs = base_documents(kb["documents"])
+    n_synthetic = kb["synthetic_documents"] if n_synthetic is None else n_synthetic
+    if n_synthetic:
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(STREAM_KB,)))
+        docs += synthesize_documents(n_synthetic, rng, first_id=max(doc["id"] for doc in docs) + 1)
+    return docs
+
+
+def load_documents(output_dir: str | Path) -> list | None:
+    path = Path(output_dir) / KB_JSON
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+class KBLinker:
+    """Призначає розмовам ID документів knowledge base з теми їхнього issue_type.
+
+    Для кожної теми документи перемішуються один раз; розмова отримує вікно з k сусідніх
+    документів перемішаного пулу з випадкового початку, тож ID в одному рядку не повторюються.
+    Документи "general" доступні темам без власних документів.
+    """
+
+    def __init__(self, documents: list, k: int = 3, seed: int = 42):
+        self.k = k
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(STREAM_KB, 1)))
+        ids = np.array([doc["id"] for doc in documents], dtype=np.int64)
+        topics = np.array([doc["topic"] for doc in documents], dtype=object)
+        general = rng.permutation(ids[topics == "general"])
+        self.pools = {}
+        for topic in TOPICS:
+            pool = rng.permutation(ids[topics == topic])
+            self.pools[topic] = pool if len(pool) else general
+
+    def link(self, issue_types: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Object-масив рядків "id;id;id" для кожного issue_type."""
+        issue_types = np.asarray(issue_types, dtype=object)
+        out = np.full(len(issue_types), "", dtype=object)
+        for topic, pool in self.pools.items():
+            mask = issue_types == topic
+            if not mask.any() or not len(pool):
+                continue
+            k = min(self.k, len(pool))
+            start = rng.integers(0, len(pool), int(mask.sum()))
+            ids = pool[(start[:, None] + np.arange(k)) % len(pool)].astype(str)
+            joined = ids[:, 0]
+            for j in range(1, k):
+                joined = np.char.add(np.char.add(joined, ";"), ids[:, j])
+            out[mask] = joined.astype(object)
+        return out
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Лексичний індекс: словник, CSR-постинги та статистики BM25 у .npy
+# ──────────────────────────────────────────────────────────────────────────────
+#
+# knowledge_base_index/
+#   terms.npy       відсортовані терми (UTF-8, S<width>) — бінарний пошук np.searchsorted
+#   offsets.npy     int64[V+1]: постинги терму i — [offsets[i], offsets[i+1])
+#   postings.npy    int32: номери документів (0..N−1), за зростанням у межах терму
+#   tf.npy          uint16: частота терму в документі
+#   idf.npy         float32[V]: ln(1 + (N − df + 0.5) / (df + 0.5))
+#   doc_len.npy     int32[N]: довжина документа в токенах
+#   doc_ids.npy     int64[N]: id документа
+#   meta.json       N, avgdl, k1, b, токенізатор
+#
+# Усі масиви відкриваються з mmap_mode="r", тож бенчмарк пошуку стартує без індексації
+# і без читання індексу в пам'ять цілком.
+
+TOKEN_RE = re.compile(r"\w+")
+INDEX_ARRAYS = ("terms", "offsets", "postings", "tf", "idf", "doc_len", "doc_ids")
+
+
+def tokenize(text: str) -> list:
+    return TOKEN_RE.findall(text.lower())
+
+
+def build_index(documents: list, path: str | Path, k1: float = 1.2, b: float = 0.75) -> Path:
+    """Будує knowledge_base_index/ для documents (заголовок + текст)."""
+    path = Path(path)
+    # Директорія пишеться заново, а не поверх: файли можуть бути хардлінками в кеш артефактів
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+
+    # Токени → номери термів через словник (сортування рядків лише для словника, не для всіх токенів)
+    vocab, token_ids, doc_len = {}, [], []
+    for doc in documents:
+        ids = [vocab.setdefault(t, len(vocab)) for t in tokenize(f"{doc['title']} {doc['content']}")]
+        token_ids.extend(ids)
+        doc_len.append(len(ids))
+    n = len(documents)
+    doc_len = np.array(doc_len, dtype=np.int32)
+    terms = np.array(list(vocab), dtype=str)
+    order = np.argsort(terms, kind="stable")
+    rank = np.empty(len(terms), dtype=np.int64)
+    rank[order] = np.arange(len(terms))
+    terms = terms[order]
+    term_of = rank[np.array(token_ids, dtype=np.int64)]
+    doc_of = np.repeat(np.arange(n, dtype=np.int64), doc_len)
+    pairs, tf = np.unique(term_of.astype(np.int64) * n + doc_of, return_counts=True)
+    post_term, postings = np.divmod(pairs, n)
+    df = np.bincount(post_term, minlength=len(terms))
+    offsets = np.concatenate([[0], np.cumsum(df)]).astype(np.int64)
+    arrays = {
+        "terms":    np.char.encode(terms, "utf-8"),
+        "offsets":  offsets,
+        "postings": postings.astype(np.int32),
+        "tf":       np.minimum(tf, np.iinfo(np.uint16).max).astype(np.uint16),
+        "idf":      np.log1p((n - df + 0.5) / (df + 0.5)).astype(np.float32),
+        "doc_len":  doc_len,
+        "doc_ids":  np.array([doc["id"] for doc in documents], dtype=np.int64),
+    }
+    for name, values in arrays.items():
+        np.save(path / f"{name}.npy", values)
+    meta = {"documents": n, "terms": len(terms), "postings": len(postings),
+            "avgdl": float(doc_len.mean()) if n else 0.0, "k1": k1, "b": b, "tokenizer": TOKEN_RE.pattern}
+    (path / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return path
+
+
+class KBIndex:
+    """BM25-пошук по knowledge_base_index/ з масивами, відкритими через mmap."""
+
+    def __init__(self, path: str | Path):
+        path = Path(path)
+        self.meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        for name in INDEX_ARRAYS:
+            setattr(self, name, np.load(path / f"{name}.npy", mmap_mode="r"))
+
+    def __len__(self) -> int:
+        return self.meta["documents"]
+
+    def _term(self, term: str) -> int:
+        key = term.encode("utf-8")
+        i = int(np.searchsorted(self.terms, key))
+        return i if i < len(self.terms) and self.terms[i] == key else -1
+
+    def scores(self, query: str) -> np.ndarray:
+        """BM25-оцінки всіх документів для query (масив довжини N)."""
+        k1, b, avgdl = self.meta["k1"], self.meta["b"], self.meta["avgdl"]
+        scores = np.zeros(len(self), dtype=np.float32)
+        for term in set(tokenize(query)):
+            i = self._term(term)
+            if i < 0:
+                continue
+            start, end = self.offsets[i], self.offsets[i + 1]
+            docs = self.postings[start:end]
+            tf = self.tf[start:end].astype(np.float32)
+            norm = k1 * (1 - b + b * self.doc_len[docs] / avgdl)
+            scores[docs] += self.idf[i] * tf * (k1 + 1) / (tf + norm)
+        return scores
+
+    def search(self, query: str, k: int = 10) -> list:
+        """[(id документа, оцінка)] топ-k за BM25, від найрелевантнішого."""
+        scores = self.scores(query)
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k] if k else np.array([], dtype=np.int64)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        top = top[scores[top] > 0]
+        return [(int(self.doc_ids[i]), float(scores[i])) for i in top]
+
+
+def write_knowledge_base(documents: list, output_dir: str | Path, index: bool = True) -> dict:
+    """knowledge_base.csv / .json (+ knowledge_base_index/); повертає {артефакт: шлях}."""
+    output_dir = Path(output_dir)
+    paths = {"csv": output_dir / KB_CSV, "json": output_dir / KB_JSON}
+    pd.DataFrame(documents, columns=list(DOCUMENT_FIELDS)).to_csv(paths["csv"], index=False)
+    paths["json"].write_text(json.dumps(documents, ensure_ascii=False, indent=2), encoding="utf-8")
+    if index:
+        paths["index"] = build_index(documents, output_dir / KB_INDEX)
+    return paths
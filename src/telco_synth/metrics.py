@@ -0,0 +1,157 @@
+import json
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Метрики запуску по етапах: wall/CPU time, рядки, записані байти, peak RSS
+# ──────────────────────────────────────────────────────────────────────────────
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss: КБ на Linux, байти на macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 2**20 if sys.platform == "darwin" else rss / 2**10
+
+
+def path_bytes(*paths: str | Path) -> int:
+    """Розмір файлів на диску; для директорії (партиції) — сума всіх файлів у ній."""
+    total = 0
+    for path in map(Path, paths):
+        if path.is_dir():
+            total += sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+        elif path.exists():
+            total += path.stat().st_size
+    return total
+
+
+class _Profiler:
+    """cProfile або pyinstrument навколо кожного входу в один етап; результати накопичуються."""
+
+    def __init__(self, kind: str):
+        if kind not in PROFILERS:
+            raise ValueError(f"Невідомий профайлер: {kind!r} (доступні: {', '.join(PROFILERS)})")
+        self.kind = kind
+        if kind == "cprofile":
+            import cProfile
+            self._profiler = cProfile.Profile()
+        else:
+            try:
+                from pyinstrument import Profiler
+            except ImportError as e:
+                raise ImportError("Для --profiler pyinstrument потрібен pyinstrument: pip install pyinstrument") from e
+            self._profiler = Profiler()
+
+    def start(self):
+        if self.kind == "cprofile":
+            self._profiler.enable()
+        else:
+            self._profiler.start()
+
+    def stop(self):
+        if self.kind == "cprofile":
+            self._profiler.disable()
+        else:
+            self._profiler.stop()
+
+    def save(self, path: Path, top: int = 25) -> Path:
+        if self.kind == "cprofile":
+            import pstats
+            path = path.with_suffix(".prof")
+            self._profiler.dump_stats(path)
+            pstats.Stats(self._profiler).sort_stats("cumulative").print_stats(top)
+        else:
+            path = path.with_suffix(".html")
+            path.write_text(self._profiler.output_html(), encoding="utf-8")
+        return path
+
+
+class RunMetrics:
+    """Накопичує метрики по етапах генерації.
+
+    Етап може виконуватися багато разів (по чанку): wall/CPU time, рядки та байти
+    сумуються, peak RSS — максимум ru_maxrss процесу на виході з етапу. CPU time —
+    лише поточного процесу (шарди у worker-процесах сюди не входять).
+    profile_stage (якщо задано) профілюється вибраним профайлером.
+    """
+
+    def __init__(self, profile_stage: str = None, profiler: str = "cprofile"):
+        self.stages = {}
+        self.profile_stage = profile_stage
+        self._profiler = _Profiler(profiler) if profile_stage else None
+        self._started = datetime.now(timezone.utc)
+        self._wall0 = time.perf_counter()
+        self._cpu0 = time.process_time()
+
+    def _stage(self, name: str) -> dict:
+        return self.stages.setdefault(name, {"wall_s": 0.0, "cpu_s": 0.0, "rows": 0, "bytes": 0,
+                                             "peak_rss_mb": 0.0, "calls": 0})
+
+    @contextmanager
+    def stage(self, name: str):
+        """with metrics.stage("tabular") as st: ... st["rows"] += len(df)"""
+        st = self._stage(name)
+        profiling = self._profiler is not None and name == self.profile_stage
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        if profiling:
+            self._profiler.start()
+        try:
+            yield st
+        finally:
+            if profiling:
+                self._profiler.stop()
+            st["wall_s"] += time.perf_counter() - wall0
+            st["cpu_s"] += time.process_time() - cpu0
+            st["peak_rss_mb"] = max(st["peak_rss_mb"], peak_rss_mb())
+            st["calls"] += 1
+
+    def timed(self, name: str, iterable):
+        """Ітерує iterable, зараховуючи час отримання кожного елемента (і його len) до етапу name."""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name) as st:
+                item = next(iterator, None)
+                if item is not None:
+                    st["rows"] += len(item)
+            if item is None:
+                return
+            yield item
+
+    def add_bytes(self, name: str, *paths: str | Path):
+        self._stage(name)["bytes"] += path_bytes(*paths)
+
+    def report(self, **run) -> dict:
+        stages = {name: {k: round(v, 4) if isinstance(v, float) else v for k, v in st.items()}
+                  for name, st in self.stages.items()}
+        return {
+            "run": {
+                "started":     self._started.isoformat(timespec="seconds"),
+                "wall_s":      round(time.perf_counter() - self._wall0, 4),
+                "cpu_s":       round(time.process_time() - self._cpu0, 4),
+                "peak_rss_mb": round(peak_rss_mb(), 1),
+                **run,
+            },
+            "stages": stages,
+        }
+
+    def summary(self) -> str:
+        lines = [f"{'етап':<22}{'wall, s':>10}{'cpu, s':>10}{'рядків':>12}{'байтів':>14}{'peak RSS, MB':>14}"]
+        for name, st in self.stages.items():
+            lines.append(f"{name:<22}{st['wall_s']:>10.2f}{st['cpu_s']:>10.2f}{st['rows']:>12,}"
+                         f"{st['bytes']:>14,}{st['peak_rss_mb']:>14.1f}")
+        return "\n".join(lines)
+
+    def write(self, path: str | Path, **run):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(**run), ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def save_profile(self, output_dir: str | Path) -> Path | None:
+        if self._profiler is None:
+            return None
+        return self._profiler.save(Path(output_dir) / f"profile-{self.profile_stage}")
@@ -0,0 +1,113 @@
+import numpy as np
+
+from .drift import DriftSchedule
+from .ids import customer_ids
+from .tabular import (STREAM_PANEL, _churn_probability, _customer_frame, _draw_addons, _draw_contract,
+                      _draw_customers, _draw_payment, _generation_settings, _monthly_charges, _weighted_choice)
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Панельний режим: одна популяція клієнтів, щомісячні зрізи
+# ──────────────────────────────────────────────────────────────────────────────
+
+# Дефолти секції `panel:` config.yaml
+PANEL_DEFAULTS = {
+    "months":          None,    # None → усі місяці від start_date до end_date
+    "churn_scale":     0.05,    # churn_base (імовірність для одноразового запису) → місячний hazard
+    "join_rate":       0.03,    # нових клієнтів на місяць, частка початкової популяції (× join_factor дрейфу)
+    "internet_switch": 0.02,    # місячні ймовірності змінити інтернет / додаткові послуги /
+    "addon_switch":    0.03,    # контракт / спосіб оплати (нове значення — з розкладу дрейфу)
+    "contract_switch": 0.02,
+    "payment_switch":  0.02,
+}
+
+
+def panel_settings(config: dict = None) -> dict:
+    return {**PANEL_DEFAULTS, **((config or {}).get("panel") or {})}
+
+
+def _panel_months(start_date: str, end_date: str, months: int = None) -> np.ndarray:
+    """Індекси днів (від start_date) перших чисел місяців панелі."""
+    start = np.datetime64(start_date, "D")
+    first, last = start.astype("datetime64[M]"), np.datetime64(end_date, "D").astype("datetime64[M]")
+    months = months or int((last - first).astype(int)) + 1
+    days = ((first + np.arange(months)).astype("datetime64[D]") - start).astype(np.int64)
+    return np.maximum(days, 0)
+
+
+def _advance_panel(state: dict, rng: np.random.Generator, t: dict, ps: dict):
+    """Крок на місяць вперед (на місці): стаж +1 (до 72, як у табличній генерації), TotalCharges +=
+    рахунок за місяць, частина клієнтів змінює послуги, ціни — за поточним розкладом дрейфу."""
+    n = len(state["tenure"])
+    np.minimum(state["tenure"] + 1, 72, out=state["tenure"])
+    state["TotalCharges"] += state["MonthlyCharges"]
+
+    switch = rng.random(n) < ps["internet_switch"]
+    state["InternetService"][switch] = _weighted_choice(
+        rng, [t["dsl_prob"], t["fiber_prob"], t["no_inet_prob"]], int(switch.sum()))
+    # Нові додаткові послуги: після зміни інтернету або самостійно
+    changed = switch | (rng.random(n) < ps["addon_switch"])
+    for col, values in _draw_addons(rng, t, state["InternetService"][changed] != 2).items():
+        state[col][changed] = values
+
+    switch = rng.random(n) < ps["contract_switch"]
+    state["Contract"][switch] = _draw_contract(rng, t, int(switch.sum()))
+    switch = rng.random(n) < ps["payment_switch"]
+    state["PaymentMethod"][switch] = _draw_payment(rng, t, int(switch.sum()))
+
+    state["MonthlyCharges"] = _monthly_charges(state, t).astype(np.float32)
+
+
+def _compact_state(state: dict) -> dict:
+    # Стан панелі: коди int8, tenure int16, ціни float32 (~40 байт на клієнта)
+    state = dict(state)
+    for col in ("MonthlyCharges", "TotalCharges", "price_noise"):
+        state[col] = state[col].astype(np.float32)
+    return state
+
+
+def iter_panel(config: dict = None, customers: int = None, months: int = None,
+               rng: np.random.Generator = None, compact: bool = None):
+    """Лонгітюдна панель: (дата зрізу, DataFrame) для кожного місяця.
+
+    Популяція з `customers` (default generation.samples) клієнтів створюється один раз
+    і щомісяця просувається векторно: стаж і TotalCharges ростуть, частина клієнтів
+    змінює послуги, ціни й нові клієнти — за розкладом дрейфу на перше число місяця.
+    Churn у зрізі — чи піде клієнт цього місяця (місячний hazard = churn_base · churn_scale,
+    churn_base з розкладу місяця); після зрізу вони виходять, а натомість приходять
+    join_rate · customers · join_factor нових (join_factor — крива acquisition, drift.join_growth_rate).
+    customerID стабільний між місяцями (ids.customer_ids від номера клієнта).
+    Стан — struct-of-arrays компактних numpy-масивів, тож 1M клієнтів × 24 місяці
+    обмежені пам'яттю одного зрізу.
+    """
+    s = _generation_settings(config, compact=compact)
+    ps = panel_settings(config)
+    n0 = customers or s["n_samples"]
+    month_days = _panel_months(s["start_date"], s["end_date"], months or ps["months"])
+    rng = rng if rng is not None else np.random.default_rng(
+        np.random.SeedSequence(s["seed"], spawn_key=(STREAM_PANEL,)))
+    table = DriftSchedule(s["drift"], s["start_date"], s["end_date"]).table(int(month_days.max()) + 1)
+    start = np.datetime64(s["start_date"], "D")
+    state, rows, next_row = None, None, n0
+    for m, day in enumerate(month_days):
+        t = {name: values[day] for name, values in table.items()}
+        if state is None:
+            state, rows = _compact_state(_draw_customers(rng, t, n0)), np.arange(n0)
+        else:
+            _advance_panel(state, rng, t, ps)
+            n_join = round(ps["join_rate"] * n0 * t["join_factor"])
+            joined = _compact_state(_draw_customers(rng, t, n_join))
+            joined["tenure"][:] = 0
+            joined["TotalCharges"][:] = 0
+            state = {col: np.concatenate([state[col], joined[col]]) for col in state}
+            rows = np.concatenate([rows, np.arange(next_row, next_row + n_join)])
+            next_row += n_join
+
+        hazard = np.clip(_churn_probability(state, t), 0.0, 1.0) * ps["churn_scale"]
+        state["Churn"] = (rng.random(len(rows)) < hazard).astype(np.int8)
+        snapshot = _customer_frame(state, customer_ids(rows, s["seed"]), start,
+                                   np.full(len(rows), day), s["compact"])
+        yield start + day, snapshot
+
+        stay = state.pop("Churn") == 0
+        state = {col: values[stay] for col, values in state.items()}
+        rows = rows[stay]
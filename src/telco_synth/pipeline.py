@@ -0,0 +1,608 @@
+import json
+from collections import Counter
+from contextlib import ExitStack
+from itertools import cycle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_SIZE_MB, ArtifactCache, cache_key
+from .conversations import generate_conversations
+from .customer_index import build_customer_index, index_path
+from .drift_stats import DriftProfile
+from .knowledge_base import (KB_CSV, KB_INDEX, KB_JSON, KBLinker, build_documents, kb_settings, load_documents,
+                             write_knowledge_base)
+from .metrics import RunMetrics, path_bytes
+from .panel import iter_panel
+from .schema import CONVERSATION_COLUMNS, CUSTOMER_COLUMNS, memory_footprint
+from .sweep import SWEEP_DIR, SWEEP_MANIFEST, iter_sweep, parse_sweep_params, scenario_summary, sweep_scenarios
+from .tabular import (DEFAULT_SHARD_SIZE, REFERENCE_DATE, STREAM_CONVERSATIONS, _generation_settings, _total_days,
+                      iter_tabular_chunks, load_config, shard_seed)
+from .usage import USAGE_FILE, UsageFeatures, UsageWriter, usage_settings
+from .writers import ChunkWriter
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Потоковий запис та статистика по чанках
+# ──────────────────────────────────────────────────────────────────────────────
+
+def record_year(df: pd.DataFrame) -> pd.Series:
+    # datetime64 (компактна схема) або рядок YYYY-MM-DD — без повторного pd.to_datetime
+    dates = df["RecordDate"]
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates.dt.year.rename("Year")
+    return dates.str[:4].astype(int).rename("Year")
+
+
+def churn_counts_by_year(df: pd.DataFrame) -> pd.Series:
+    """Кількість рядків по (Year, Churn) — сумується між чанками через Series.add."""
+    return df.groupby([record_year(df), "Churn"], observed=True).size()
+
+
+def churn_rate_table(counts: pd.Series) -> pd.DataFrame:
+    rates = counts / counts.groupby(level="Year").transform("sum")
+    return rates.unstack().round(3)
+
+
+# Етапи для RunMetrics / --profile
+STAGES = ("tabular", "customers_write", "drift_profile", "conversations", "conversations_write", "knowledge_base",
+          "customer_index", "usage_features", "cache")
+
+# Чанків у черзі фонового запису (writers.ChunkWriter queue_size); 0 — запис в основному потоці
+DEFAULT_WRITER_QUEUE = 4
+
+
+def writer_options(config: dict, args) -> dict:
+    """Стиснення та фоновий запис для ChunkWriter: CLI > generation.* у config.yaml > дефолт."""
+    gen = config.get("generation", {})
+    compression = args.compression or gen.get("compression")
+    return {
+        "compression":         None if compression == "none" else compression,
+        "compression_level":   gen.get("compression_level"),
+        "compression_threads": gen.get("compression_threads"),
+        "queue_size":          gen.get("writer_queue", DEFAULT_WRITER_QUEUE) if args.writer_queue is None
+                               else args.writer_queue,
+    }
+
+
+def usage_options(config: dict, args) -> dict:
+    """Ознаки користування (usage.py): CLI --usage-features/--usage-format > секція usage у config.yaml."""
+    usage = usage_settings(config)
+    if args.usage_features is not None:
+        usage["features"] = args.usage_features
+    if args.usage_format:
+        usage["format"] = args.usage_format
+    return usage
+
+
+def usage_generator(usage: dict, s: dict, output_path: Path, append: bool = False, name: str = USAGE_FILE):
+    """(UsageFeatures, UsageWriter) для налаштувань usage або (None, None), якщо ознаки вимкнено."""
+    if not usage or not usage["features"]:
+        return None, None
+    features = UsageFeatures(usage["features"], s["seed"], s["drift"], s["start_date"], s["end_date"],
+                             usage["window_days"])
+    writer = UsageWriter(output_path, features.columns, usage["format"], append, usage["window_days"], name)
+    return features, writer
+
+
+def close_usage(usage_writer: UsageWriter, metrics: RunMetrics) -> dict:
+    """Закриває UsageWriter; повертає артефакти для кешу {ім'я: хардлінк}."""
+    with metrics.stage("usage_features"):
+        usage_writer.close()
+    metrics.add_bytes("usage_features", usage_writer.path)
+    print(f"Ознаки користування {usage_writer.rows:,} × {len(usage_writer.columns)} float32 → {usage_writer.path}")
+    # Матриця дописується лише через власну копію (_unshare), опис перезаписується на місці
+    return {usage_writer.path.name: True, usage_writer.meta_path.name: False}
+
+
+def write_usage(usage: UsageFeatures, usage_writer: UsageWriter, chunk: pd.DataFrame, shard: int,
+                metrics: RunMetrics):
+    with metrics.stage("usage_features") as st:
+        usage_writer.write(usage.generate(chunk, shard))
+        st["rows"] += len(chunk)
+
+
+# Профіль дрейфу (drift_stats.DriftProfile) поруч з даними: <ім'я>.json або .parquet
+DRIFT_PROFILE = "drift_profile"
+DRIFT_PROFILE_FORMATS = ("json", "parquet")
+
+
+def print_drift_summary(profile: DriftProfile, path: Path, top: int = 5):
+    report = profile.report()
+    if not report["months"]:
+        return
+    last = {feature: entry["psi"][-1] for feature, entry in report["features"].items()}
+    worst = ", ".join(f"{f} {v:.3f}" for f, v in sorted(last.items(), key=lambda kv: -kv[1])[:top])
+    print(f"Профіль дрейфу ({len(report['months'])} міс.) → {path}")
+    print(f"  PSI {report['months'][-1]} vs {report['reference_month']}: {worst}")
+
+
+def write_chunks(chunks, customers_writer: ChunkWriter, conv_writer: ChunkWriter, n_samples: int,
+                 conv_samples: int, seed: int, reference_date: str = REFERENCE_DATE, first_shard: int = 0,
+                 memory_report: bool = False, metrics: RunMetrics = None,
+                 profile: DriftProfile = None, linker: KBLinker = None, usage: UsageFeatures = None,
+                 usage_writer: UsageWriter = None) -> tuple[int, int, DriftProfile]:
+    """Пише чанки клієнтів і розмови до них; повертає (клієнтів, розмов, профіль дрейфу).
+
+    Розмови семплюються з кожного чанку пропорційно до його розміру власним seed шарду,
+    кожен чанк дораховується в profile (новий, якщо не передано); linker — зв'язки розмов з knowledge base;
+    usage — ознаки користування чанку в usage_writer (рядок у рядок з клієнтами).
+    Час кожного етапу (генерація, запис, профіль дрейфу, розмови) накопичується в metrics.
+    """
+    metrics = metrics or RunMetrics()
+    profile = profile if profile is not None else DriftProfile()
+    rows_done = conv_done = 0
+    for i, chunk in enumerate(metrics.timed("tabular", chunks)):
+        with metrics.stage("customers_write") as st:
+            customers_writer.write(chunk)
+            st["rows"] += len(chunk)
+        if memory_report and i == 0:
+            print(f"\nПам'ять першого чанку ({len(chunk):,} рядків) по колонках:")
+            print(memory_footprint(chunk).to_string())
+        with metrics.stage("drift_profile") as st:
+            profile.update(chunk)
+            st["rows"] += len(chunk)
+        if usage is not None:
+            write_usage(usage, usage_writer, chunk, first_shard + i, metrics)
+
+        rows_done += len(chunk)
+        n_conv = conv_samples * rows_done // n_samples - conv_done
+        if n_conv:
+            with metrics.stage("conversations") as st:
+                conv_rng = np.random.default_rng(shard_seed(seed, first_shard + i, STREAM_CONVERSATIONS))
+                df_conversations = generate_conversations(chunk, n_conv, conv_rng, reference_date, linker)
+                st["rows"] += n_conv
+            with metrics.stage("conversations_write") as st:
+                conv_writer.write(df_conversations)
+                st["rows"] += n_conv
+            conv_done += n_conv
+        print(f"  … {rows_done:,}/{n_samples:,} клієнтів, {conv_done:,} розмов")
+    return rows_done, conv_done, profile
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Стан генерації для інкрементального дозапису (--append-from / --until)
+# ──────────────────────────────────────────────────────────────────────────────
+
+STATE_FILE = "generation_state.json"
+
+
+def save_state(output_dir: str | Path, state: dict):
+    with open(Path(output_dir) / STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+
+
+def load_state(output_dir: str | Path) -> dict:
+    path = Path(output_dir) / STATE_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"Немає {STATE_FILE} у {output_dir} — дозапис можливий лише до даних, "
+                                "згенерованих цим скриптом")
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def append_window(state: dict, until: str) -> dict:
+    """Вікно генерації для iter_tabular_chunks: дні після state["last_date"] до until включно.
+
+    progress рахується від початку дрейф-періоду (start_date..end_date), тож тренди
+    продовжуються після end_date. Нові шарди, номери рядків і сегмент календаря
+    продовжують лічильники зі стану — "стан RNG" це (seed, next_shard, segments).
+    """
+    first_day = _total_days(state["start_date"], state["last_date"]) + 1
+    last_day = _total_days(state["start_date"], until)
+    if last_day < first_day:
+        raise ValueError(f"--until {until} має бути пізніше за останню дату датасету {state['last_date']}")
+    return {
+        "n_samples":   round(state["rows_per_day"] * (last_day - first_day + 1)),
+        "first_day":   first_day,
+        "last_day":    last_day,
+        "first_shard": state["next_shard"],
+        "row_offset":  state["rows"],
+        "segment":     state["segments"],
+    }
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Головний запуск (cli.main → run)
+# ──────────────────────────────────────────────────────────────────────────────
+
+def generate_knowledge_base(output_dir: str | Path, documents: list = None, index: bool = True) -> dict:
+    """knowledge_base.csv / .json та індекс BM25 knowledge_base_index/ (documents — з build_documents)."""
+    documents = documents if documents is not None else build_documents()
+    paths = write_knowledge_base(documents, output_dir, index=index)
+    print(f"Knowledge base збережено: {paths['csv']} та {paths['json']} ({len(documents):,} документів)"
+          + (f", індекс → {paths['index']}" if index else ""))
+    return paths
+
+
+def run(args):
+    """Повний запуск CLI (args — argparse.Namespace з cli.build_parser): клієнти, розмови, knowledge base,
+    профіль дрейфу, кеш; --append-from, --panel та --sweep делегуються append_dataset / panel_dataset /
+    sweep_dataset."""
+    metrics = RunMetrics(args.profile, args.profiler)
+    if args.append_from:
+        report_metrics(metrics, args, Path(args.append_from), **append_dataset(args, metrics))
+        return
+
+    config = load_config(args.config)
+
+    # Пріоритет: CLI > config.yaml > дефолт
+    n_samples    = args.samples    or config.get("generation", {}).get("samples", 50000)
+    conv_samples = args.conv_samples or config.get("generation", {}).get("conv_samples", 7500)
+    output_dir   = args.output_dir or config.get("generation", {}).get("output_dir", "data")
+
+    config.setdefault("generation", {})["samples"] = n_samples
+    if args.engine:
+        config["generation"]["engine"] = args.engine
+    if args.compact:
+        config["generation"]["compact"] = True
+    if args.customer_index:
+        config["generation"]["customer_index"] = True
+    with_index = config["generation"].get("customer_index", False)
+
+    output_path = Path(output_dir)
+    output_path.mkdir(exist_ok=True, parents=True)
+
+    if args.panel:
+        report_metrics(metrics, args, output_path, **panel_dataset(args, config, output_path, metrics))
+        return
+    if args.sweep:
+        report_metrics(metrics, args, output_path, **sweep_dataset(args, config, output_path, metrics))
+        return
+
+    print(f"Генерація: {n_samples:,} клієнтів + {conv_samples:,} розмов → {output_path}")
+
+    s = _generation_settings(config)
+    seed = s["seed"]
+    reference_date = args.reference_date or config["generation"].get("reference_date", REFERENCE_DATE)
+    # Завжди шарди по chunk_size (DEFAULT_SHARD_SIZE): --workers 1 генерує ту саму послідовність шардів
+    # у своєму процесі, тож результат, ключ кешу й стан не залежать від кількості воркерів
+    chunk_size = args.chunk_size or DEFAULT_SHARD_SIZE
+    kb = kb_settings(config)
+    if args.kb_docs is not None:
+        kb["synthetic_documents"] = args.kb_docs
+    output = writer_options(config, args)
+    if with_index and args.format == "csv" and output["compression"]:
+        raise ValueError("Індекс customerID потребує нестиснутого CSV (або --format parquet/arrow)")
+    usage = usage_options(config, args)
+
+    # 0. Кеш: той самий ключ (ефективні налаштування + seed + версія генератора) → ті самі артефакти
+    cache_cfg = config.get("cache", {})
+    cache = None
+    if not args.no_cache and cache_cfg.get("enabled", True):
+        cache = ArtifactCache(args.cache_dir or cache_cfg.get("dir", DEFAULT_CACHE_DIR),
+                              args.cache_max_mb or cache_cfg.get("max_size_mb", DEFAULT_MAX_SIZE_MB))
+        cache_settings = {**s, "conv_samples": conv_samples, "reference_date": reference_date,
+                          "format": args.format, "partition_by_month": args.partition_by_month,
+                          "chunk_size": chunk_size, "drift_profile": args.drift_profile, "knowledge_base": kb,
+                          "customer_index": with_index, "compression": output["compression"],
+                          "compression_level": output["compression_level"], "usage": usage}
+        key = cache_key(cache_settings)
+        with metrics.stage("cache"):
+            restored = cache.restore(key, output_path)
+        if restored:
+            print(f"Кеш: артефакти {key[:12]} відновлено з {cache.dir} → {output_path} (--no-cache для перегенерації)")
+            report_metrics(metrics, args, output_path, samples=n_samples, conv_samples=conv_samples,
+                           engine=s["engine"], format=args.format, cache_key=key, cache_hit=True)
+            return
+
+    # Форматування, стиснення й запис — у фонових потоках з обмеженими чергами (writer_options);
+    # ExitStack закриває writer-и і при помилці посеред етапу: фоновий потік дописує чергу, у файлу є кінець
+    with ExitStack() as stack:
+        customers_writer = stack.enter_context(ChunkWriter(output_path / "telco_customers", CUSTOMER_COLUMNS,
+                                                           args.format, args.partition_by_month, **output))
+        conv_writer = stack.enter_context(ChunkWriter(output_path / "support_conversations", CONVERSATION_COLUMNS,
+                                                      args.format, args.partition_by_month, **output))
+        customers_path, conv_path = customers_writer.path, conv_writer.path
+        profile_path = output_path / f"{DRIFT_PROFILE}.{args.drift_profile}"
+        features, usage_writer = usage_generator(usage, s, output_path)
+        if usage_writer is not None:
+            stack.enter_context(usage_writer)
+
+        # Документи knowledge base потрібні до розмов: кожна розмова посилається на документи своєї теми
+        documents, linker = None, None
+        if kb["enabled"]:
+            with metrics.stage("knowledge_base"):
+                documents = build_documents({"knowledge_base": kb}, seed)
+                linker = KBLinker(documents, kb["links_per_conversation"], seed)
+
+        # 1+2. Потоковий режим: кожен чанк (шард) клієнтів одразу дописується у файл,
+        # розмови семплюються з чанку пропорційно до його розміру власним seed шарду
+        chunks = iter_tabular_chunks(config, chunk_size, workers=args.workers)
+        rows_done, conv_done, profile = write_chunks(chunks, customers_writer, conv_writer, n_samples,
+                                                     conv_samples, seed, reference_date,
+                                                     memory_report=args.memory_report, metrics=metrics,
+                                                     linker=linker, usage=features, usage_writer=usage_writer)
+        next_shard = -(-n_samples // chunk_size)
+
+        print(f"Збережено {rows_done:,} клієнтів → {customers_path}")
+        print("\nChurn rate по роках:")
+        print(churn_rate_table(profile.churn_counts_by_year()))
+        print(f"Згенеровано та збережено {conv_done:,} розмов → {conv_path}")
+
+        with metrics.stage("customers_write"):
+            customers_writer.close()
+        with metrics.stage("conversations_write"):
+            conv_writer.close()
+        metrics.add_bytes("customers_write", customers_path)
+        metrics.add_bytes("conversations_write", conv_path)
+        usage_artifacts = close_usage(usage_writer, metrics) if usage_writer is not None else {}
+    with metrics.stage("drift_profile"):
+        profile.write(profile_path)
+    metrics.add_bytes("drift_profile", profile_path)
+    print_drift_summary(profile, profile_path)
+
+    index_artifacts = {}
+    if with_index:
+        idx_path = write_customer_index(customers_path, metrics)
+        # Індекс пишеться заново цілком (не поверх файлів), тож його можна хардлінкувати
+        index_artifacts = {idx_path.name: True}
+
+    save_state(output_path, {
+        "start_date":         s["start_date"],
+        "end_date":           s["end_date"],
+        "last_date":          s["end_date"],
+        "seed":               seed,
+        "engine":             s["engine"],
+        "compact":            s["compact"],
+        "drift":              s["drift"],
+        "rows":               rows_done,
+        "conversations":      conv_done,
+        "next_shard":         next_shard,
+        "segments":           1,
+        "rows_per_day":       n_samples / (_total_days(s["start_date"], s["end_date"]) + 1),
+        "conv_per_row":       conv_samples / n_samples,
+        "chunk_size":         chunk_size,
+        "format":             args.format,
+        "partition_by_month": args.partition_by_month,
+        "reference_date":     reference_date,
+        "drift_profile":      profile_path.name,
+        "kb_links":           kb["links_per_conversation"] if kb["enabled"] else 0,
+        "customer_index":     with_index,
+        "compression":        output["compression"],
+        "compression_level":  output["compression_level"],
+        "usage":              usage if features is not None else None,
+    })
+
+    # 3. Knowledge base
+    kb_artifacts = {}
+    if documents is not None:
+        print("\nГенерація knowledge base...")
+        with metrics.stage("knowledge_base"):
+            generate_knowledge_base(output_path, documents, index=kb["index"])
+        # Індекс пишеться заново цілком (не поверх файлів), тож його можна хардлінкувати
+        kb_artifacts = {KB_CSV: False, KB_JSON: False, **({KB_INDEX: True} if kb["index"] else {})}
+        metrics.add_bytes("knowledge_base", *(output_path / name for name in kb_artifacts))
+
+    if cache is not None:
+        # Великі артефакти хардлінкуються, дрібні (перезаписуються на місці) копіюються
+        with metrics.stage("cache"):
+            cache.store(key, output_path, {customers_path.name: True, conv_path.name: True, **kb_artifacts,
+                                           **index_artifacts, **usage_artifacts, profile_path.name: False,
+                                           STATE_FILE: False},
+                        cache_settings)
+        print(f"Кеш: артефакти збережено як {key[:12]} у {cache.dir}")
+
+    print("\nГотово! Дані підготовлені для MLOps / LLMOps демо.")
+    report_metrics(metrics, args, output_path, samples=n_samples, conv_samples=conv_samples,
+                   engine=s["engine"], format=args.format,
+                   **({"cache_key": key, "cache_hit": False} if cache is not None else {}))
+
+
+def write_customer_index(customers_path: Path, metrics: RunMetrics) -> Path:
+    """Перебудовує індекс customerID для артефакту клієнтів (після запису або дозапису)."""
+    with metrics.stage("customer_index") as st:
+        idx_path = build_customer_index(customers_path)
+        st["rows"] += len(np.load(idx_path / "keys.npy", mmap_mode="r"))
+    metrics.add_bytes("customer_index", idx_path)
+    print(f"Індекс customerID → {idx_path}")
+    return idx_path
+
+
+def report_metrics(metrics: RunMetrics, args, output_path: Path, **run):
+    """--profile: підсумок по етапах і файл профайлера; --metrics-out: JSON для моніторингу запусків."""
+    if args.profile:
+        print("\nМетрики по етапах:")
+        print(metrics.summary())
+        profile_path = metrics.save_profile(output_path)
+        print(f"Профіль етапу {args.profile} → {profile_path}")
+    if args.metrics_out:
+        metrics.write(args.metrics_out, workers=args.workers, chunk_size=args.chunk_size,
+                      append_from=args.append_from, **run)
+        print(f"Метрики → {args.metrics_out}")
+
+
+def panel_dataset(args, config: dict, output_path: Path, metrics: RunMetrics = None) -> dict:
+    """--panel: щомісячні зрізи однієї популяції клієнтів → telco_panel (формат і партиції як у клієнтів).
+
+    Кожен зріз пишеться одразу, тож у пам'яті лише стан популяції та поточний місяць.
+    Повертає параметри запуску для метрик.
+    """
+    metrics = metrics or RunMetrics()
+    n_samples = config["generation"]["samples"]
+    writer = ChunkWriter(output_path / "telco_panel", CUSTOMER_COLUMNS, args.format, args.partition_by_month,
+                         **writer_options(config, args))
+    profile, profile_path = DriftProfile(), output_path / f"panel_{DRIFT_PROFILE}.{args.drift_profile}"
+    # Ознаки користування зрізу місяця m — з шарду m, рядок у рядок з telco_panel
+    features, usage_writer = usage_generator(usage_options(config, args), _generation_settings(config), output_path,
+                                             name=f"panel_{USAGE_FILE}")
+    print(f"Панель: {n_samples:,} клієнтів щомісяця → {writer.path}")
+
+    months, rows_done, churned = 0, 0, 0
+    with writer:
+        for snapshot in metrics.timed("tabular", (frame for _, frame in iter_panel(config, months=args.months))):
+            with metrics.stage("customers_write") as st:
+                writer.write(snapshot)
+                st["rows"] += len(snapshot)
+            with metrics.stage("drift_profile") as st:
+                profile.update(snapshot)
+                st["rows"] += len(snapshot)
+            if features is not None:
+                write_usage(features, usage_writer, snapshot, months, metrics)
+            months += 1
+            rows_done += len(snapshot)
+            churned += int((snapshot["Churn"] == "Yes").sum())
+            print(f"  {str(snapshot['RecordDate'].iloc[0])[:7]}: {len(snapshot):,} клієнтів, "
+                  f"churn {(snapshot['Churn'] == 'Yes').mean():.2%}")
+    metrics.add_bytes("customers_write", writer.path)
+    if usage_writer is not None:
+        close_usage(usage_writer, metrics)
+
+    print(f"Збережено {months} місяців, {rows_done:,} рядків ({churned:,} відтоків) → {writer.path}")
+    with metrics.stage("drift_profile"):
+        profile.write(profile_path)
+    metrics.add_bytes("drift_profile", profile_path)
+    print_drift_summary(profile, profile_path)
+    return {"samples": n_samples, "months": months, "rows": rows_done, "format": args.format, "panel": True}
+
+
+def sweep_dataset(args, config: dict, output_path: Path, metrics: RunMetrics = None) -> dict:
+    """--sweep: датасет клієнтів на кожен сценарій дрейфу → sweep/<ім'я>/telco_customers + sweep_manifest.json.
+
+    Сценарії — секція sweep у config.yaml або --sweep-param (замінює її grid). Усі сценарії шарду
+    генеруються на тих самих випадкових числах (sweep.CommonDraws) і пишуться одразу.
+    Повертає параметри запуску для метрик.
+    """
+    metrics = metrics or RunMetrics()
+    sweep = {"grid": parse_sweep_params(args.sweep_param)} if args.sweep_param else config.get("sweep")
+    scenarios = sweep_scenarios(sweep)
+    n_samples = config["generation"]["samples"]
+    chunk_size = args.chunk_size or DEFAULT_SHARD_SIZE
+    output = writer_options(config, args)
+    sweep_path = output_path / SWEEP_DIR
+    print(f"Sweep: {len(scenarios)} сценаріїв × {n_samples:,} клієнтів на спільних випадкових числах → {sweep_path}")
+
+    counts = {name: Counter() for name, _ in scenarios}
+    with ExitStack() as stack:
+        writers = {}
+        for name, _ in scenarios:
+            (sweep_path / name).mkdir(parents=True, exist_ok=True)
+            writers[name] = stack.enter_context(ChunkWriter(sweep_path / name / "telco_customers", CUSTOMER_COLUMNS,
+                                                            args.format, args.partition_by_month, **output))
+        # iter_sweep видає чанки сценаріїв шарду в порядку scenarios
+        chunks = metrics.timed("tabular", (chunk for _, chunk in iter_sweep(config, scenarios, chunk_size)))
+        for name, chunk in zip(cycle(writers), chunks):
+            with metrics.stage("customers_write") as st:
+                writers[name].write(chunk)
+                st["rows"] += len(chunk)
+            counts[name].update(scenario_summary(chunk))
+    metrics.add_bytes("customers_write", *(writer.path for writer in writers.values()))
+
+    s = _generation_settings(config, engine="numpy")
+    manifest = {
+        "seed":                   s["seed"],
+        "samples":                n_samples,
+        "start_date":             s["start_date"],
+        "end_date":               s["end_date"],
+        "chunk_size":             chunk_size,
+        "format":                 args.format,
+        "partition_by_month":     args.partition_by_month,
+        "compression":            output["compression"],
+        "common_random_numbers":  True,
+        "base_drift":             s["drift"],
+        "scenarios": [{
+            "name":        name,
+            "drift":       override,
+            "path":        str(writers[name].path.relative_to(output_path)),
+            "rows":        counts[name]["rows"],
+            "churn_rate":  round(counts[name]["churn"] / max(counts[name]["rows"], 1), 4),
+            "fiber_share": round(counts[name]["fiber"] / max(counts[name]["rows"], 1), 4),
+        } for name, override in scenarios],
+    }
+    manifest_path = output_path / SWEEP_MANIFEST
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    for entry in manifest["scenarios"]:
+        overrides = ", ".join(f"{k}={v}" for k, v in entry["drift"].items()) or "базовий drift"
+        print(f"  {entry['name']}: {overrides} — churn {entry['churn_rate']:.2%}, fiber {entry['fiber_share']:.2%}"
+              f" → {entry['path']}")
+    print(f"Маніфест sweep → {manifest_path}")
+    return {"samples": n_samples, "scenarios": len(scenarios), "rows": n_samples * len(scenarios),
+            "engine": "numpy", "format": args.format, "sweep": True}
+
+
+def append_dataset(args, metrics: RunMetrics = None) -> dict:
+    """--append-from DIR --until DATE: дописує дні після останньої дати датасету в DIR.
+
+    Параметри (seed, engine, drift, формат, темп записів на день) беруться з STATE_FILE,
+    а не з config.yaml, тож продовження узгоджене з уже згенерованими даними.
+    Повертає параметри дозапису для метрик.
+    """
+    metrics = metrics or RunMetrics()
+    if not args.until:
+        raise SystemExit("--append-from потребує --until YYYY-MM-DD")
+    output_path = Path(args.append_from)
+    state = load_state(output_path)
+    window = append_window(state, args.until)
+    n_new = window["n_samples"]
+    conv_new = round(state["conv_per_row"] * n_new)
+    print(f"Дозапис: {state['last_date']} → {args.until}: {n_new:,} клієнтів + {conv_new:,} розмов → {output_path}")
+
+    config = {
+        "generation": {"start_date": state["start_date"], "end_date": state["end_date"],
+                       "seed": state["seed"], "engine": state["engine"], "compact": state["compact"]},
+        "drift": state["drift"],
+    }
+    chunk_size = args.chunk_size or state["chunk_size"] or DEFAULT_SHARD_SIZE
+    fmt, partition_by_month = state["format"], state["partition_by_month"]
+    # Стиснення — як у наявних артефактів; черга та потоки — з CLI / дефолтів
+    output = {**writer_options({}, args), "compression": state.get("compression"),
+              "compression_level": state.get("compression_level")}
+    # Нові розмови посилаються на вже згенеровану knowledge base з DIR
+    documents = load_documents(output_path) if state.get("kb_links") else None
+    linker = KBLinker(documents, state["kb_links"], state["seed"]) if documents else None
+    # Ознаки користування продовжують матрицю з тими ж колонками й seed (шарди — як у клієнтів)
+    features, usage_writer = usage_generator(state.get("usage"), {**config["generation"], "drift": state["drift"]},
+                                             output_path, append=True)
+    usage_bytes = path_bytes(usage_writer.path) if usage_writer is not None else 0
+    with ChunkWriter(output_path / "telco_customers", CUSTOMER_COLUMNS, fmt, partition_by_month,
+                     append=True, segment=state["segments"], **output) as customers_writer, \
+         ChunkWriter(output_path / "support_conversations", CONVERSATION_COLUMNS, fmt, partition_by_month,
+                     append=True, segment=state["segments"], **output) as conv_writer:
+        customers_bytes, conv_bytes = path_bytes(customers_writer.path), path_bytes(conv_writer.path)
+        chunks = iter_tabular_chunks(config, chunk_size, workers=args.workers, window=window)
+        rows_done, conv_done, profile = write_chunks(chunks, customers_writer, conv_writer, n_new, conv_new,
+                                                     state["seed"], state["reference_date"],
+                                                     first_shard=window["first_shard"],
+                                                     memory_report=args.memory_report, metrics=metrics,
+                                                     linker=linker, usage=features, usage_writer=usage_writer)
+
+    # Байти, дописані цим запуском
+    metrics.add_bytes("customers_write", customers_writer.path)
+    metrics.add_bytes("conversations_write", conv_writer.path)
+    metrics.stages["customers_write"]["bytes"] -= customers_bytes
+    metrics.stages["conversations_write"]["bytes"] -= conv_bytes
+
+    print(f"Дописано {rows_done:,} клієнтів → {customers_writer.path}")
+    if profile.months:
+        print("\nChurn rate по роках (нові записи):")
+        print(churn_rate_table(profile.churn_counts_by_year()))
+    print(f"Дописано {conv_done:,} розмов → {conv_writer.path}")
+    if usage_writer is not None:
+        close_usage(usage_writer, metrics)
+        metrics.stages["usage_features"]["bytes"] -= usage_bytes
+
+    # Профіль дрейфу продовжується: лічильники нових записів додаються до збережених
+    profile_path = output_path / state.get("drift_profile", f"{DRIFT_PROFILE}.json")
+    with metrics.stage("drift_profile"):
+        if profile_path.exists():
+            profile = DriftProfile.load(profile_path).merge(profile)
+        profile.write(profile_path)
+    print_drift_summary(profile, profile_path)
+
+    if state.get("customer_index") or index_path(customers_writer.path).exists():
+        write_customer_index(customers_writer.path, metrics)
+        state["customer_index"] = True
+
+    state.update({
+        "last_date":     args.until,
+        "rows":          state["rows"] + rows_done,
+        "conversations": state["conversations"] + conv_done,
+        "next_shard":    window["first_shard"] + -(-n_new // chunk_size),
+        "segments":      state["segments"] + 1,
+        "drift_profile": profile_path.name,
+    })
+    save_state(output_path, state)
+    return {"samples": rows_done, "conv_samples": conv_done, "engine": state["engine"], "format": fmt,
+            "until": args.until}
@@ -0,0 +1,76 @@
+import pandas as pd
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Схема згенерованих таблиць: порядок колонок, фіксовані категорії, компактні типи
+# ──────────────────────────────────────────────────────────────────────────────
+
+CUSTOMER_COLUMNS = [
+    "customerID", "gender", "SeniorCitizen", "Partner", "Dependents", "tenure", "PhoneService",
+    "MultipleLines", "InternetService", "OnlineSecurity", "OnlineBackup", "DeviceProtection",
+    "TechSupport", "StreamingTV", "StreamingMovies", "Contract", "PaperlessBilling",
+    "PaymentMethod", "MonthlyCharges", "TotalCharges", "Churn", "RecordDate",
+]
+
+ADDON_COLUMNS = ["OnlineSecurity", "OnlineBackup", "DeviceProtection",
+                 "TechSupport", "StreamingTV", "StreamingMovies"]
+
+CONVERSATION_COLUMNS = ["customerID", "issue_type", "complaint", "resolution", "kb_doc_ids", "RecordDate"]
+
+YES_NO_LEVELS = ["No", "Yes"]
+ADDON_LEVELS = ["No", "Yes", "No internet service"]
+
+# Порядок категорій = коди, які використовує numpy-рушій (labels[codes])
+CATEGORY_LEVELS = {
+    "gender":           ["Male", "Female"],
+    "Partner":          YES_NO_LEVELS,
+    "Dependents":       YES_NO_LEVELS,
+    "PhoneService":     YES_NO_LEVELS,
+    "MultipleLines":    ["No", "Yes", "No phone service"],
+    "InternetService":  ["DSL", "Fiber optic", "No"],
+    **{col: ADDON_LEVELS for col in ADDON_COLUMNS},
+    "Contract":         ["Month-to-month", "One year", "Two year"],
+    "PaperlessBilling": YES_NO_LEVELS,
+    "PaymentMethod":    ["Electronic check", "Mailed check",
+                         "Bank transfer (automatic)", "Credit card (automatic)"],
+    "Churn":            YES_NO_LEVELS,
+    "issue_type":       ["billing_high", "service_slow", "service_outage",
+                         "contract_confusion", "want_to_cancel"],
+}
+
+# Компактні числові типи (numpy dtype name)
+COMPACT_DTYPES = {
+    "SeniorCitizen":  "int8",
+    "tenure":         "int16",
+    "MonthlyCharges": "float32",
+    "TotalCharges":   "float32",
+}
+
+DATE_COLUMNS = ["RecordDate"]
+
+
+def to_compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Компактна схема: Categorical з фіксованим порядком категорій, int8/int16, float32,
+    datetime64 для RecordDate. Колонки поза схемою (customerID, тексти) не змінюються."""
+    out = {}
+    for col in df.columns:
+        values = df[col]
+        if col in CATEGORY_LEVELS:
+            values = values.astype(pd.CategoricalDtype(CATEGORY_LEVELS[col]))
+        elif col in COMPACT_DTYPES:
+            values = values.astype(COMPACT_DTYPES[col])
+        elif col in DATE_COLUMNS and not pd.api.types.is_datetime64_any_dtype(values):
+            values = pd.to_datetime(values, format="%Y-%m-%d").astype("datetime64[s]")
+        out[col] = values
+    return pd.DataFrame(out, index=df.index)
+
+
+def memory_footprint(df: pd.DataFrame) -> pd.DataFrame:
+    """Пам'ять по колонках (deep=True): dtype, байти та байти на рядок."""
+    usage = df.memory_usage(deep=True, index=False)
+    report = pd.DataFrame({
+        "dtype": df.dtypes.astype(str),
+        "bytes": usage,
+        "bytes_per_row": (usage / max(len(df), 1)).round(2),
+    })
+    report.loc["TOTAL"] = ["", usage.sum(), round(usage.sum() / max(len(df), 1), 2)]
+    return report
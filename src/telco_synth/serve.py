@@ -0,0 +1,427 @@
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from .conversations import generate_conversations
+from .knowledge_base import KBLinker, build_documents, kb_settings
+from .tabular import REFERENCE_DATE, _generation_settings, generate_tabular_numpy, load_config, shard_seed
+
+# ──────────────────────────────────────────────────────────────────────────────
+# serve: локальний asyncio HTTP-сервер, що транслює клієнтів і розмови як NDJSON / SSE
+# ──────────────────────────────────────────────────────────────────────────────
+#
+# Один генератор (та сама векторна логіка, що й generate_tabular_numpy / generate_conversations)
+# випускає батчі з цільовою швидкістю rate записів/с, а подієвий час іде в speedup разів
+# швидше за реальний: за замовчуванням день дрейфу на секунду, тож 2023–2024 програються
+# за ~12 хвилин. Кожен батч кодується один раз на формат і розсилається всім клієнтам через
+# обмежені черги: повільний клієнт або пропускає батчі (slow_client="drop", у потоці
+# з'являється запис {"type": "gap"}), або пригальмовує весь потік ("block"). Лише stdlib
+# asyncio, без мережі поза сокетом сервера.
+#
+#   GET /stream         клієнти й розмови разом ("type": "customer" | "conversation")
+#   GET /customers      лише клієнти
+#   GET /conversations  лише розмови
+#   GET /stats          стан сервера (JSON)
+#   ?format=sse (або Accept: text/event-stream) — Server-Sent Events замість NDJSON; ?limit=N — закрити після N записів
+
+STREAM_SERVE = 6                        # продовжує STREAM_* з tabular
+SERVE_BLOCK = 1024                      # рядків у блоці з власним seed; батчі нарізаються з блоків
+
+TICK_S = 0.05                           # період пакування батчів
+MAX_LAG_S = 1.0                         # відставання від графіка, після якого темп не наздоганяється
+ENDPOINTS = {"/stream": ("customer", "conversation"), "/customers": ("customer",),
+             "/conversations": ("conversation",)}
+CONTENT_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+SLOW_CLIENT_POLICIES = ("drop", "block")
+
+_RATE_RE = re.compile(r"^\s*([\d.]+)\s*([kKmM]?)\s*(?:/\s*(s|sec|m|min|h))?\s*$")
+
+
+def parse_rate(text: str) -> float:
+    """"20000/s", "5k/s", "1.2M/min", "300" → записів на секунду."""
+    match = _RATE_RE.match(str(text))
+    if not match:
+        raise argparse.ArgumentTypeError(f"Некоректна швидкість: {text!r} (приклади: 20000/s, 5k/s, 1M/min)")
+    value, scale, unit = match.groups()
+    value = float(value) * {"": 1, "k": 1e3, "K": 1e3, "m": 1e6, "M": 1e6}[scale]
+    rate = value / {None: 1, "s": 1, "sec": 1, "m": 60, "min": 60, "h": 3600}[unit]
+    if rate <= 0:
+        raise argparse.ArgumentTypeError("Швидкість має бути > 0")
+    return rate
+
+
+class RecordFeed:
+    """Джерело батчів: рядок k має подієвий час start + k / rate · speedup секунд.
+
+    Дні рядків (і отже дрейф) визначаються подієвим часом, customerID — глобальним номером
+    рядка. Решта полів генерується фіксованими блоками по SERVE_BLOCK рядків: блок b тягне
+    клієнтів, а потім розмови до них з shard_seed(seed, b, STREAM_SERVE), як шарди tabular;
+    next_batch лише нарізає блоки. Тож потік відтворюваний для seed і не залежить від того,
+    як його нарізано на батчі (розмови блоку виходять разом з його останнім клієнтом).
+    """
+
+    def __init__(self, config: dict, rate: float, speedup: float, until: str = None,
+                 conv_ratio: float = None, reference_date: str = None):
+        s = _generation_settings(config)
+        gen = config.get("generation", {})
+        self.settings = s
+        self.rate, self.speedup = rate, speedup
+        self.start = np.datetime64(s["start_date"], "s")
+        self.end = np.datetime64(until or s["end_date"], "D") + np.timedelta64(1, "D")
+        self.conv_ratio = conv_ratio if conv_ratio is not None else (
+            gen.get("conv_samples", 7500) / gen.get("samples", 50000))
+        self.reference_date = reference_date or gen.get("reference_date", REFERENCE_DATE)
+        kb = kb_settings(config)
+        self.linker = (KBLinker(build_documents(config, s["seed"]), kb["links_per_conversation"], s["seed"])
+                       if kb["enabled"] else None)
+        self.rows = self.conversations = 0
+        self._block = (-1, None, None)
+        # Останній рядок, подієвий час якого ще до кінця періоду
+        self.total_rows = int(np.ceil((self.end - self.start).astype(np.int64) * rate / speedup))
+
+    @property
+    def done(self) -> bool:
+        return self.rows >= self.total_rows
+
+    def event_time(self, rows: np.ndarray) -> np.ndarray:
+        seconds = (rows / self.rate * self.speedup).astype(np.int64)
+        return self.start + seconds.astype("timedelta64[s]")
+
+    def block(self, b: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Клієнти блоку b (рядки b · SERVE_BLOCK ...) і розмови до них; поля type та event_time — першими."""
+        first = b * SERVE_BLOCK
+        n = min(SERVE_BLOCK, self.total_rows - first)
+        times = self.event_time(first + np.arange(n))
+        days = ((times - self.start) // np.timedelta64(1, "D")).astype(np.int64)
+        s = self.settings
+        rng = np.random.default_rng(shard_seed(s["seed"], b, STREAM_SERVE))
+        customers = generate_tabular_numpy(n, s["start_date"], s["end_date"], s["drift"], rng,
+                                           days=days, first_row=first, id_seed=s["seed"])
+        customers.insert(0, "event_time", np.datetime_as_string(times, unit="s"))
+        customers.insert(0, "type", "customer")
+
+        n_conv = int(self.conv_ratio * (first + n)) - int(self.conv_ratio * first)
+        conversations = generate_conversations(customers, n_conv, rng, self.reference_date, self.linker)
+        conversations.insert(0, "event_time", np.datetime_as_string(times[-1:], unit="s")[0] if n else "")
+        conversations.insert(0, "type", "conversation")
+        return customers, conversations
+
+    def next_batch(self, n: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Наступні n клієнтів (менше в кінці періоду) і розмови блоків, що в них закінчились."""
+        end = self.rows + max(0, min(n, self.total_rows - self.rows))
+        customers, conversations = [], []
+        while True:
+            b = self.rows // SERVE_BLOCK
+            if self._block[0] != b:
+                self._block = (b, *self.block(b))
+            _, block_customers, block_conversations = self._block
+            lo = self.rows - b * SERVE_BLOCK
+            hi = min(end - b * SERVE_BLOCK, len(block_customers))
+            customers.append(block_customers.iloc[lo:hi])
+            self.rows += hi - lo
+            if hi == len(block_customers) and hi > lo:
+                conversations.append(block_conversations)
+                self.conversations += len(block_conversations)
+            if self.rows >= end:
+                break
+        if not conversations:
+            conversations.append(block_conversations.iloc[:0])
+        return (pd.concat(customers, ignore_index=True),
+                pd.concat(conversations, ignore_index=True))
+
+
+class Batch:
+    """Батч, закодований ліниво й один раз на (тип, формат) для всіх клієнтів."""
+
+    def __init__(self, frames: dict):
+        self.frames = frames
+        self._encoded = {}
+
+    def records(self, kind: str) -> int:
+        return len(self.frames[kind])
+
+    def payload(self, kind: str, fmt: str) -> bytes:
+        key = (kind, fmt)
+        if key not in self._encoded:
+            frame = self.frames[kind]
+            text = frame.to_json(orient="records", lines=True, force_ascii=False) if len(frame) else ""
+            if text and not text.endswith("\n"):
+                text += "\n"
+            if fmt == "sse":
+                text = "".join(f"event: {kind}\ndata: {line}\n\n" for line in text.splitlines())
+            self._encoded[key] = text.encode("utf-8")
+        return self._encoded[key]
+
+
+def _head(payload: bytes, n: int, fmt: str) -> bytes:
+    # Перші n записів закодованого батчу (для ?limit)
+    sep = b"\n\n" if fmt == "sse" else b"\n"
+    end = -len(sep)
+    for _ in range(n):
+        end = payload.index(sep, end + len(sep))
+    return payload[:end + len(sep)]
+
+
+def _event(kind: str, body: dict, fmt: str) -> bytes:
+    line = json.dumps({"type": kind, **body}, ensure_ascii=False)
+    return (f"event: {kind}\ndata: {line}\n\n" if fmt == "sse" else line + "\n").encode("utf-8")
+
+
+class Client:
+    def __init__(self, kinds: tuple, fmt: str, limit: int, buffer: int, peer: str):
+        self.kinds, self.fmt, self.limit, self.peer = kinds, fmt, limit, peer
+        self.queue = asyncio.Queue(maxsize=buffer)
+        self.sent = self.dropped = self._gap = 0
+
+    def offer(self, batch) -> bool:
+        """drop-політика: кладе батч, якщо в черзі є місце; інакше рахує пропущені записи."""
+        try:
+            self.queue.put_nowait(batch)
+            return True
+        except asyncio.QueueFull:
+            lost = sum(batch.records(kind) for kind in self.kinds)
+            self.dropped += lost
+            self._gap += lost
+            return False
+
+    def encode(self, batch: Batch) -> bytes:
+        parts = []
+        if self._gap:
+            parts.append(_event("gap", {"dropped": self._gap}, self.fmt))
+            self._gap = 0
+        for kind in self.kinds:
+            n = batch.records(kind)
+            if self.limit is not None:
+                n = min(n, self.limit - self.sent)
+            if n <= 0:
+                continue
+            payload = batch.payload(kind, self.fmt)
+            parts.append(payload if n == batch.records(kind) else _head(payload, n, self.fmt))
+            self.sent += n
+        return b"".join(parts)
+
+    @property
+    def finished(self) -> bool:
+        return self.limit is not None and self.sent >= self.limit
+
+
+class StreamServer:
+    """HTTP-сервер з одним генератором і розсилкою батчів усім підключеним клієнтам."""
+
+    def __init__(self, feed: RecordFeed, slow_client: str = "drop", client_buffer: int = 64,
+                 log_every: float = 5.0):
+        if slow_client not in SLOW_CLIENT_POLICIES:
+            raise ValueError(f"Невідома політика для повільних клієнтів: {slow_client!r}")
+        self.feed = feed
+        self.slow_client = slow_client
+        self.client_buffer = client_buffer
+        self.log_every = log_every
+        self.clients = set()
+        self._connections = 0
+        self._has_clients = asyncio.Event()
+        self._finished = asyncio.Event()
+        self.started = time.monotonic()
+
+    # ── генератор ──────────────────────────────────────────────────────────────
+
+    async def produce(self):
+        """Пакує батчі за графіком rate; без клієнтів — чекає (подієвий час не йде)."""
+        feed = self.feed
+        emitted_at_t0, t0 = feed.rows, time.monotonic()
+        last_log = t0
+        max_batch = max(1, int(feed.rate * MAX_LAG_S))
+        while not feed.done:
+            if not self.clients:
+                await self._has_clients.wait()
+                emitted_at_t0, t0 = feed.rows, time.monotonic()
+            now = time.monotonic()
+            due = int((now - t0) * feed.rate) - (feed.rows - emitted_at_t0)
+            if due > max_batch:
+                # Повільні клієнти (block) або генерація не встигали: не наздоганяємо сплеском
+                emitted_at_t0, t0 = feed.rows, now
+                due = 0
+            if due <= 0:
+                await asyncio.sleep(TICK_S)
+                continue
+            customers, conversations = await asyncio.to_thread(feed.next_batch, due)
+            await self.broadcast(Batch({"customer": customers, "conversation": conversations}))
+            if self.log_every and now - last_log >= self.log_every:
+                last_log = now
+                print(self.status_line())
+        await self.broadcast(None)
+        self._finished.set()
+
+    async def broadcast(self, batch):
+        for client in list(self.clients):
+            if batch is None or self.slow_client == "block":
+                await client.queue.put(batch)
+            else:
+                client.offer(batch)
+
+    def stats(self) -> dict:
+        feed = self.feed
+        elapsed = time.monotonic() - self.started
+        return {
+            "event_time":     str(feed.event_time(np.array([max(feed.rows - 1, 0)]))[0]),
+            "customers":      feed.rows,
+            "conversations":  feed.conversations,
+            "target_rate":    feed.rate,
+            "speedup":        feed.speedup,
+            "uptime_s":       round(elapsed, 1),
+            "clients":        [{"peer": c.peer, "sent": c.sent, "dropped": c.dropped, "queued": c.queue.qsize()}
+                               for c in self.clients],
+            "slow_client":    self.slow_client,
+            "done":           feed.done,
+        }
+
+    def status_line(self) -> str:
+        st = self.stats()
+        dropped = sum(c["dropped"] for c in st["clients"])
+        return (f"  {st['event_time']}: {st['customers']:,} клієнтів, {st['conversations']:,} розмов, "
+                f"{len(st['clients'])} підключень, пропущено {dropped:,}")
+
+    # ── HTTP ───────────────────────────────────────────────────────────────────
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._connections += 1
+        try:
+            await self._handle(reader, writer)
+        except asyncio.CancelledError:
+            # Корінь задачі з'єднання (її ніхто не чекає): asyncio.start_server до Python 3.12 викликає
+            # task.exception() і на скасованій задачі логує трасування, тож там завершуємо тихо
+            if sys.version_info >= (3, 12):
+                raise
+        finally:
+            self._connections -= 1
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = "{}:{}".format(*writer.get_extra_info("peername")[:2])
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            writer.close()
+            return
+        lines = request.decode("latin-1").split("\r\n")
+        method, target = (lines[0].split(" ") + ["", ""])[:2]
+        headers = {k.strip().lower(): v.strip() for k, _, v in (line.partition(":") for line in lines[1:] if line)}
+        url = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if method != "GET":
+            return await self._respond(writer, 405, {"error": "only GET"})
+        if url.path == "/stats":
+            return await self._respond(writer, 200, self.stats())
+        if url.path not in ENDPOINTS:
+            return await self._respond(writer, 404, {"error": f"unknown path {url.path}",
+                                                     "endpoints": [*ENDPOINTS, "/stats"]})
+        fmt = query.get("format") or ("sse" if "text/event-stream" in headers.get("accept", "") else "ndjson")
+        if fmt not in CONTENT_TYPES:
+            return await self._respond(writer, 400, {"error": f"format: {', '.join(CONTENT_TYPES)}"})
+        try:
+            limit = int(query["limit"]) if "limit" in query else None
+        except ValueError:
+            limit = -1
+        if limit is not None and limit < 0:
+            return await self._respond(writer, 400, {"error": "limit: non-negative integer"})
+        await self.stream(writer, Client(ENDPOINTS[url.path], fmt, limit, self.client_buffer, peer))
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, body: dict):
+        payload = json.dumps(body, ensure_ascii=False, indent=2).encode("utf-8")
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}[status]
+        writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode("latin-1") + payload)
+        await self._close(writer)
+
+    async def stream(self, writer: asyncio.StreamWriter, client: Client):
+        # Тіло без Content-Length: потік закінчується закриттям з'єднання
+        writer.write(f"HTTP/1.1 200 OK\r\nContent-Type: {CONTENT_TYPES[client.fmt]}\r\n"
+                     "Cache-Control: no-cache\r\nConnection: close\r\n\r\n".encode("latin-1"))
+        self.clients.add(client)
+        self._has_clients.set()
+        print(f"Підключено {client.peer} ({'/'.join(client.kinds)}, {client.fmt})")
+        try:
+            while not client.finished:
+                batch = await client.queue.get()
+                if batch is None:
+                    break
+                payload = client.encode(batch)
+                if payload:
+                    writer.write(payload)
+                    await writer.drain()       # TCP-backpressure: чекаємо, доки клієнт прочитає
+        except ConnectionError:
+            pass
+        finally:
+            # CancelledError (зупинка сервера) не ковтаємо: прибирання нижче і далі — вгору по стеку
+            self.clients.discard(client)
+            if not self.clients:
+                self._has_clients.clear()
+            # Звільняємо чергу: генератор міг чекати на put (block) для цього клієнта
+            while not client.queue.empty():
+                client.queue.get_nowait()
+            print(f"Відключено {client.peer}: {client.sent:,} записів, пропущено {client.dropped:,}")
+            await self._close(writer)
+
+    @staticmethod
+    async def _close(writer: asyncio.StreamWriter):
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def run(self, host: str, port: int):
+        server = await asyncio.start_server(self.handle, host, port)
+        feed = self.feed
+        minutes = (feed.end - feed.start).astype(np.int64) / feed.speedup / 60
+        print(f"Serve: http://{host}:{port}/stream · {feed.rate:,.0f} записів/с · подієвий час ×{feed.speedup:,.0f} "
+              f"({feed.settings['start_date']} → {feed.end - np.timedelta64(1, 'D')} за ~{minutes:.1f} хв)")
+        async with server:
+            producer = asyncio.create_task(self.produce())
+            await self._finished.wait()
+            await producer
+            # Даємо клієнтам дочитати хвости черг і закрити з'єднання
+            while self._connections:
+                await asyncio.sleep(TICK_S)
+        print("Потік завершено:", self.status_line().strip())
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(prog="generate_dataset_ext.py serve",
+                                     description="Локальний потік синтетичних клієнтів і розмов (NDJSON / SSE)")
+    parser.add_argument("--config", type=str, default="config/config.yaml", help="Шлях до config.yaml")
+    parser.add_argument("--host", default="127.0.0.1", help="Адреса сервера (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Порт сервера (default: 8765)")
+    parser.add_argument("--rate", type=parse_rate, default=parse_rate("1000/s"),
+                        help="Цільова швидкість клієнтів: 20000/s, 5k/s, 1M/min (default: 1000/s)")
+    parser.add_argument("--speedup", type=float, default=86400.0,
+                        help="Прискорення подієвого часу (default: 86400 — день дрейфу за секунду)")
+    parser.add_argument("--until", type=str, metavar="YYYY-MM-DD",
+                        help="Остання подієва дата (default: generation.end_date; дрейф продовжується)")
+    parser.add_argument("--conv-ratio", type=float,
+                        help="Розмов на клієнта (default: conv_samples / samples з config)")
+    parser.add_argument("--slow-client", choices=SLOW_CLIENT_POLICIES, default="drop",
+                        help="Повільний клієнт: drop — пропускає батчі (запис gap), block — гальмує весь потік")
+    parser.add_argument("--client-buffer", type=int, default=64,
+                        help="Батчів у черзі кожного клієнта (default: 64)")
+    args = parser.parse_args(argv)
+
+    feed = RecordFeed(load_config(args.config), args.rate, args.speedup, args.until, args.conv_ratio)
+
+    async def serve():
+        await StreamServer(feed, args.slow_client, args.client_buffer).run(args.host, args.port)
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\nЗупинено.")
+
+
+if __name__ == "__main__":
+    main()
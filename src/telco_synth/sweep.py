@@ -0,0 +1,172 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from .drift import DRIFT_DEFAULTS, DriftSchedule
+from .ids import customer_ids
+from .tabular import (DEFAULT_SHARD_SIZE, _churn_probability, _customer_frame, _draw_customers, _generation_settings,
+                      day_counts, days_for_rows, shard_seed)
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Sweep сценаріїв дрейфу на спільних випадкових числах (common random numbers)
+# ──────────────────────────────────────────────────────────────────────────────
+#
+# Сценарій — перевизначення секції `drift:` (напр. churn_base_decline: 0.3). Замість N незалежних
+# запусків sweep для кожного шарду один раз тягне базові випадкові величини (рівномірні, нормальні)
+# і відтворює їх для кожного сценарію: функції numpy-рушія (_draw_customers, ...) отримують
+# CommonDraws замість np.random.Generator. Календар, customerID і всі рядки сценаріїв спарені — рядок i
+# має ту саму дату, ID і ті самі випадкові числа, тож різниця між датасетами походить лише від
+# drift-параметрів. Вибірка інша, ніж у звичайного запуску з тим самим seed (beta — через квантиль).
+#
+#   sweep:
+#     grid:                          # декартів добуток значень
+#       churn_base_decline: [0.1, 0.2, 0.3]
+#       fiber_growth_rate: [0.25, 0.5]
+#     scenarios:                     # або/і явний список перевизначень (name — необов'язково)
+#       - {name: fast_fiber, fiber_growth_rate: 0.6, curves: {internet: {type: step, at: "2024-01-01"}}}
+
+SWEEP_DIR = "sweep"
+SWEEP_MANIFEST = "sweep_manifest.json"
+
+# Ключі перевизначень сценарію: числові параметри drift і криві
+SWEEP_KEYS = (*DRIFT_DEFAULTS, "curves")
+
+# Сітка квантилів для beta (стаж): CDF на GRID відрізках [0, 1]
+BETA_GRID = 1024
+
+
+def beta_ppf(u: np.ndarray, a, b, grid: int = BETA_GRID) -> np.ndarray:
+    """Квантиль Beta(a, b) для рівномірних u — монотонне перетворення, спільне для всіх сценаріїв.
+
+    a, b — скаляри або масиви довжини len(u) (параметри по днях рядків). CDF кожної унікальної
+    пари (a, b) інтегрується на сітці з grid відрізків; всередині відрізка — лінійна інтерполяція.
+    """
+    u = np.asarray(u, dtype=np.float64)
+    ab = np.column_stack([np.broadcast_to(np.asarray(x, dtype=np.float64), u.shape) for x in (a, b)])
+    # Пара (a, b) як одне complex-число: одновимірний unique замість повільного unique(axis=0)
+    keys, inverse = np.unique(ab.view(np.complex128).ravel(), return_inverse=True)
+    pairs = np.column_stack([keys.real, keys.imag])
+    x = (np.arange(grid) + 0.5) / grid
+    log_pdf = (pairs[:, :1] - 1) * np.log(x) + (pairs[:, 1:] - 1) * np.log1p(-x)
+    cdf = np.zeros((len(pairs), grid + 1))
+    np.cumsum(np.exp(log_pdf - log_pdf.max(axis=1, keepdims=True)), axis=1, out=cdf[:, 1:])
+    cdf /= cdf[:, -1:]
+    # Усі CDF в одному зростаючому масиві: пара k зсунута на 2k, тож один searchsorted на всі рядки
+    flat = (cdf + 2.0 * np.arange(len(pairs))[:, None]).ravel()
+    base = inverse * (grid + 1)
+    j = np.clip(np.searchsorted(flat, u + 2.0 * inverse, side="right") - 1 - base, 0, grid - 1)
+    lo, hi = flat[base + j], flat[base + j + 1]
+    return (j + np.clip((u + 2.0 * inverse - lo) / np.maximum(hi - lo, 1e-300), 0.0, 1.0)) / grid
+
+
+class CommonDraws:
+    """Замінник np.random.Generator для generate_tabular_numpy: відтворює ті самі базові числа.
+
+    Перший прохід (перший сценарій) тягне числа з rng і запам'ятовує їх; після rewind() наступні
+    виклики отримують ті самі масиви в тому ж порядку. Параметри розподілів застосовуються до
+    базових чисел щоразу заново (beta — через beta_ppf), тож змінюються лише значення, не потоки.
+    Квантилі beta з тими самими (a, b), що й у попереднього сценарію, не перераховуються.
+    """
+
+    def __init__(self, rng: np.random.Generator):
+        self.rng = rng
+        self._draws = []
+        self._pos = 0
+        self._beta = {}
+
+    def rewind(self):
+        self._pos = 0
+
+    def _next(self, kind: str, n: int) -> np.ndarray:
+        if self._pos == len(self._draws):
+            self._draws.append((kind, self.rng.random(n) if kind == "uniform" else self.rng.standard_normal(n)))
+        recorded, values = self._draws[self._pos]
+        if recorded != kind or len(values) != n:
+            raise RuntimeError("CommonDraws: порядок викликів відрізняється між сценаріями")
+        self._pos += 1
+        return values
+
+    def random(self, n: int) -> np.ndarray:
+        return self._next("uniform", n)
+
+    def uniform(self, low: float, high: float, n: int) -> np.ndarray:
+        return low + (high - low) * self._next("uniform", n)
+
+    def normal(self, loc: float, scale: float, n: int) -> np.ndarray:
+        return loc + scale * self._next("normal", n)
+
+    def beta(self, a, b, n: int) -> np.ndarray:
+        pos, u = self._pos, self._next("uniform", n)
+        cached = self._beta.get(pos)
+        if cached is None or not (np.array_equal(cached[0], a) and np.array_equal(cached[1], b)):
+            cached = self._beta[pos] = (a, b, beta_ppf(u, a, b))
+        return cached[2]
+
+
+def sweep_scenarios(sweep: dict = None) -> list:
+    """Сценарії з секції `sweep:` → [(ім'я, перевизначення drift)]: спершу grid, потім scenarios."""
+    sweep = sweep or {}
+    grid = sweep.get("grid") or {}
+    overrides = [dict(zip(grid, values)) for values in itertools.product(*grid.values())] if grid else []
+    overrides += [dict(s) for s in sweep.get("scenarios") or []]
+    if not overrides:
+        raise ValueError("Sweep без сценаріїв: задайте sweep.grid / sweep.scenarios або --sweep-param")
+    scenarios = []
+    for i, override in enumerate(overrides):
+        name = str(override.pop("name", f"s{i:02d}"))
+        unknown = set(override) - set(SWEEP_KEYS)
+        if unknown:
+            raise ValueError(f"Невідомі параметри сценарію {name}: {sorted(unknown)} (доступні: {', '.join(SWEEP_KEYS)})")
+        scenarios.append((name, override))
+    names = [name for name, _ in scenarios]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Імена сценаріїв sweep повторюються: {names}")
+    return scenarios
+
+
+def parse_sweep_params(params: list) -> dict:
+    """--sweep-param NAME=V1,V2 ... → grid {NAME: [V1, V2]}."""
+    grid = {}
+    for param in params:
+        name, sep, values = param.partition("=")
+        if not sep or not values:
+            raise ValueError(f"--sweep-param очікує NAME=V1,V2,..., отримано {param!r}")
+        grid[name.strip()] = [float(v) for v in values.split(",")]
+    return grid
+
+
+def iter_sweep(config: dict, scenarios: list, chunk_size: int = DEFAULT_SHARD_SIZE):
+    """(ім'я сценарію, чанк) по шардах: для кожного шарду — чанки всіх сценаріїв на тих самих числах.
+
+    Шард i тягне базові числа з shard_seed(seed, i), календар — day_counts(seed), як у
+    iter_tabular_chunks; генерація завжди векторна (numpy-рушій), формат — generation.compact.
+    """
+    s = _generation_settings(config, engine="numpy")
+    n = s["n_samples"]
+    start = np.datetime64(s["start_date"], "D")
+    cum_counts = np.cumsum(day_counts(n, s["start_date"], s["end_date"], s["seed"]))
+    # Розклад дрейфу кожного сценарію компілюється один раз на весь sweep
+    schedules = [(name, DriftSchedule({**s["drift"], **override}, s["start_date"], s["end_date"]))
+                 for name, override in scenarios]
+    for shard, offset in enumerate(range(0, n, chunk_size)):
+        rows = min(chunk_size, n - offset)
+        days = days_for_rows(cum_counts, offset, rows)
+        ids = customer_ids(offset + np.arange(rows), s["seed"])
+        draws = CommonDraws(np.random.default_rng(shard_seed(s["seed"], shard)))
+        for name, schedule in schedules:
+            # Той самий порядок викликів, що й у generate_tabular_numpy
+            draws.rewind()
+            t = schedule.lookup(days)
+            state = _draw_customers(draws, t, rows)
+            state["Churn"] = (draws.random(rows) < _churn_probability(state, t)).astype(np.int8)
+            yield name, _customer_frame(state, ids, start, days, s["compact"])
+
+
+def scenario_summary(chunk: pd.DataFrame) -> dict:
+    """Лічильники сценарію для маніфесту — сумуються між чанками."""
+    return {
+        "rows":  len(chunk),
+        "churn": int((chunk["Churn"] == "Yes").sum()),
+        "fiber": int((chunk["InternetService"] == "Fiber optic").sum()),
+    }
@@ -0,0 +1,501 @@
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .drift import DriftSchedule
+from .ids import customer_ids
+from .schema import ADDON_COLUMNS, CATEGORY_LEVELS, CUSTOMER_COLUMNS, to_compact
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Табличні дані клієнтів: векторний (numpy) та рядковий (python) рушії, шарди, календар
+# ──────────────────────────────────────────────────────────────────────────────
+#
+# Увесь стан випадковості — у явних генераторах (np.random.Generator / random.Random)
+# з seed; глобальні random / np.random не використовуються, тож функції можна викликати
+# паралельно з різних потоків.
+
+
+def load_config(config_path: str = "config/config.yaml") -> dict:
+    path = Path(config_path)
+    if not path.exists():
+        print(f"Файл конфігурації {config_path} не знайдено → використовуємо значення за замовчуванням")
+        return {}
+    import yaml  # лише для CLI / конфігу: імпорт пакета не тягне PyYAML
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+ENGINES = ("python", "numpy")
+
+DEFAULT_SHARD_SIZE = 100_000
+
+# Фіксована "поточна" дата для дат у текстах розмов (замість datetime.now()) — відтворюваність
+REFERENCE_DATE = "2025-01-01"
+
+# Незалежні потоки випадкових чисел одного шарду (spawn_key SeedSequence)
+STREAM_TABULAR = 0
+STREAM_CONVERSATIONS = 1
+STREAM_CALENDAR = 2
+# STREAM_IDS = 3 — ключі перестановки customerID (ids.py)
+STREAM_PANEL = 4
+# STREAM_KB = 5 — синтез документів knowledge base (knowledge_base.py)
+# STREAM_SERVE = 6 — потік для serve (serve.py)
+# STREAM_USAGE = 7 — широкі ознаки користування (usage.py)
+
+
+def _total_days(start_date: str, end_date: str) -> int:
+    return int((np.datetime64(end_date, "D") - np.datetime64(start_date, "D")).astype(int))
+
+
+def _draw_day_counts(rng: np.random.Generator, n_samples: int, total_days: int) -> np.ndarray:
+    # Рівномірна дата на рядок ≡ multinomial кількостей записів по днях
+    return rng.multinomial(n_samples, np.full(total_days + 1, 1 / (total_days + 1)))
+
+
+def day_counts(n_samples: int, start_date: str, end_date: str, seed: int = 42,
+               segment: int = 0) -> np.ndarray:
+    """Календар генерації: кількість записів на кожен день періоду, визначена наперед.
+
+    Рядки генеруються день за днем у порядку календаря, тож вихід упорядкований
+    за RecordDate за побудовою і його можна стрімити хронологічно без сортування.
+    segment — номер дозапису (--append-from): кожен сегмент має власний потік календаря.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(STREAM_CALENDAR, segment)))
+    return _draw_day_counts(rng, n_samples, _total_days(start_date, end_date))
+
+
+def days_for_rows(cum_counts: np.ndarray, offset: int, n: int) -> np.ndarray:
+    """Індекси днів для рядків [offset, offset + n) календаря з накопиченими кількостями cum_counts."""
+    return np.searchsorted(cum_counts, np.arange(offset, offset + n), side="right")
+
+
+def _weighted_choice(rng: np.random.Generator, weights: list, n: int) -> np.ndarray:
+    """Векторний аналог random.choices(range(k), weights)[0] для n рядків → коди категорій.
+
+    Кожна вага — скаляр або масив довжини n (ваги, що залежать від progress).
+    """
+    w = np.column_stack([np.broadcast_to(np.asarray(x, dtype=np.float64), (n,)) for x in weights])
+    w = np.maximum(w, 0.0)
+    cum = np.cumsum(w, axis=1)
+    u = rng.random(n) * cum[:, -1]
+    return (u[:, None] >= cum[:, :-1]).sum(axis=1)
+
+
+def _labels(*labels: str) -> np.ndarray:
+    # object-масив: labels[codes] копіює лише посилання на вже створені рядки
+    return np.array(labels, dtype=object)
+
+
+# Рядкові мітки та pandas-категорії для кодів категорій (порядок з schema.CATEGORY_LEVELS)
+CATEGORY_LABELS = {col: _labels(*levels) for col, levels in CATEGORY_LEVELS.items()}
+CATEGORY_DTYPES = {col: pd.CategoricalDtype(levels) for col, levels in CATEGORY_LEVELS.items()}
+
+
+def generate_tabular_numpy(
+    n_samples: int,
+    start_date: str = "2023-01-01",
+    end_date: str = "2024-12-31",
+    drift: dict = None,
+    rng: np.random.Generator = None,
+    compact: bool = False,
+    days: np.ndarray = None,
+    first_row: int = 0,
+    id_seed: int = 42,
+) -> pd.DataFrame:
+    """Векторний рушій: кожна колонка генерується для всього батчу одним викликом
+    numpy.random.Generator. Маргінальні розподіли та дрейф ті самі, що й у циклі
+    generate_tabular_data(engine="python"), але послідовність випадкових чисел інша.
+    days — відсортовані індекси днів рядків (напр. зріз календаря day_counts для чанку);
+    без них кількість записів на день береться з multinomial. Результат упорядкований
+    за RecordDate за побудовою, без сортування. compact=True повертає компактну схему
+    (schema.to_compact) напряму з кодів категорій, без проміжних рядкових колонок.
+    customerID — ids.customer_ids(first_row + номер рядка, id_seed): унікальні для всіх
+    шардів і дозаписів одного seed, якщо first_row — глобальний номер першого рядка.
+    """
+    rng = rng if rng is not None else np.random.default_rng(42)
+    n = n_samples
+
+    start = np.datetime64(start_date, "D")
+    total_days = _total_days(start_date, end_date)
+
+    if days is None:
+        days = days_for_rows(np.cumsum(_draw_day_counts(rng, n, total_days)), 0, n)
+    # Параметри дрейфу для кожного рядка — таблиці по днях (drift.DriftSchedule), проіндексовані днями
+    t = DriftSchedule(drift, start_date, end_date).lookup(days)
+
+    state = _draw_customers(rng, t, n)
+    state["Churn"] = (rng.random(n) < _churn_probability(state, t)).astype(np.int8)
+    return _customer_frame(state, customer_ids(first_row + np.arange(n), id_seed), start, days, compact)
+
+
+def _draw_customers(rng: np.random.Generator, t: dict, n: int) -> dict:
+    """Нові клієнти за параметрами дрейфу t (DriftSchedule.lookup) → struct-of-arrays стан.
+
+    Ключі — колонки CUSTOMER_COLUMNS (коди категорій для категоріальних), плюс price_noise:
+    індивідуальний шум ціни, з якого MonthlyCharges перераховується при зміні послуг (панель).
+    """
+    gender = (rng.random(n) >= 0.5).astype(np.int8)
+    senior_citizen = (rng.random(n) < t["senior_prob"]).astype(np.int8)
+    has_partner = (rng.random(n) < t["partner_prob"]).astype(np.int8)
+    has_dependents = (rng.random(n) < t["dependents_prob"]).astype(np.int8)
+
+    tenure = (rng.beta(t["tenure_a"], t["tenure_b"], n) * 72).astype(np.int16)
+    tenure = np.clip(tenure, 0, 72)
+
+    phone = rng.random(n) < 0.92
+    internet = _weighted_choice(rng, [t["dsl_prob"], t["fiber_prob"], t["no_inet_prob"]], n).astype(np.int8)
+
+    state = {
+        "gender": gender,
+        "SeniorCitizen": senior_citizen,
+        "Partner": has_partner,
+        "Dependents": has_dependents,
+        "tenure": tenure,
+        "PhoneService": phone.astype(np.int8),
+        "InternetService": internet,
+    }
+    state.update(_draw_addons(rng, t, internet != 2))
+
+    multi = phone & (rng.random(n) < t["multi_prob"])
+    state["MultipleLines"] = np.where(phone, multi, 2).astype(np.int8)
+
+    state["Contract"] = _draw_contract(rng, t, n)
+    state["PaperlessBilling"] = (rng.random(n) < t["paperless_prob"]).astype(np.int8)
+    state["PaymentMethod"] = _draw_payment(rng, t, n)
+
+    state["price_noise"] = rng.normal(0, 6, n)
+    state["MonthlyCharges"] = _monthly_charges(state, t)
+    state["TotalCharges"] = np.round(state["MonthlyCharges"] * tenure * rng.uniform(0.97, 1.03, n), 2)
+    return state
+
+
+def _draw_addons(rng: np.random.Generator, t: dict, has_internet: np.ndarray) -> dict:
+    # Додаткові послуги: ймовірності відносно base_yes, "No internet service" (2) без інтернету
+    base_yes = 0.5 + t["streaming_boost"]
+    addon_probs = [base_yes * 0.7, base_yes * 0.8, base_yes * 0.75,
+                   base_yes * 0.6, base_yes + 0.1, base_yes + 0.1]
+    addons = {}
+    for col, prob in zip(ADDON_COLUMNS, addon_probs):
+        yes = has_internet & (rng.random(len(has_internet)) < prob)
+        addons[col] = np.where(has_internet, yes, 2).astype(np.int8)
+    return addons
+
+
+def _draw_contract(rng: np.random.Generator, t: dict, n: int) -> np.ndarray:
+    m2m_prob = t["m2m_prob"]
+    return _weighted_choice(rng, [m2m_prob, (1 - m2m_prob) * 0.6, (1 - m2m_prob) * 0.4], n).astype(np.int8)
+
+
+def _draw_payment(rng: np.random.Generator, t: dict, n: int) -> np.ndarray:
+    return _weighted_choice(rng, [t["echeck_prob"], 0.25, t["bank_weight"], t["credit_weight"]], n).astype(np.int8)
+
+
+def _monthly_charges(state: dict, t: dict) -> np.ndarray:
+    """Ціна з послуг і контракту за цінами дрейфу t плюс індивідуальний шум price_noise."""
+    internet, contract = state["InternetService"], state["Contract"]
+    extra_count = sum((state[col] == 1).astype(np.int64) for col in ADDON_COLUMNS)
+    base = np.full(len(internet), 20.0)
+    base += np.where(state["PhoneService"] == 1, 25.0, 0.0) + np.where(state["MultipleLines"] == 1, 18.0, 0.0)
+    base += np.where(internet == 0, 50.0, 0.0)
+    base += np.where(internet == 1, t["fiber_price"], 0.0)
+    base += extra_count * t["extra_price"]
+    base *= np.select([contract == 1, contract == 2], [0.94, t["two_year_discount"]], 1.0)
+    return np.round(np.maximum(18.5, base + state["price_noise"]), 2)
+
+
+def _churn_probability(state: dict, t: dict) -> np.ndarray:
+    # Churn — знижується з часом (churn_shift з розкладу дрейфу)
+    tenure = state["tenure"].astype(np.int64)
+    churn_base = np.full(len(tenure), 0.45)
+    churn_base += np.where(state["Contract"] == 0, 0.35, 0.0)
+    churn_base += np.where(state["PaymentMethod"] == 0, 0.18, 0.0)
+    churn_base += np.where(state["InternetService"] == 1, 0.08, 0.0)
+    churn_base += np.where(tenure < 12, 0.25 - tenure * 0.02, 0.0)
+    churn_base -= t["churn_shift"]
+    return churn_base
+
+
+def _customer_frame(state: dict, ids: np.ndarray, start: np.datetime64, days: np.ndarray,
+                    compact: bool = False) -> pd.DataFrame:
+    """DataFrame клієнтів зі struct-of-arrays стану: коди → мітки (або Categorical у compact)."""
+    columns = {"customerID": ids}
+    categorical = [col for col in CUSTOMER_COLUMNS if col in CATEGORY_LEVELS]
+    if compact:
+        columns.update({col: pd.Categorical.from_codes(state[col], dtype=CATEGORY_DTYPES[col]) for col in categorical})
+        columns.update({
+            "SeniorCitizen": state["SeniorCitizen"].astype(np.int8),
+            "tenure": state["tenure"].astype(np.int16),
+            "MonthlyCharges": state["MonthlyCharges"].astype(np.float32),
+            "TotalCharges": state["TotalCharges"].astype(np.float32),
+            "RecordDate": start + days,
+        })
+    else:
+        first, last = days.min(initial=0), days.max(initial=0)
+        date_labels = (start + np.arange(first, last + 1)).astype(str).astype(object)
+        columns.update({col: CATEGORY_LABELS[col][state[col]] for col in categorical})
+        columns.update({
+            "SeniorCitizen": state["SeniorCitizen"].astype(np.int64),
+            "tenure": state["tenure"].astype(np.int64),
+            "MonthlyCharges": np.round(state["MonthlyCharges"].astype(np.float64), 2),
+            "TotalCharges": np.round(state["TotalCharges"].astype(np.float64), 2),
+            "RecordDate": date_labels[days - first],
+        })
+    return pd.DataFrame({col: columns[col] for col in CUSTOMER_COLUMNS})
+
+
+def _generation_settings(config: dict = None, engine: str = None, compact: bool = None) -> dict:
+    config = config or {}
+    gen = config.get("generation", {})
+    engine = engine or gen.get("engine", "python")
+    compact = gen.get("compact", False) if compact is None else compact
+    if engine not in ENGINES:
+        raise ValueError(f"Невідомий engine: {engine!r} (доступні: {', '.join(ENGINES)})")
+    return {
+        "n_samples":  gen.get("samples", 50000),
+        "start_date": gen.get("start_date", "2023-01-01"),
+        "end_date":   gen.get("end_date", "2024-12-31"),
+        "seed":       gen.get("seed", 42),
+        "engine":     engine,
+        "compact":    compact,
+        "drift":      config.get("drift", {}),
+    }
+
+
+def generate_tabular_data(config: dict = None, engine: str = None,
+                          rng: np.random.Generator = None, compact: bool = None) -> pd.DataFrame:
+    # compact=True (або generation.compact у config) → компактна схема schema.to_compact
+    s = _generation_settings(config, engine, compact)
+
+    if s["engine"] == "numpy":
+        rng = rng if rng is not None else np.random.default_rng(s["seed"])
+        return generate_tabular_numpy(s["n_samples"], s["start_date"], s["end_date"], s["drift"], rng,
+                                      compact=s["compact"], id_seed=s["seed"])
+
+    df = _generate_tabular_python(s["n_samples"], s["start_date"], s["end_date"], s["drift"], id_seed=s["seed"])
+    return to_compact(df) if s["compact"] else df
+
+
+def shard_seed(seed: int, shard: int, stream: int = STREAM_TABULAR) -> np.random.SeedSequence:
+    """Незалежний seed шарду — те саме, що SeedSequence(seed).spawn(...)[shard] для потоку stream.
+
+    Залежить лише від (seed, stream, shard), а не від кількості шардів чи воркерів.
+    """
+    return np.random.SeedSequence(seed, spawn_key=(stream, shard))
+
+
+def _generate_shard(settings: dict, shard: int, offset: int, n: int) -> pd.DataFrame:
+    seq = shard_seed(settings["seed"], shard)
+    days = settings["first_day"] + days_for_rows(settings["cum_counts"], offset, n)
+    first_row = settings["row_offset"] + offset
+    if settings["engine"] == "numpy":
+        chunk = generate_tabular_numpy(n, settings["start_date"], settings["end_date"],
+                                       settings["drift"], np.random.default_rng(seq), settings["compact"], days,
+                                       first_row, settings["seed"])
+    else:
+        rnd = random.Random(int(seq.generate_state(1, np.uint64)[0]))
+        chunk = _generate_tabular_python(n, settings["start_date"], settings["end_date"],
+                                         settings["drift"], rnd, np.random.default_rng(seq), days,
+                                         first_row, settings["seed"])
+        if settings["compact"]:
+            chunk = to_compact(chunk)
+    chunk.index += first_row
+    return chunk
+
+
+def iter_tabular_chunks(config: dict = None, chunk_size: int = DEFAULT_SHARD_SIZE, engine: str = None,
+                        rng: np.random.Generator = None, workers: int = 1, compact: bool = None,
+                        window: dict = None):
+    """Генерує `samples` клієнтів DataFrame-чанками по chunk_size рядків.
+
+    Пам'ять обмежена розміром одного чанку (× кількість чанків у польоті при workers > 1)
+    незалежно від загальної кількості рядків. Кожен чанк — шард зі своїм seed (shard_seed),
+    тож за заданих seed і chunk_size результат побайтово однаковий для будь-якого workers.
+    Якщо передано rng (лише engine="numpy"), усі чанки беруться з одного потоку послідовно.
+    Кількість записів на день визначається наперед (day_counts), а чанки — послідовні зрізи
+    цього календаря, тож потік чанків упорядкований за RecordDate без жодного сортування.
+
+    window (див. append_window) продовжує наявний датасет: генерує лише дні
+    first_day..last_day після end_date (дрейф продовжується, progress > 1) з новими шардами,
+    номерами рядків і сегментом календаря.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size має бути > 0, отримано {chunk_size}")
+    s = _generation_settings(config, engine, compact)
+    s.update({"first_day": 0, "last_day": _total_days(s["start_date"], s["end_date"]),
+              "first_shard": 0, "row_offset": 0, "segment": 0})
+    if window:
+        s.update(window)
+    shards = [(s["first_shard"] + i, offset, min(chunk_size, s["n_samples"] - offset))
+              for i, offset in enumerate(range(0, s["n_samples"], chunk_size))]
+
+    if rng is not None:
+        if s["engine"] != "numpy" or workers > 1 or window:
+            raise ValueError("Явний rng підтримується лише для engine='numpy' з workers=1 без window")
+        total_days = _total_days(s["start_date"], s["end_date"])
+        cum_counts = np.cumsum(_draw_day_counts(rng, s["n_samples"], total_days))
+        for _, offset, n in shards:
+            chunk = generate_tabular_numpy(n, s["start_date"], s["end_date"], s["drift"], rng, s["compact"],
+                                           days_for_rows(cum_counts, offset, n), offset, s["seed"])
+            chunk.index += offset
+            yield chunk
+        return
+
+    start = np.datetime64(s["start_date"], "D")
+    s["cum_counts"] = np.cumsum(day_counts(s["n_samples"], str(start + s["first_day"]),
+                                           str(start + s["last_day"]), s["seed"], s["segment"]))
+
+    if workers <= 1:
+        for shard in shards:
+            yield _generate_shard(s, *shard)
+        return
+
+    # Обмежена кількість шардів у польоті: результати віддаються строго по порядку,
+    # а повільний споживач не накопичує готові чанки в пам'яті
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for shard in shards:
+            pending.append(pool.submit(_generate_shard, s, *shard))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _generate_tabular_python(n_samples: int, start_date: str, end_date: str,
+                             drift: dict = None, rnd: random.Random = None, np_rnd=None,
+                             days: np.ndarray = None, first_row: int = 0, id_seed: int = 42) -> pd.DataFrame:
+    # rnd / np_rnd: random.Random та np.random.RandomState / Generator шарду; за замовчуванням —
+    # власні генератори з id_seed
+    # days: відсортовані індекси днів рядків (інакше — весь календар day_counts(id_seed)),
+    # тож рядки виходять упорядкованими за RecordDate без сортування
+    # customerID: ids.customer_ids для рядків first_row.. (див. generate_tabular_numpy)
+    rnd = rnd if rnd is not None else random.Random(id_seed)
+    np_rnd = np_rnd if np_rnd is not None else np.random.RandomState(id_seed)
+    data = []
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+
+    if days is None:
+        days = days_for_rows(np.cumsum(day_counts(n_samples, start_date, end_date, id_seed)), 0, n_samples)
+    # Параметри дрейфу — таблиці по днях (drift.DriftSchedule), у циклі лише індексуються
+    n_days = int(max(days, default=0)) + 1
+    tab = {name: values.tolist() for name, values in DriftSchedule(drift, start_date, end_date).table(n_days).items()}
+
+    for i in range(n_samples):
+        day = int(days[i])
+        record_date = start + timedelta(days=day)
+
+        fiber_prob = tab["fiber_prob"][day]
+        dsl_prob = tab["dsl_prob"][day]
+        no_inet_prob = tab["no_inet_prob"][day]
+
+        echeck_prob = tab["echeck_prob"][day]
+        m2m_prob = tab["m2m_prob"][day]
+        streaming_boost = tab["streaming_boost"][day]
+        senior_prob = tab["senior_prob"][day]
+
+        gender = rnd.choice(["Male", "Female"])
+        senior_citizen = 1 if rnd.random() < senior_prob else 0
+        has_partner = rnd.choices(["Yes", "No"], weights=[tab["partner_prob"][day], 1 - tab["partner_prob"][day]])[0]
+        has_dependents = "Yes" if rnd.random() < tab["dependents_prob"][day] else "No"
+
+        tenure = int(np_rnd.beta(tab["tenure_a"][day], tab["tenure_b"][day]) * 72)
+        tenure = max(0, min(tenure, 72))
+
+        phone_service = "Yes" if rnd.random() < 0.92 else "No"
+        internet_service = rnd.choices(
+            ["DSL", "Fiber optic", "No"],
+            weights=[dsl_prob, fiber_prob, no_inet_prob]
+        )[0]
+
+        if internet_service == "No":
+            secs = ["No internet service"] * 6
+            online_security, online_backup, device_protection, tech_support, streaming_tv, streaming_movies = secs
+        else:
+            base_yes = 0.5 + streaming_boost
+            online_security   = "Yes" if rnd.random() < (base_yes * 0.7)  else "No"
+            online_backup     = "Yes" if rnd.random() < (base_yes * 0.8)  else "No"
+            device_protection = "Yes" if rnd.random() < (base_yes * 0.75) else "No"
+            tech_support      = "Yes" if rnd.random() < (base_yes * 0.6)  else "No"
+            streaming_tv      = "Yes" if rnd.random() < (base_yes + 0.1) else "No"
+            streaming_movies  = "Yes" if rnd.random() < (base_yes + 0.1) else "No"
+
+        multiple_lines = "No phone service" if phone_service == "No" else (
+            "Yes" if rnd.random() < tab["multi_prob"][day] else "No"
+        )
+
+        contract = rnd.choices(
+            ["Month-to-month", "One year", "Two year"],
+            weights=[m2m_prob, (1-m2m_prob)*0.6, (1-m2m_prob)*0.4]
+        )[0]
+
+        paperless_billing = "Yes" if rnd.random() < tab["paperless_prob"][day] else "No"
+
+        payment_method = rnd.choices(
+            ["Electronic check", "Mailed check", "Bank transfer (automatic)", "Credit card (automatic)"],
+            weights=[echeck_prob, 0.25, tab["bank_weight"][day], tab["credit_weight"][day]]
+        )[0]
+
+        base = 20.0
+        if phone_service == "Yes":
+            base += 25
+            if multiple_lines == "Yes":
+                base += 18
+        if internet_service == "DSL":
+            base += 50
+        elif internet_service == "Fiber optic":
+            base += tab["fiber_price"][day]
+
+        extra_count = sum([online_security=="Yes", online_backup=="Yes", device_protection=="Yes",
+                           tech_support=="Yes", streaming_tv=="Yes", streaming_movies=="Yes"])
+        base += extra_count * tab["extra_price"][day]
+
+        if contract == "One year":
+            base *= 0.94
+        elif contract == "Two year":
+            base *= tab["two_year_discount"][day]
+
+        monthly_charges = round(max(18.5, base + np_rnd.normal(0, 6)), 2)
+        total_charges = round(monthly_charges * tenure * rnd.uniform(0.97, 1.03), 2)
+
+        churn_base = 0.45
+        if contract == "Month-to-month": churn_base += 0.35
+        if payment_method == "Electronic check": churn_base += 0.18
+        if internet_service == "Fiber optic": churn_base += 0.08
+        if tenure < 12: churn_base += 0.25 - tenure*0.02
+        churn_base -= tab["churn_shift"][day]
+
+        churn = "Yes" if rnd.random() < churn_base else "No"
+
+        row = {
+            "gender": gender,
+            "SeniorCitizen": senior_citizen,
+            "Partner": has_partner,
+            "Dependents": has_dependents,
+            "tenure": tenure,
+            "PhoneService": phone_service,
+            "MultipleLines": multiple_lines,
+            "InternetService": internet_service,
+            "OnlineSecurity": online_security,
+            "OnlineBackup": online_backup,
+            "DeviceProtection": device_protection,
+            "TechSupport": tech_support,
+            "StreamingTV": streaming_tv,
+            "StreamingMovies": streaming_movies,
+            "Contract": contract,
+            "PaperlessBilling": paperless_billing,
+            "PaymentMethod": payment_method,
+            "MonthlyCharges": monthly_charges,
+            "TotalCharges": total_charges,
+            "Churn": churn,
+            "RecordDate": record_date.strftime("%Y-%m-%d")
+        }
+        data.append(row)
+
+    df = pd.DataFrame(data, columns=CUSTOMER_COLUMNS)
+    df["customerID"] = customer_ids(first_row + np.arange(n_samples), id_seed)
+    return df
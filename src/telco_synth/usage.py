@@ -0,0 +1,270 @@
+import json
+import math
+import struct
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .drift import DriftSchedule
+from .schema import CATEGORY_LEVELS
+from .tabular import shard_seed
+from .writers import _pyarrow, _unshare
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Широкі числові ознаки користування: K float32 на клієнта, рядок = позиція в telco_customers
+# ──────────────────────────────────────────────────────────────────────────────
+#
+# Для кожного клієнта — 8 місячних агрегатів (USAGE_SCALARS) і денні ряди трафіку даних
+# та хвилин дзвінків за вікно, що закінчується в RecordDate (data_gb_dNN, call_minutes_dNN).
+# Рівні залежать від InternetService / PhoneService / MultipleLines / стримінгу, стажу й
+# контракту; клієнти з Churn = Yes поступово "згасають" (спад і пропущені дні в кінці вікна,
+# більше обірваних дзвінків і звернень); трафік даних росте, а хвилини падають за кривою
+# usage розкладу дрейфу (drift.data_growth_rate / voice_decline_rate).
+#
+# Ознаки генеруються блоками float32 прямо з чанків клієнтів і пишуться без pandas:
+#   usage_features.npy    float32[n, K], C-порядок — np.load(mmap_mode="r") або load_usage
+#   usage_features.arrow  Arrow IPC, K колонок float32, батч на чанк — pa.memory_map, zero-copy
+#   usage_features.json   колонки, рядки, формат, вікно
+
+STREAM_USAGE = 7                        # продовжує STREAM_* з tabular
+
+# Фіксована довжина заголовка .npy (кратна 64): вміщує shape з будь-якою кількістю рядків uint64,
+# тож заголовок перезаписується на місці незалежно від версії numpy
+USAGE_HEADER_BYTES = 128
+
+USAGE_FILE = "usage_features"
+USAGE_FORMATS = ("npy", "arrow")
+
+USAGE_SCALARS = ["call_minutes", "data_gb", "dropped_calls", "sms_count", "support_calls",
+                 "streaming_hours", "data_trend", "active_days"]
+USAGE_SERIES = ["data_gb", "call_minutes"]
+
+# Дефолти секції `usage:` config.yaml
+USAGE_DEFAULTS = {
+    "features":    0,        # K ознак на клієнта; 0 — вимкнено
+    "format":      "npy",
+    "window_days": 28,       # мінімальне вікно денних рядів (довше, якщо K цього потребує)
+}
+
+# Місячні рівні за InternetService (DSL, Fiber optic, No) — ГБ даних
+DATA_GB = np.array([35.0, 110.0, 3.0], dtype=np.float32)
+CALL_MINUTES = 320.0
+
+
+def usage_settings(config: dict = None) -> dict:
+    return {**USAGE_DEFAULTS, **((config or {}).get("usage") or {})}
+
+
+def usage_window(k: int, window_days: int = USAGE_DEFAULTS["window_days"]) -> int:
+    """Довжина денних рядів: щонайменше window_days і достатньо для K колонок."""
+    return max(window_days, math.ceil(max(k - len(USAGE_SCALARS), 0) / len(USAGE_SERIES)))
+
+
+def usage_columns(k: int, window_days: int = USAGE_DEFAULTS["window_days"]) -> list:
+    """Перші K назв: місячні агрегати, потім денні ряди (data_gb_d00.., call_minutes_d00..)."""
+    window = usage_window(k, window_days)
+    series = [f"{name}_d{d:02d}" for name in USAGE_SERIES for d in range(window)]
+    return (USAGE_SCALARS + series)[:k]
+
+
+def _codes(df: pd.DataFrame, col: str) -> np.ndarray:
+    values = df[col]
+    if isinstance(values.dtype, pd.CategoricalDtype) and list(values.cat.categories) == CATEGORY_LEVELS[col]:
+        return values.cat.codes.to_numpy()
+    return pd.Categorical(values, categories=CATEGORY_LEVELS[col]).codes
+
+
+def _record_days(dates: pd.Series, start: np.datetime64) -> np.ndarray:
+    # RecordDate (рядок YYYY-MM-DD або datetime64) → індекс дня від start_date
+    return (np.asarray(dates).astype("datetime64[D]") - start).astype(np.int64)
+
+
+def _lognormal(rng: np.random.Generator, sigma, shape) -> np.ndarray:
+    # Множник із середнім 1; обчислення на місці — без проміжних масивів розміру (n, window)
+    sigma = np.asarray(sigma, dtype=np.float32)
+    x = rng.standard_normal(shape, dtype=np.float32)
+    x *= sigma
+    x -= sigma ** 2 / 2
+    return np.exp(x, out=x)
+
+
+class UsageFeatures:
+    """Генератор K ознак користування для чанків клієнтів.
+
+    generate(df, shard) — float32[len(df), K] з власного потоку випадкових чисел шарду
+    (shard_seed(seed, shard, STREAM_USAGE)), тож результат не залежить від кількості воркерів.
+    """
+
+    def __init__(self, k: int, seed: int = 42, drift: dict = None, start_date: str = "2023-01-01",
+                 end_date: str = "2024-12-31", window_days: int = USAGE_DEFAULTS["window_days"]):
+        if k <= 0:
+            raise ValueError(f"Кількість ознак usage має бути > 0, отримано {k}")
+        self.k = k
+        self.seed = seed
+        self.window = usage_window(k, window_days)
+        self.columns = usage_columns(k, window_days)
+        self.schedule = DriftSchedule(drift, start_date, end_date)
+        self.start = np.datetime64(start_date, "D")
+
+    def generate(self, df: pd.DataFrame, shard: int) -> np.ndarray:
+        rng = np.random.default_rng(shard_seed(self.seed, shard, STREAM_USAGE))
+        n, w = len(df), self.window
+        days = _record_days(df["RecordDate"], self.start)
+        t = self.schedule.lookup(np.maximum(days, 0))
+
+        internet = _codes(df, "InternetService")
+        contract = _codes(df, "Contract")
+        phone = _codes(df, "PhoneService") == 1
+        lines = np.where(_codes(df, "MultipleLines") == 1, 1.6, 1.0).astype(np.float32)
+        streaming = ((_codes(df, "StreamingTV") == 1).astype(np.float32)
+                     + (_codes(df, "StreamingMovies") == 1).astype(np.float32))
+        churn = (_codes(df, "Churn") == 1).astype(np.float32)
+        tenure = np.minimum(df["tenure"].to_numpy(np.float32), 72)
+
+        # Місячні рівні клієнта: індивідуальна активність × послуги × стаж × дрейф
+        activity = _lognormal(rng, 0.35, n) * (0.85 + 0.3 * tenure / 72)
+        data_level = DATA_GB[internet] * (1 + 0.25 * streaming) * t["data_factor"].astype(np.float32) * activity
+        voice_level = np.where(phone, CALL_MINUTES * lines * t["voice_factor"].astype(np.float32) * activity, 0)
+
+        # Денні ряди за вікно, що закінчується в RecordDate: вихідні, згасання перед відтоком, шум
+        d = np.arange(w, dtype=np.float32)
+        weekday = (days[:, None] - (w - 1) + np.arange(w) + 3) % 7            # 1970-01-01 — четвер
+        weekend = weekday >= 5
+        progress = d / max(w - 1, 1)
+        fade = 1 - 0.45 * churn[:, None] * progress
+        sigma = np.where(contract == 0, 0.35, 0.25).astype(np.float32)[:, None]
+        inactive = rng.random((n, w), dtype=np.float32) < 0.03 + 0.25 * churn[:, None] * progress
+        data = (data_level / 30)[:, None] * np.where(weekend, 1.2, 0.93).astype(np.float32) * fade
+        data *= _lognormal(rng, sigma, (n, w))
+        data[inactive] = 0
+        minutes = (voice_level / 30)[:, None] * np.where(weekend, 0.75, 1.1).astype(np.float32) * fade
+        minutes *= _lognormal(rng, sigma, (n, w))
+        minutes[inactive] = 0
+
+        out = np.empty((n, self.k), dtype=np.float32)
+        quarter = max(w // 4, 1)
+        data_mean = data.mean(axis=1)
+        scalars = {
+            "call_minutes":    minutes.mean(axis=1) * 30,
+            "data_gb":         data_mean * 30,
+            "dropped_calls":   rng.poisson(minutes.sum(axis=1) / 100 * (0.6 + 1.4 * churn + 0.4 * (internet == 0))),
+            "sms_count":       rng.poisson(np.where(phone, 40 * activity * t["voice_factor"], 0)),
+            "support_calls":   rng.poisson(0.3 + 1.5 * churn + 0.4 * (contract == 0) + 0.3 * (tenure < 12)),
+            "streaming_hours": rng.gamma(2.0, 1.0, n) * 15 * streaming * t["data_factor"],
+            "data_trend":      (data[:, -quarter:].mean(axis=1) - data[:, :quarter].mean(axis=1))
+                               / np.maximum(data_mean, 1e-3),
+            "active_days":     (~inactive).sum(axis=1),
+        }
+        for j, name in enumerate(self.columns[:len(USAGE_SCALARS)]):
+            out[:, j] = scalars[name]
+        # Денні ряди: data_gb_d00.. потім call_minutes_d00.. (усічено до K колонок)
+        rest = self.k - len(USAGE_SCALARS)
+        if rest > 0:
+            out[:, len(USAGE_SCALARS):len(USAGE_SCALARS) + min(rest, w)] = data[:, :rest]
+            if rest > w:
+                out[:, len(USAGE_SCALARS) + w:] = minutes[:, :rest - w]
+        return out
+
+
+def usage_path(output_dir: str | Path, fmt: str = "npy", name: str = USAGE_FILE) -> Path:
+    return Path(output_dir) / f"{name}.{fmt}"
+
+
+class UsageWriter:
+    """Дописує блоки float32[n, K] у usage_features.npy або .arrow; close() пише usage_features.json.
+
+    .npy пишеться потоково: заголовок фіксованої довжини (USAGE_HEADER_BYTES) перезаписується
+    з фінальною кількістю рядків, тож append=True продовжує наявну матрицю (дозапис). Arrow IPC файл дописати не можна — лише новий запис.
+    """
+
+    def __init__(self, output_dir: str | Path, columns: list, fmt: str = "npy", append: bool = False,
+                 window_days: int = USAGE_DEFAULTS["window_days"], name: str = USAGE_FILE):
+        if fmt not in USAGE_FORMATS:
+            raise ValueError(f"Невідомий формат ознак usage: {fmt!r} (доступні: {', '.join(USAGE_FORMATS)})")
+        if append and fmt != "npy":
+            raise ValueError("Дозапис ознак usage підтримується лише для формату npy")
+        self.path = usage_path(output_dir, fmt, name)
+        self.meta_path = self.path.with_suffix(".json")
+        self.columns = list(columns)
+        self.fmt = fmt
+        self.window_days = window_days
+        self.rows = 0
+        self._writer = None
+        self._header_bytes = USAGE_HEADER_BYTES
+
+        if append:
+            if not self.path.exists():
+                raise FileNotFoundError(f"Немає ознак usage для дозапису: {self.path}")
+            # Файл може бути хардлінком на запис кешу (cache.py) — власна копія перед дозаписом
+            if self.path.stat().st_nlink > 1:
+                _unshare(self.path)
+            self._file = open(self.path, "r+b")
+            if np.lib.format.read_magic(self._file) != (1, 0):
+                raise ValueError(f"{self.path}: очікувався .npy версії 1.0 (UsageWriter)")
+            shape, _, _ = np.lib.format.read_array_header_1_0(self._file)
+            if shape[1:] != (len(self.columns),):
+                raise ValueError(f"{self.path}: {shape[1:]} колонок, очікувалось {len(self.columns)}")
+            self.rows = shape[0]
+            self._header_bytes = self._file.tell()
+            self._file.seek(0, 2)
+            return
+
+        if self.path.exists():
+            self.path.unlink()
+        if fmt == "npy":
+            self._file = open(self.path, "wb")
+            self._write_header()
+        else:
+            pa = _pyarrow()
+            self._schema = pa.schema([pa.field(col, pa.float32()) for col in self.columns])
+            self._writer = pa.ipc.new_file(self.path, self._schema)
+
+    def _write_header(self):
+        # Формат .npy 1.0: magic, довжина словника (uint16 LE), словник, доповнений пробілами до '\n'
+        magic = np.lib.format.magic(1, 0)
+        size = self._header_bytes - len(magic) - 2
+        header = "{'descr': '<f4', 'fortran_order': False, 'shape': %r, }" % ((self.rows, len(self.columns)),)
+        if len(header) >= size:
+            raise ValueError(f"{self.path}: заголовок .npy не вміщується у {self._header_bytes} байт")
+        self._file.seek(0)
+        self._file.write(magic + struct.pack("<H", size) + header.ljust(size - 1).encode("latin1") + b"\n")
+
+    def write(self, block: np.ndarray):
+        block = np.asarray(block, dtype="<f4")
+        self.rows += len(block)
+        if self.fmt == "npy":
+            self._file.write(np.ascontiguousarray(block).data)
+            return
+        pa = _pyarrow()
+        columns = np.asfortranarray(block)                   # колонки суцільні → pa.array без копії
+        self._writer.write_batch(pa.record_batch([pa.array(columns[:, j]) for j in range(len(self.columns))],
+                                                 schema=self._schema))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self.fmt == "npy" and not self._file.closed:
+            end = self._file.tell()
+            self._write_header()
+            self._file.seek(end)
+            self._file.close()
+        meta = {"format": self.fmt, "rows": self.rows, "dtype": "float32", "window_days": self.window_days,
+                "columns": self.columns}
+        self.meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_usage(path: str | Path):
+    """Ознаки без копіювання: .npy → np.memmap float32[n, K]; .arrow → pyarrow.Table з memory map."""
+    path = Path(path)
+    if path.suffix == ".npy":
+        return np.load(path, mmap_mode="r")
+    pa = _pyarrow()
+    return pa.ipc.open_file(pa.memory_map(str(path))).read_all()
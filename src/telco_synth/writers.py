@@ -0,0 +1,278 @@
+import os
+import queue
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .schema import CATEGORY_LEVELS, COMPACT_DTYPES, DATE_COLUMNS
+
+FORMATS = ("csv", "parquet", "arrow")
+
+SUFFIXES = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}
+
+PARTITION_COLUMN = "RecordMonth"
+
+# Стиснення: CSV — потік gzip-членів / zstd-фреймів (.csv.gz / .csv.zst), parquet — кодек колонок,
+# arrow IPC — стиснення буферів (лише zstd: gzip у форматі IPC не передбачено)
+COMPRESSIONS = ("gzip", "zstd")
+
+COMPRESSED_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+# CSV стискається блоками: кожен блок — окремий gzip-член / zstd-фрейм, тож блоки одного чанку
+# стискаються паралельно в пулі потоків (кодеки pyarrow відпускають GIL), а конкатенація
+# членів / фреймів — валідний .gz / .zst. Межі блоків залежать лише від чанків, не від потоків.
+COMPRESSION_BLOCK_BYTES = 1 << 20
+
+# Рівні для CSV за замовчуванням: gzip як у утиліти gzip (кодек pyarrow за замовчуванням — 9, утричі повільніше)
+DEFAULT_COMPRESSION_LEVELS = {"gzip": 6}
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Для --format parquet/arrow потрібен pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+def output_path(path: str | Path, fmt: str = "csv", partition_by_month: bool = False,
+                compression: str = None) -> Path:
+    """Шлях артефакту для формату: суфікс .csv/.parquet/.arrow (.csv.gz/.csv.zst) або директорія для партицій."""
+    path = Path(path)
+    if partition_by_month:
+        return path.with_suffix("")
+    if fmt == "csv" and compression:
+        return path.with_suffix(SUFFIXES[fmt] + COMPRESSED_SUFFIXES[compression])
+    return path.with_suffix(SUFFIXES[fmt])
+
+
+def arrow_schema(columns: list):
+    """Arrow-схема: словникове кодування для категорій, компактні числа, date32 для дат."""
+    pa = _pyarrow()
+    fields = []
+    for col in columns:
+        if col in CATEGORY_LEVELS:
+            typ = pa.dictionary(pa.int8(), pa.string())
+        elif col in COMPACT_DTYPES:
+            typ = pa.from_numpy_dtype(np.dtype(COMPACT_DTYPES[col]))
+        elif col in DATE_COLUMNS:
+            typ = pa.date32()
+        else:
+            typ = pa.string()
+        fields.append(pa.field(col, typ))
+    return pa.schema(fields)
+
+
+def to_arrow_table(df: pd.DataFrame, schema):
+    pa = _pyarrow()
+    arrays = []
+    for field in schema:
+        col = df[field.name]
+        if field.name in CATEGORY_LEVELS:
+            levels = CATEGORY_LEVELS[field.name]
+            codes = pd.Categorical(col, categories=levels).codes.astype(np.int8)
+            arrays.append(pa.DictionaryArray.from_arrays(codes, pa.array(levels, pa.string())))
+        elif field.name in DATE_COLUMNS:
+            days = pd.to_datetime(col, format="%Y-%m-%d").to_numpy("datetime64[D]")
+            arrays.append(pa.array(days, pa.date32()))
+        elif field.name in COMPACT_DTYPES:
+            arrays.append(pa.array(col.to_numpy(COMPACT_DTYPES[field.name])))
+        else:
+            arrays.append(pa.array(col.to_numpy(object), pa.string()))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+class BlockCompressor:
+    """gzip / zstd (кодеки pyarrow) для потоку байтів CSV: блоки по COMPRESSION_BLOCK_BYTES
+    стискаються паралельно в threads потоків; результат — байти в порядку блоків."""
+
+    def __init__(self, compression: str, level: int = None, threads: int = None):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Невідоме стиснення: {compression!r} (доступні: {', '.join(COMPRESSIONS)})")
+        level = level if level is not None else DEFAULT_COMPRESSION_LEVELS.get(compression)
+        self.codec = _pyarrow().Codec(compression, compression_level=level)
+        self.threads = threads or os.cpu_count() or 1
+        self._pool = ThreadPoolExecutor(self.threads) if self.threads > 1 else None
+
+    def _compress(self, block: memoryview) -> bytes:
+        return self.codec.compress(block, asbytes=True)
+
+    def compress(self, data: bytes) -> bytes:
+        view = memoryview(data)
+        blocks = [view[i:i + COMPRESSION_BLOCK_BYTES] for i in range(0, len(view), COMPRESSION_BLOCK_BYTES)]
+        if self._pool is None or len(blocks) == 1:
+            return b"".join(map(self._compress, blocks))
+        return b"".join(self._pool.map(self._compress, blocks))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+def _unshare(path: Path):
+    tmp = path.with_name(f".{path.name}.tmp")
+    shutil.copy2(path, tmp)
+    tmp.replace(path)
+
+
+class ChunkWriter:
+    """Потоковий запис DataFrame-чанків у CSV, Parquet або Arrow IPC.
+
+    partition_by_month=True пише hive-партиції RecordMonth=YYYY-MM/ (лише parquet/arrow),
+    тож downstream-задачі можуть читати один місяць через фільтр по партиції.
+    append=True дописує до наявного артефакту (CSV або партиційований датасет) замість
+    перезапису; segment розрізняє імена part-файлів різних дозаписів.
+
+    compression ("gzip" / "zstd") стискає CSV блоками в compression_threads потоків
+    (BlockCompressor), parquet — кодеком колонок, arrow IPC — zstd-буферами.
+    queue_size > 0 переносить форматування, стиснення й запис у фоновий потік: write() лише
+    кладе чанк в обмежену чергу (і чекає, якщо вона повна), тож генерація наступного чанку
+    перекривається із записом попереднього, а повільний диск гальмує лише коли черга заповнена.
+    Порядок чанків і байти артефакту ті самі, що й без черги. Чанк після write() не змінюється
+    на місці; помилка фонового запису піднімається з наступного write() або close().
+    """
+
+    def __init__(self, path: str | Path, columns: list, fmt: str = "csv",
+                 partition_by_month: bool = False, append: bool = False, segment: int = 0,
+                 compression: str = None, compression_level: int = None, compression_threads: int = None,
+                 queue_size: int = 0):
+        if fmt not in FORMATS:
+            raise ValueError(f"Невідомий формат: {fmt!r} (доступні: {', '.join(FORMATS)})")
+        if partition_by_month and fmt == "csv":
+            raise ValueError("Партиціювання за місяцем підтримується лише для parquet/arrow")
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f"Невідоме стиснення: {compression!r} (доступні: {', '.join(COMPRESSIONS)})")
+        if compression == "gzip" and fmt == "arrow":
+            raise ValueError("Arrow IPC підтримує лише стиснення zstd")
+        self.fmt = fmt
+        self.columns = columns
+        self.partition_by_month = partition_by_month
+        self.compression = compression
+        self.path = output_path(path, fmt, partition_by_month, compression)
+        self.segment = segment
+        self.rows = 0
+        self._parts = 0
+        self._writer = None
+        self._file = None
+        self._compressor = None
+        self._queue = None
+        self._error = None
+        self._failed = False
+
+        if append and not self.path.exists():
+            raise FileNotFoundError(f"Немає артефакту для дозапису: {self.path}")
+        if append and fmt != "csv" and not partition_by_month:
+            raise ValueError("Дозапис у parquet/arrow підтримується лише з партиціюванням за місяцем")
+        # Артефакт може бути хардлінком на запис кешу (cache.py): новий файл замість
+        # перезапису на місці, а перед дозаписом — власна копія
+        if self.path.is_file():
+            if not append:
+                self.path.unlink()
+            elif self.path.stat().st_nlink > 1:
+                _unshare(self.path)
+
+        if fmt == "csv":
+            if compression:
+                self._compressor = BlockCompressor(compression, compression_level, compression_threads)
+            self._file = open(self.path, "ab" if append else "wb")
+            if not append:
+                self._write_bytes(pd.DataFrame(columns=columns).to_csv(index=False).encode("utf-8"))
+        else:
+            self.schema = arrow_schema(columns)
+            self._codec = {"compression": compression or "snappy", "compression_level": compression_level} \
+                if fmt == "parquet" else {"compression": compression}
+            if partition_by_month:
+                if not append:
+                    if self.path.is_dir():
+                        shutil.rmtree(self.path)
+                    self.path.mkdir(parents=True)
+            elif fmt == "parquet":
+                import pyarrow.parquet as pq
+                self._writer = pq.ParquetWriter(self.path, self.schema, **self._codec)
+            else:
+                pa = _pyarrow()
+                self._writer = pa.ipc.new_file(self.path, self.schema, options=pa.ipc.IpcWriteOptions(**self._codec))
+
+        if queue_size > 0:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._thread = threading.Thread(target=self._drain, name=f"writer-{self.path.name}", daemon=True)
+            self._thread.start()
+
+    def write(self, df: pd.DataFrame):
+        self.rows += len(df)
+        if self._queue is None:
+            self._write(df)
+            return
+        self._raise()
+        self._queue.put(df)
+
+    def _drain(self):
+        # Фоновий потік: чанки по черзі; після помилки черга лише спорожнюється, щоб write() не завис
+        while (df := self._queue.get()) is not None:
+            if not self._failed:
+                try:
+                    self._write(df)
+                except BaseException as e:  # noqa: BLE001 — передається в основний потік
+                    self._error, self._failed = e, True
+
+    def _raise(self):
+        # Помилка фонового запису піднімається в основному потоці один раз
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _write_bytes(self, data: bytes):
+        self._file.write(self._compressor.compress(data) if self._compressor is not None else data)
+
+    def _write(self, df: pd.DataFrame):
+        if self.fmt == "csv":
+            self._write_bytes(df.to_csv(columns=self.columns, index=False, header=False).encode("utf-8"))
+            return
+
+        table = to_arrow_table(df, self.schema)
+        if not self.partition_by_month:
+            self._writer.write_table(table)
+            return
+
+        import pyarrow.compute as pc
+        import pyarrow.dataset as ds
+        pa = _pyarrow()
+        month = pc.strftime(table["RecordDate"], format="%Y-%m")
+        table = table.append_column(PARTITION_COLUMN, month)
+        file_format = ds.ParquetFileFormat() if self.fmt == "parquet" else ds.IpcFileFormat()
+        ds.write_dataset(
+            table, self.path,
+            format=file_format,
+            file_options=file_format.make_write_options(**self._codec),
+            partitioning=ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.string())]), flavor="hive"),
+            basename_template=f"part-{self.segment:03d}-{self._parts:05d}-{{i}}{SUFFIXES[self.fmt]}",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        self._parts += 1
+
+    def close(self):
+        if self._queue is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._queue = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._compressor is not None:
+            self._compressor.close()
+            self._compressor = None
+        self._raise()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,14 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Пакет telco_synth не встановлюється (див. README): тести імпортують його з src/
+sys.path.insert(0, str(ROOT / "src"))
+
+
+@pytest.fixture
+def config():
+    return {"generation": {"samples": 3000, "start_date": "2023-01-01", "end_date": "2024-12-31", "seed": 7}}
@@ -0,0 +1,41 @@
+import pytest
+
+from telco_synth.customer_index import CustomerIndex, build_customer_index
+from telco_synth.schema import CUSTOMER_COLUMNS
+from telco_synth.tabular import generate_tabular_data
+from telco_synth.writers import ChunkWriter
+
+
+@pytest.fixture(params=["csv", "parquet"])
+def customers(request, tmp_path, config):
+    if request.param != "csv":
+        pytest.importorskip("pyarrow")
+    df = generate_tabular_data(config, engine="numpy")
+    with ChunkWriter(tmp_path / "telco_customers", CUSTOMER_COLUMNS, request.param) as writer:
+        for offset in range(0, len(df), 1000):
+            writer.write(df.iloc[offset:offset + 1000])
+    build_customer_index(writer.path)
+    return df, CustomerIndex(writer.path)
+
+
+def test_hits_and_lookup_order(customers):
+    df, ix = customers
+    ids = df["customerID"].iloc[[2500, 3, 1777]].tolist()
+    assert len(ix) == len(df)
+    assert all(customer_id in ix for customer_id in ids)
+    rows = ix.lookup(ids)
+    assert rows["customerID"].tolist() == ids
+    assert rows["tenure"].tolist() == df["tenure"].iloc[[2500, 3, 1777]].tolist()
+
+
+def test_misses_for_absent_and_malformed_ids(customers):
+    df, ix = customers
+    good = df["customerID"].iloc[5]
+    malformed = [good[:-1] + good[-1].lower(), good + "X", good[:-1], good.replace("-", "_"), "abc", ""]
+    absent = next(f"{d}-ZZZZZ" for d in range(1000, 10000) if f"{d}-ZZZZZ" not in set(df["customerID"]))
+    for customer_id in malformed + [absent]:
+        assert customer_id not in ix
+    found, _ = ix.locate(malformed + [absent, good])
+    assert found.tolist() == [False] * (len(malformed) + 1) + [True]
+    assert ix.lookup(malformed + [good])["customerID"].tolist() == [good]
+    assert len(ix.lookup(malformed)) == 0
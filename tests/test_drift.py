@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from telco_synth.drift import DriftSchedule
+from telco_synth.tabular import ENGINES, generate_tabular_data
+
+# Круті криві: без обрізання ваги інтернету й оплати стають від'ємними
+STEEP = {"dsl_decline_rate": 2.0, "no_internet_decline": 3.0,
+         "curves": {"payment": {"type": "piecewise", "points": [[0, 0], [1, -10]]}}}
+
+# Ваги категорій (echeck_prob — теж вага для random.choices) нормуються при виборі, тож лише ≥ 0
+WEIGHTS = ("dsl_prob", "fiber_prob", "no_inet_prob", "echeck_prob", "bank_weight", "credit_weight", "join_factor")
+PROBABILITIES = ("m2m_prob", "senior_prob", "partner_prob", "dependents_prob", "multi_prob",
+                 "paperless_prob")
+
+
+def test_compiled_weights_and_probabilities_are_valid():
+    # n_days за межами періоду: криві продовжуються після end_date
+    table = DriftSchedule(STEEP, "2023-01-01", "2024-12-31").table(2000)
+    for name in WEIGHTS:
+        assert table[name].min() >= 0, name
+    for name in PROBABILITIES:
+        assert 0 <= table[name].min() and table[name].max() <= 1, name
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engines_run_with_steep_drift(config, engine):
+    df = generate_tabular_data({**config, "drift": STEEP}, engine=engine)
+    assert len(df) == config["generation"]["samples"]
+    late = df[df["RecordDate"] >= "2024-07-01"]
+    assert (late["InternetService"] != "DSL").all()
+    assert set(late["PaymentMethod"]) <= {"Electronic check", "Mailed check"}
+
+
+def test_lookup_matches_table():
+    schedule = DriftSchedule({}, "2023-01-01", "2024-12-31")
+    days = np.array([0, 364, 729])
+    t = schedule.lookup(days)
+    np.testing.assert_array_equal(t["fiber_prob"], schedule.table()["fiber_prob"][days])
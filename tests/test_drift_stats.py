@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from telco_synth.drift_stats import DriftProfile
+from telco_synth.tabular import generate_tabular_data
+
+
+@pytest.fixture
+def profile(config):
+    profile = DriftProfile()
+    for engine in ("numpy", "python"):
+        profile.update(generate_tabular_data(config, engine=engine))
+    return profile
+
+
+@pytest.mark.parametrize("suffix", [".json", ".parquet"])
+def test_profile_load_round_trip(tmp_path, profile, suffix):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    path = profile.write(tmp_path / f"drift_profile{suffix}")
+    loaded = DriftProfile.load(path)
+    assert loaded.months == profile.months
+    assert json.dumps(loaded.report(), sort_keys=True) == json.dumps(profile.report(), sort_keys=True)
+
+
+def test_loaded_profile_keeps_accumulating(tmp_path, config, profile):
+    # Дозапис (--append-from): профіль відновлюється з файлу і оновлюється новими чанками
+    loaded = DriftProfile.load(profile.write(tmp_path / "drift_profile.json"))
+    extra = generate_tabular_data(config, engine="numpy")
+    loaded.update(extra)
+    profile.update(extra)
+    assert json.dumps(loaded.report(), sort_keys=True) == json.dumps(profile.report(), sort_keys=True)
@@ -0,0 +1,27 @@
+import numpy as np
+
+from telco_synth.ids import ID_SPACE, customer_ids, customer_rows, decode, encode, is_valid
+
+
+def test_encode_decode_round_trip():
+    values = np.concatenate([[0, 1, ID_SPACE - 1],
+                             np.random.default_rng(0).integers(0, ID_SPACE, 10_000)]).astype(np.uint64)
+    ids = encode(values)
+    assert is_valid(ids).all()
+    np.testing.assert_array_equal(decode(ids), values)
+
+
+def test_customer_ids_are_unique_and_invertible():
+    rows = np.arange(50_000)
+    ids = customer_ids(rows, seed=3)
+    assert len(set(ids)) == len(rows)
+    np.testing.assert_array_equal(customer_rows(ids, seed=3), rows)
+    assert not np.array_equal(customer_ids(rows[:100], seed=4), ids[:100])
+
+
+def test_is_valid_rejects_malformed_ids():
+    good = customer_ids([5])[0]
+    bad = [good[:-1] + good[-1].lower(), good + "X", good[:-1], good.replace("-", "_"),
+           "0999-AAAAA", "abc", "", None, 42]
+    assert is_valid([good]).tolist() == [True]
+    assert not is_valid(bad).any()
@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+
+from telco_synth.serve import SERVE_BLOCK, RecordFeed, StreamServer
+
+
+def _drain(config: dict, sizes: list) -> tuple[pd.DataFrame, pd.DataFrame]:
+    feed = RecordFeed(config, rate=5000, speedup=86400, until="2023-01-01")
+    customers, conversations = [], []
+    i = 0
+    while not feed.done:
+        batch_customers, batch_conversations = feed.next_batch(sizes[i % len(sizes)])
+        customers.append(batch_customers)
+        conversations.append(batch_conversations)
+        i += 1
+    return pd.concat(customers, ignore_index=True), pd.concat(conversations, ignore_index=True)
+
+
+@pytest.fixture
+def serve_config(config):
+    return {**config, "generation": {**config["generation"], "conv_samples": 450},
+            "knowledge_base": {"enabled": False}}
+
+
+def test_stream_does_not_depend_on_batching(serve_config):
+    customers, conversations = _drain(serve_config, [20])
+    assert len(customers) > SERVE_BLOCK
+    assert len(conversations) == int(450 / 3000 * len(customers))
+    for sizes in ([10, 10], [777, 3, SERVE_BLOCK + 1]):
+        other_customers, other_conversations = _drain(serve_config, sizes)
+        pd.testing.assert_frame_equal(customers, other_customers)
+        pd.testing.assert_frame_equal(conversations, other_conversations)
+
+
+async def _get(server: StreamServer, target: str) -> tuple[int, dict]:
+    listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+    async with listener:
+        reader, writer = await asyncio.open_connection(*listener.sockets[0].getsockname()[:2])
+        writer.write(f"GET {target} HTTP/1.1\r\nHost: test\r\n\r\n".encode("latin-1"))
+        response = await reader.read()
+        writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+@pytest.mark.parametrize("limit", ["abc", "-3", "1.5", "\u00b2"])
+def test_invalid_limit_is_400(serve_config, limit):
+    server = StreamServer(RecordFeed(serve_config, rate=5000, speedup=86400))
+    status, body = asyncio.run(_get(server, f"/stream?limit={limit}"))
+    assert status == 400
+    assert body == {"error": "limit: non-negative integer"}
+    assert not server.clients
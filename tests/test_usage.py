@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from telco_synth.usage import USAGE_HEADER_BYTES, UsageWriter, load_usage
+
+COLUMNS = [f"f{i:03d}" for i in range(40)]
+
+
+def _blocks(rows: int):
+    return np.random.default_rng(1).random((rows, len(COLUMNS)), dtype=np.float32)
+
+
+def test_npy_round_trip_with_append(tmp_path):
+    data = _blocks(1000)
+    with UsageWriter(tmp_path, COLUMNS) as writer:
+        writer.write(data[:300])
+        writer.write(data[300:600])
+    with UsageWriter(tmp_path, COLUMNS, append=True) as writer:
+        writer.write(data[600:])
+
+    loaded = load_usage(writer.path)
+    assert loaded.dtype == np.float32
+    np.testing.assert_array_equal(loaded, data)
+    np.testing.assert_array_equal(np.load(writer.path), data)
+    assert writer.path.stat().st_size == USAGE_HEADER_BYTES + data.nbytes
+
+
+def test_npy_header_fits_any_row_count(tmp_path):
+    writer = UsageWriter(tmp_path, COLUMNS)
+    writer.rows = 2**64 - 1
+    writer.close()
+    with open(writer.path, "rb") as f:
+        assert np.lib.format.read_magic(f) == (1, 0)
+        shape, _, _ = np.lib.format.read_array_header_1_0(f)
+        assert shape == (2**64 - 1, len(COLUMNS))
+        assert f.tell() == USAGE_HEADER_BYTES
+
+
+def test_append_rejects_other_width(tmp_path):
+    with UsageWriter(tmp_path, COLUMNS) as writer:
+        writer.write(_blocks(10))
+    with pytest.raises(ValueError):
+        UsageWriter(tmp_path, COLUMNS[:-1], append=True)
+
+
+def test_arrow_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+    data = _blocks(500)
+    with UsageWriter(tmp_path, COLUMNS, fmt="arrow") as writer:
+        writer.write(data[:200])
+        writer.write(data[200:])
+    table = load_usage(writer.path)
+    assert table.column_names == COLUMNS
+    np.testing.assert_array_equal(np.column_stack([table[col].to_numpy() for col in COLUMNS]), data)
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import pytest
+
+from telco_synth.base import generate_telco_dataset_with_drift
+from telco_synth.cli import main
+from telco_synth.tabular import ENGINES
+
+CONFIG = Path(__file__).resolve().parents[1] / "config" / "config.yaml"
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_ext_output_does_not_depend_on_workers(tmp_path, engine):
+    for workers in (1, 3):
+        main(["--config", str(CONFIG), "--no-cache", "--engine", engine,
+              "--samples", "3000", "--conv-samples", "300", "--chunk-size", "1000", "--workers", str(workers),
+              "--output-dir", str(tmp_path / f"w{workers}")])
+    for name in ("telco_customers.csv", "support_conversations.csv"):
+        assert (tmp_path / "w1" / name).read_bytes() == (tmp_path / "w3" / name).read_bytes()
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_base_output_does_not_depend_on_workers(tmp_path, engine):
+    for workers in (1, 2):
+        generate_telco_dataset_with_drift(2500, output_file=str(tmp_path / f"w{workers}.csv"), engine=engine,
+                                          chunk_size=1000, workers=workers)
+    assert (tmp_path / "w1.csv").read_bytes() == (tmp_path / "w2.csv").read_bytes()